@@ -0,0 +1,301 @@
+"""
+Benchmarks of StyleFrame's export and styling APIs.
+
+Measures the wall time and the peak memory of ``to_excel`` (with pandas' ExcelWriter, with a NativeExcelWriter and
+with ``streaming=True``), ``apply_style_by_indexes``, ``apply_column_style`` and ``style_alternate_rows`` over a
+sweep of rows counts, columns counts, numbers of distinct styles, datetime columns and comments and hyperlinks
+densities. The data is generated, so the benchmarks run offline.
+
+Usage examples (from the repository's root):
+
+.. code-block:: bash
+
+    # run all the cases of up to 100,000 rows
+    python benchmarks/run_benchmarks.py
+
+    # store the results as the baseline of the next runs
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+
+    # compare against the baseline, exiting with status 1 if any case is more than 20% slower or bigger
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --tolerance 0.2
+
+    # include the 1,000,000 rows cases, only for to_excel
+    python benchmarks/run_benchmarks.py --max-rows 1000000 --api to_excel
+
+The wall time is the fastest of ``--repeat`` runs. The peak memory is measured in a separate run with
+:mod:`tracemalloc` (which slows the run down), and counts the memory allocated by Python and numpy during the run.
+
+``benchmarks/baseline.json`` holds the results of the cases of up to 10,000 rows (``--max-rows 10000``) and the
+environment they were measured in. Wall times depend on the machine, so on another machine save a baseline of the
+code before a change and compare the changed code to it, with the same ``--max-rows``.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from io import BytesIO
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+# benchmark the styleframe of this checkout rather than an installed one
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from styleframe import NativeExcelWriter, StyleFrame, Styler, utils
+from styleframe.version import _version_
+
+ROWS = (1_000, 10_000, 100_000, 1_000_000)
+# the parameters of the variations sweep, each one is varied in turn while the others keep their default value
+DEFAULT_PARAMS = {'columns': 10, 'styles': 4, 'datetime_columns': 0, 'comments': 0.0, 'hyperlinks': 0.0}
+VARIATIONS_ROWS = 10_000
+VARIATIONS = {
+    'columns': (2, 50),
+    'styles': (1, 100),
+    'datetime_columns': (5, 10),
+    'comments': (0.01, 0.1),
+    'hyperlinks': (0.01, 0.1),
+}
+# the parameters that only affect the export
+EXPORT_PARAMS = ('datetime_columns', 'comments', 'hyperlinks')
+# increases smaller than these are noise and are not reported as regressions, whatever their percentage
+MIN_REGRESSIONS = {'wall_time': 0.01, 'peak_memory': 1.0}
+
+
+class Case(NamedTuple):
+    api: str
+    rows: int
+    columns: int
+    styles: int
+    datetime_columns: int
+    comments: float
+    hyperlinks: float
+
+    @property
+    def key(self) -> str:
+        return '{}[rows={}, columns={}, styles={}, datetime_columns={}, comments={}, hyperlinks={}]'.format(*self)
+
+
+def make_dataframe(case: Case) -> pd.DataFrame:
+    """Generates the case's data: datetime columns first, then alternating text and numbers columns."""
+
+    rng = np.random.default_rng(0)
+    data = {}
+    for col_index in range(case.columns):
+        if col_index < case.datetime_columns:
+            data['date_{}'.format(col_index)] = pd.date_range('2000-01-01', periods=case.rows, freq='min')
+        elif col_index % 2:
+            data['number_{}'.format(col_index)] = rng.random(case.rows) * 1000
+        else:
+            data['text_{}'.format(col_index)] = 'value ' + pd.Series(rng.integers(0, 10_000, case.rows)).astype(str)
+    df = pd.DataFrame(data)
+
+    if case.hyperlinks:
+        text_columns = [column for column in df.columns if column.startswith('text_')]
+        for column in text_columns:
+            mask = rng.random(case.rows) < case.hyperlinks
+            df.loc[mask, column] = '=HYPERLINK("https://example.com/{}", "link")'.format(column)
+    return df
+
+
+def make_styles(count: int) -> List[Styler]:
+    colors = [utils.colors.yellow, utils.colors.blue, utils.colors.green, utils.colors.red, utils.colors.grey]
+    return [Styler(bg_color=colors[i % len(colors)], font_size=10 + i // len(colors), bold=bool(i % 2))
+            for i in range(count)]
+
+
+def styles_rows(case: Case) -> Iterator[List[int]]:
+    """The rows each of the case's distinct styles is applied to: every ``styles``-th row."""
+
+    for style_index in range(case.styles):
+        yield list(range(style_index, case.rows, case.styles))
+
+
+def make_style_frame(case: Case) -> StyleFrame:
+    """Creates the case's StyleFrame, with its distinct styles and comments applied."""
+
+    sf = StyleFrame(make_dataframe(case))
+    for style, rows in zip(make_styles(case.styles), styles_rows(case)):
+        sf.apply_style_by_indexes(rows, style)
+    if case.comments:
+        rng = np.random.default_rng(1)
+        commented_rows = np.flatnonzero(rng.random(case.rows) < case.comments).tolist()
+        if commented_rows:
+            sf.apply_style_by_indexes(commented_rows, Styler(comment_author='benchmark', comment_text='comment'),
+                                      cols_to_style=sf.columns[0].value)
+    return sf
+
+
+def bench_to_excel(case: Case) -> Callable[[], Any]:
+    sf = make_style_frame(case)
+    return lambda: sf.to_excel(BytesIO()).close()
+
+
+def bench_to_excel_native(case: Case) -> Callable[[], Any]:
+    sf = make_style_frame(case)
+    return lambda: sf.to_excel(NativeExcelWriter(BytesIO())).close()
+
+
+def bench_to_excel_streaming(case: Case) -> Callable[[], Any]:
+    sf = make_style_frame(case)
+    return lambda: sf.to_excel(BytesIO(), streaming=True).close()
+
+
+def bench_apply_style_by_indexes(case: Case) -> Callable[[], Any]:
+    sf = StyleFrame(make_dataframe(case))
+    styles_and_rows = list(zip(make_styles(case.styles), styles_rows(case)))
+
+    def run():
+        for style, rows in styles_and_rows:
+            sf.apply_style_by_indexes(rows, style)
+
+    return run
+
+
+def bench_apply_column_style(case: Case) -> Callable[[], Any]:
+    sf = StyleFrame(make_dataframe(case))
+    styles = make_styles(case.styles)
+    columns = [column.value for column in sf.columns]
+
+    def run():
+        for col_index, column in enumerate(columns):
+            sf.apply_column_style(column, styles[col_index % len(styles)])
+
+    return run
+
+
+def bench_style_alternate_rows(case: Case) -> Callable[[], Any]:
+    sf = StyleFrame(make_dataframe(case))
+    styles = make_styles(case.styles)
+    return lambda: sf.style_alternate_rows(styles)
+
+
+# api name -> function that prepares the case (untimed) and returns the function to time
+BENCHMARKS: Dict[str, Callable[[Case], Callable[[], Any]]] = {
+    'to_excel': bench_to_excel,
+    'to_excel_native': bench_to_excel_native,
+    'to_excel_streaming': bench_to_excel_streaming,
+    'apply_style_by_indexes': bench_apply_style_by_indexes,
+    'apply_column_style': bench_apply_column_style,
+    'style_alternate_rows': bench_style_alternate_rows,
+}
+
+
+def get_cases(apis: List[str], max_rows: int) -> List[Case]:
+    cases = []
+    for api in apis:
+        for rows in ROWS:
+            if rows <= max_rows:
+                cases.append(Case(api, rows, **DEFAULT_PARAMS))
+        if VARIATIONS_ROWS > max_rows:
+            continue
+        for param, values in VARIATIONS.items():
+            if param in EXPORT_PARAMS and not api.startswith('to_excel'):
+                continue
+            for value in values:
+                cases.append(Case(api, VARIATIONS_ROWS, **dict(DEFAULT_PARAMS, **{param: value})))
+    return cases
+
+
+def measure(case: Case, repeat: int) -> Dict[str, float]:
+    """Returns the case's fastest wall time (in seconds) out of repeat runs and its peak memory (in MiB)."""
+
+    wall_times = []
+    for _ in range(repeat):
+        run = BENCHMARKS[case.api](case)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        wall_times.append(time.perf_counter() - start)
+        del run
+
+    run = BENCHMARKS[case.api](case)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {'wall_time': min(wall_times), 'peak_memory': peak_memory / 2 ** 20}
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    """Returns a description of every measurement that exceeds its baseline by more than tolerance."""
+
+    regressions = []
+    for key, measurements in results.items():
+        baseline_measurements = baseline.get(key)
+        if baseline_measurements is None:
+            continue
+        for metric, value in measurements.items():
+            baseline_value = baseline_measurements.get(metric)
+            if (baseline_value and value > baseline_value * (1 + tolerance)
+                    and value - baseline_value > MIN_REGRESSIONS[metric]):
+                regressions.append('{} {}: {:.4g} vs baseline {:.4g} (+{:.0%})'.format(
+                    key, metric, value, baseline_value, value / baseline_value - 1))
+    return regressions
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Benchmarks of StyleFrame\'s export and styling APIs')
+    parser.add_argument('--api', action='append', choices=list(BENCHMARKS),
+                        help='Only run the benchmarks of this API. May be given several times')
+    parser.add_argument('--max-rows', type=int, default=100_000,
+                        help='Skip the cases with more rows than this (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='The number of timed runs of each case, the fastest is kept (default: %(default)s)')
+    parser.add_argument('--output', help='Write the results to this JSON file')
+    parser.add_argument('--save-baseline', metavar='PATH', help='Write the results to this baseline JSON file')
+    parser.add_argument('--baseline', metavar='PATH', help='Compare the results to this baseline JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='The allowed slowdown (and memory growth) relative to the baseline (default: %(default)s)')
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    args = parse_args(args)
+    if args.repeat < 1:
+        raise ValueError('--repeat must be a positive integer, got {}'.format(args.repeat))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+
+    results = {}
+    for case in get_cases(args.api or list(BENCHMARKS), args.max_rows):
+        results[case.key] = measurements = measure(case, args.repeat)
+        print('{:<110} {:>10.3f} s {:>10.1f} MiB'.format(case.key, measurements['wall_time'],
+                                                          measurements['peak_memory']), flush=True)
+
+    report = {
+        'environment': {'styleframe': _version_, 'pandas': pd.__version__, 'numpy': np.__version__,
+                        'python': platform.python_version(), 'machine': platform.platform()},
+        'results': results,
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print('\n{} regressions:'.format(len(regressions)))
+            for regression in regressions:
+                print(regression)
+            return 1
+        print('\nNo regressions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
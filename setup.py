@@ -84,7 +84,7 @@ setup(
     # requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=[
-        'openpyxl>=2.5,<4',
+        'openpyxl>=3.1,<4',
         'colour>=0.1.5,<0.2',
         'jsonschema',
         'pandas<3',
@@ -3,9 +3,12 @@ import sys
 from pandas import DataFrame
 
 from .container import Container
+from .instrumentation import PhaseTiming
+from .native_writer import NativeExcelWriter
 from .series import Series
 from .style_frame import StyleFrame
 from .styler import Styler
+from .template import CompiledTemplate
 from .command_line.commandline import CommandLineInterface
 from .version import _version_, _versions_, _openpyxl_version_, _pandas_version_, _python_version_
 
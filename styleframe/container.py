@@ -1,9 +1,11 @@
 import datetime as dt
 import pandas as pd
 
+from typing import Callable, Dict, Optional
+
 from . import utils
 
-from styleframe.styler import Styler
+from styleframe.styler import FrozenStyler, Styler
 
 try:
     pd_timestamp = pd.Timestamp
@@ -11,24 +13,94 @@ except AttributeError:
     pd_timestamp = pd.tslib.Timestamp
 
 
+class LazyStyle:
+    """
+    .. versionadded:: 4.3
+
+    A style that is only created when it is first used, then kept. A single lazy style may be shared by many
+    containers (see :meth:`Container._set_lazy_style`), in which case all of them get the very same style object.
+
+    :param factory: A callable that creates the style
+    """
+
+    __slots__ = ('_factory', '_style')
+
+    def __init__(self, factory: Callable[[], Styler]):
+        self._factory = factory
+        self._style = None
+
+    def resolve(self) -> Styler:
+        factory = self._factory
+        if factory is not None:
+            self._style = factory()
+            self._factory = None
+        return self._style
+
+
 class Container:
     """
     A container class used to store value and style pairs.
     Value can be any datatype, and style is a Styler object
     """
+    # number format (None for no specific format) -> the interned style given by default to values needing it
+    _default_styles: Dict[Optional[str], FrozenStyler] = {}
+
     def __init__(self, value, styler=None):
-        self.value = value
         if styler is None:
-            if isinstance(self.value, pd_timestamp):
-                self.style = Styler(number_format=utils.number_formats.default_date_time_format)
-            elif isinstance(self.value, dt.date):
-                self.style = Styler(number_format=utils.number_formats.default_date_format)
-            elif isinstance(self.value, dt.time):
-                self.style = Styler(number_format=utils.number_formats.default_time_format)
+            if not isinstance(value, (dt.date, dt.time)):
+                styler = self._get_default_style(None)
+            elif isinstance(value, pd_timestamp):
+                styler = self._get_default_style(utils.number_formats.default_date_time_format)
+            elif isinstance(value, dt.date):
+                styler = self._get_default_style(utils.number_formats.default_date_format)
             else:
-                self.style = Styler()
-        else:
-            self.style = styler
+                styler = self._get_default_style(utils.number_formats.default_time_format)
+        # bypassing __setattr__, a new container has no lazy style to replace
+        attributes = self.__dict__
+        attributes['value'] = value
+        attributes['style'] = styler
+
+    @classmethod
+    def _get_default_style(cls, number_format: Optional[str]) -> FrozenStyler:
+        """Returns the default style of values with the given number format. Default styles are interned, so all
+        the containers created without a style share them until they are restyled."""
+
+        try:
+            return cls._default_styles[number_format]
+        except KeyError:
+            style = Styler() if number_format is None else Styler(number_format=number_format)
+            style = cls._default_styles[number_format] = style.intern()
+            return style
+
+    def __getattr__(self, attr):
+        # only called for missing attributes, style is missing only if it was set lazily
+        if attr == 'style':
+            lazy_style = self.__dict__.pop('_lazy_style', None)
+            if lazy_style is not None:
+                style = self.style = lazy_style.resolve()
+                return style
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, attr))
+
+    def __setattr__(self, attr, value):
+        if attr == 'style':
+            # a style set directly replaces the lazy style, if there is one
+            self.__dict__.pop('_lazy_style', None)
+        object.__setattr__(self, attr, value)
+
+    def __getstate__(self):
+        state = self.__dict__
+        if '_lazy_style' in state:
+            # the lazy style's factory may not be picklable
+            state = dict(state)
+            del state['_lazy_style']
+            state['style'] = self.style
+        return state
+
+    def _set_lazy_style(self, lazy_style: LazyStyle):
+        """Sets the container's style to a style that is only created when ``style`` is first accessed."""
+
+        self.__dict__.pop('style', None)
+        self._lazy_style = lazy_style
 
     def __hash__(self):
         return hash(self.value)
@@ -0,0 +1,317 @@
+from functools import partial
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from openpyxl.cell.read_only import ReadOnlyCell
+from openpyxl.comments import Comment
+from openpyxl.comments.comment_sheet import CommentSheet
+from openpyxl.packaging.relationship import get_dependents, get_rels_path
+from openpyxl.utils.cell import column_index_from_string, coordinate_to_tuple
+from openpyxl.workbook import Workbook
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+from openpyxl.worksheet._reader import VALUE_TAG, WorkSheetParser
+from openpyxl.worksheet.dimensions import ColumnDimension, RowDimension
+from openpyxl.xml.constants import COMMENTS_NS
+from openpyxl.xml.functions import fromstring, QName
+
+from styleframe.container import Container, LazyStyle
+from styleframe.styler import Styler
+
+try:
+    from pandas.io.excel._openpyxl import OpenpyxlReader
+except ImportError:
+    from pandas.io.excel._openpyxl import _OpenpyxlReader as OpenpyxlReader
+
+
+def get_theme_colors(workbook: Workbook) -> List[str]:
+    """Returns the colors of the workbook's theme, in the order cells refer to them."""
+
+    xlmns = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+    if workbook.loaded_theme is None:
+        return []
+    root = fromstring(workbook.loaded_theme)
+    theme_element = root.find(QName(xlmns, 'themeElements').text)
+    color_schemes = theme_element.findall(QName(xlmns, 'clrScheme').text)
+    colors = []
+    for colorScheme in color_schemes:
+        for tag in ['lt1', 'dk1', 'lt2', 'dk2', 'accent1', 'accent2', 'accent3', 'accent4', 'accent5', 'accent6']:
+            accent = list(colorScheme.find(QName(xlmns, tag).text))[0]
+            if 'window' in accent.attrib['val']:
+                colors.append(accent.attrib['lastClr'])
+            else:
+                colors.append(accent.attrib['val'])
+    return colors
+
+
+class StyledCell(ReadOnlyCell):
+    """
+    .. versionadded:: 4.3
+
+    The style of a cell read by :meth:`.StyleFrame.read_excel` with ``use_openpyxl_styles=True``. Like openpyxl's
+    ``Cell``, it has ``font``, ``fill``, ``border``, ``alignment``, ``number_format`` and ``protection`` attributes,
+    and ``comment`` which is only read if ``read_comments=True``. Its ``value`` is always ``None``.
+    """
+
+    __slots__ = ('comment',)
+
+    def __init__(self, sheet: ReadOnlyWorksheet, row: int, column: int, style_id: int = 0,
+                 comment: Optional[Comment] = None):
+        super().__init__(sheet, row, column, None, style_id=style_id)
+        self.comment = comment
+
+    def __eq__(self, other):
+        return (isinstance(other, StyledCell)
+                and all(getattr(self, attr) == getattr(other, attr)
+                        for attr in ReadOnlyCell.__slots__ + StyledCell.__slots__))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+
+def parse_usecols(usecols: Union[str, List[Union[int, str]], Callable[[Any], bool], None],
+                  columns_names: Callable[[], pd.Index]) -> Optional[List[int]]:
+    """Converts any ``usecols`` :func:`pandas.read_excel` accepts to the zero-based positions of the columns to read.
+
+    :param columns_names: Returns the names of all the sheet's columns, only called if ``usecols`` contains names or
+        is a callable
+    """
+
+    if usecols is None:
+        return None
+    if isinstance(usecols, str):
+        # ie "A:C,E"
+        positions = set()
+        for columns_range in usecols.upper().split(','):
+            first, _, last = columns_range.strip().partition(':')
+            positions.update(range(column_index_from_string(first) - 1,
+                                   column_index_from_string(last or first)))
+        return sorted(positions)
+    if not callable(usecols):
+        usecols = list(usecols)
+        if all(isinstance(col, int) and not isinstance(col, bool) for col in usecols):
+            return sorted(set(usecols))
+        if not all(isinstance(col, str) for col in usecols):
+            raise ValueError("'usecols' must either be all strings, all integers or a callable")
+    names = list(columns_names())
+    if not callable(usecols):
+        missing = [col for col in usecols if col not in set(names)]
+        if missing:
+            raise ValueError('Usecols do not match columns, columns expected but not found: {}'.format(missing))
+        usecols = set(usecols).__contains__
+    return [position for position, name in enumerate(names) if usecols(name)]
+
+
+class _WorkSheetParser(WorkSheetParser):
+    """Only decodes the values of the cells in columns (all of them if None) and in the rows skip_row doesn't skip
+    (a zero-based row -> bool callable). The values of the other cells are kept as their raw strings, so rows that only
+    have values in these cells are still not empty.
+    """
+
+    def __init__(self, *args, columns: Optional[Collection[int]] = None,
+                 skip_row: Optional[Callable[[int], bool]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.columns = columns
+        self.skip_row = skip_row
+        # the last (one-based) row skip_row was called with, and its result
+        self._skipped_row = (None, False)
+
+    def parse_cell(self, element):
+        coordinate = element.get('r')
+        if coordinate:
+            row, column = coordinate_to_tuple(coordinate)
+        else:
+            row, column = self.row_counter, self.col_counter + 1
+        if self.skip_row is not None and self._skipped_row[0] != row:
+            self._skipped_row = (row, bool(self.skip_row(row - 1)))
+        if ((self.columns is None or column in self.columns) and not self._skipped_row[1]) \
+                or element.get('t') == 'inlineStr':
+            return super().parse_cell(element)
+        self.col_counter = column
+        return {'row': row, 'column': column, 'value': element.findtext(VALUE_TAG, None) or None,
+                'data_type': 's', 'style_id': 0}
+
+
+class SheetStyles:
+    """
+    .. versionadded:: 4.3
+
+    Stands in for a read-only worksheet while pandas reads its rows, recording the style id of every cell, the rows'
+    heights and the columns' widths as the rows are parsed, so the values and the styles are read in a single pass.
+
+    :param columns: The one-based indexes of the columns whose values and styles are read. The values of the other
+        columns are not decoded. If ``None``, all of them are read.
+    :param skip_row: Called with each zero-based row index, the values of the rows it returns ``True`` for (the rows
+        pandas skips) are not decoded
+    """
+
+    def __init__(self, sheet: ReadOnlyWorksheet, columns: Optional[Collection[int]] = None,
+                 skip_row: Optional[Callable[[int], bool]] = None):
+        self.sheet = sheet
+        self.columns = columns
+        self.skip_row = skip_row
+        # one-based row -> the style ids of the row's cells (by column)
+        self._style_ids: Dict[int, Dict[int, int]] = {}
+        self._parser: Optional[WorkSheetParser] = None
+        self._comments: Optional[Dict[Tuple[int, int], Comment]] = None
+
+    def reset_dimensions(self):
+        self.sheet.reset_dimensions()
+
+    @property
+    def rows(self):
+        sheet = self.sheet
+        workbook = sheet.parent
+        style_ids = self._style_ids
+        columns = self.columns
+        with sheet._get_source() as source:
+            parser = self._parser = _WorkSheetParser(source, sheet._shared_strings, data_only=workbook.data_only,
+                                                     epoch=workbook.epoch, date_formats=workbook._date_formats,
+                                                     timedelta_formats=workbook._timedelta_formats, columns=columns,
+                                                     skip_row=self.skip_row)
+            # pandas stops iterating once it has read the rows it needs (ie nrows), and the parsing stops with it
+            last_row_index = 0
+            for row_index, row in parser.parse():
+                for _ in range(last_row_index + 1, row_index):
+                    # missing rows are empty
+                    yield ()
+                last_row_index = row_index
+                style_ids[row_index] = {cell['column']: cell['style_id'] for cell in row
+                                        if columns is None or cell['column'] in columns}
+                yield sheet._get_row(row)
+
+    def style_id(self, row: int, column: int) -> int:
+        """Returns the style id (the index in the workbook's ``cellXfs``) of a cell, 0 if the cell wasn't read."""
+
+        return self._style_ids.get(row, {}).get(column, 0)
+
+    def forget_rows(self, rows: Iterable[int]):
+        """Discards the style ids and heights recorded for rows, which were already read."""
+
+        row_dimensions = self._parser.row_dimensions if self._parser else {}
+        for row in rows:
+            self._style_ids.pop(row, None)
+            row_dimensions.pop(str(row), None)
+
+    def cell(self, row: int, column: int, read_comments: bool = False) -> StyledCell:
+        return StyledCell(self.sheet, row, column, self.style_id(row, column),
+                          self.comments.get((row, column)) if read_comments else None)
+
+    def row_height(self, row: int) -> Optional[float]:
+        row_dimension = self._parser.row_dimensions.get(str(row)) if self._parser else None
+        if row_dimension is None:
+            return None
+        return RowDimension(self.sheet, **{attr: value for attr, value in row_dimension.items() if attr != 's'}).height
+
+    def column_width(self, column_letter: str) -> float:
+        column_dimension = self._parser.column_dimensions.get(column_letter) if self._parser else None
+        if column_dimension is None:
+            return ColumnDimension(self.sheet, index=column_letter).width
+        return ColumnDimension(self.sheet,
+                               **{attr: value for attr, value in column_dimension.items() if attr != 'style'}).width
+
+    @property
+    def comments(self) -> Dict[Tuple[int, int], Comment]:
+        """The sheet's comments by (row, column). Read on first use, before the workbook is closed."""
+
+        if self._comments is None:
+            self._comments = {}
+            archive = self.sheet.parent._archive
+            rels_path = get_rels_path(self.sheet._worksheet_path)
+            if rels_path in archive.namelist():
+                for rel in get_dependents(archive, rels_path).find(COMMENTS_NS):
+                    comment_sheet = CommentSheet.from_tree(fromstring(archive.read(rel.target)))
+                    for ref, comment in comment_sheet.comments:
+                        self._comments[coordinate_to_tuple(ref)] = comment
+        return self._comments
+
+
+class StyleTranslator:
+    """Translates the styles of a workbook's cells to :class:`.Styler` objects (or to :class:`StyledCell` objects).
+    Style ids are shared by all the workbook's sheets, so each distinct style (and comment) is translated once and the
+    resulting Styler is shared by all the cells that use it.
+    """
+
+    def __init__(self, workbook: Workbook, use_openpyxl_styles: bool = False, read_comments: bool = False,
+                 lazy_styles: bool = False):
+        self.theme_colors = get_theme_colors(workbook)
+        self.use_openpyxl_styles = use_openpyxl_styles
+        self.read_comments = read_comments
+        self.lazy = lazy_styles and not use_openpyxl_styles
+        # (style id, comment) -> Styler (or LazyStyle)
+        self.stylers: Dict[Tuple[int, Optional[Tuple[str, str]]], Union[Styler, LazyStyle]] = {}
+
+    def get_style(self, sheet_styles: SheetStyles, row: int, column: int) -> Union[StyledCell, Styler, LazyStyle]:
+        if self.use_openpyxl_styles:
+            return sheet_styles.cell(row, column, self.read_comments)
+        style_id = sheet_styles.style_id(row, column)
+        comment = sheet_styles.comments.get((row, column)) if self.read_comments else None
+        key = (style_id, comment and (comment.text, comment.author))
+        try:
+            return self.stylers[key]
+        except KeyError:
+            create_styler = partial(Styler.from_openpyxl_style, StyledCell(sheet_styles.sheet, row, column, style_id),
+                                    self.theme_colors, comment)
+            style = self.stylers[key] = LazyStyle(create_styler) if self.lazy else create_styler()
+            return style
+
+    def set_style(self, container: Container, sheet_styles: SheetStyles, row: int, column: int):
+        if self.lazy:
+            container._set_lazy_style(self.get_style(sheet_styles, row, column))
+        else:
+            container.style = self.get_style(sheet_styles, row, column)
+
+
+class OpenpyxlExcelReader(OpenpyxlReader):
+    """
+    .. versionadded:: 4.3
+
+    pandas' openpyxl reader, that also records the styles of the sheets it reads (see :class:`SheetStyles`).
+    Used by :meth:`.StyleFrame.read_excel` with ``read_style=True``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sheet_styles: Optional[SheetStyles] = None
+        # the one-based indexes of the columns and the rows to skip the next sheets are read with, see SheetStyles
+        self.columns: Optional[Collection[int]] = None
+        self.skip_row: Optional[Callable[[int], bool]] = None
+        # if set, the rows (already converted) the next sheet is parsed from, instead of the sheet's own rows
+        self.sheet_data: Optional[List[List[Any]]] = None
+
+    def iter_sheet_rows(self, sheet_name: Union[str, int]) -> Iterator[List[Any]]:
+        """Yields the sheet's rows converted and trimmed as :meth:`get_sheet_data` does, one at a time. The sheet's
+        styles are recorded in :attr:`sheet_styles` as the rows are read.
+        """
+
+        if isinstance(sheet_name, str):
+            sheet = self.get_sheet_by_name(sheet_name)
+        else:
+            sheet = self.get_sheet_by_index(sheet_name)
+        if not isinstance(sheet, ReadOnlyWorksheet):
+            raise ValueError("Reading styles requires a read-only workbook, engine_kwargs can't set read_only=False")
+        sheet.reset_dimensions()
+        self.sheet_styles = SheetStyles(sheet, self.columns)
+        # empty rows are only yielded once a row with data follows them, so the trailing empty rows are dropped
+        empty_rows = 0
+        for row in self.sheet_styles.rows:
+            converted_row = [self._convert_cell(cell) for cell in row]
+            while converted_row and converted_row[-1] == '':
+                converted_row.pop()
+            if not converted_row:
+                empty_rows += 1
+                continue
+            for _ in range(empty_rows):
+                yield []
+            empty_rows = 0
+            yield converted_row
+
+    def get_sheet_data(self, sheet, *args, **kwargs):
+        if self.sheet_data is not None:
+            return self.sheet_data
+        if not isinstance(sheet, ReadOnlyWorksheet):
+            raise ValueError("Reading styles requires a read-only workbook, engine_kwargs can't set read_only=False")
+        self.sheet_styles = SheetStyles(sheet, self.columns, self.skip_row)
+        return super().get_sheet_data(self.sheet_styles, *args, **kwargs)
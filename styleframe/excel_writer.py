@@ -0,0 +1,50 @@
+import datetime as dt
+import mmap
+
+from typing import Optional
+from zipfile import ZipFile, ZIP_DEFLATED
+
+try:
+    from pandas.io.excel._openpyxl import OpenpyxlWriter
+except ImportError:
+    from pandas.io.excel._openpyxl import _OpenpyxlWriter as OpenpyxlWriter
+
+from styleframe.instrumentation import instrumentation
+from styleframe.native_writer import _PackageWriter, validate_compression_level
+
+
+class OpenpyxlExcelWriter(OpenpyxlWriter):
+    """
+    .. versionadded:: 4.3
+
+    pandas' openpyxl writer, saving the workbook with a configurable deflate compression level and without writing
+    each worksheet to a temporary file first. Created by :meth:`.StyleFrame.ExcelWriter`.
+
+    :param path: File path or a writable binary file-like object (ie :class:`io.BytesIO`)
+    :param compression_level: The deflate compression level of the package, from 0 (fastest, no compression)
+        to 9 (slowest, smallest file). If ``None`` (the default), zlib's default level (6) is used.
+    :type compression_level: int or None
+    :param kwargs: Any other argument :class:`pandas.ExcelWriter` accepts, except for ``engine``
+    """
+
+    def __new__(cls, *args, **kwargs):
+        # pandas.ExcelWriter.__new__ only picks the engine's class, and doesn't accept compression_level
+        return object.__new__(cls)
+
+    def __init__(self, path, compression_level: Optional[int] = None, **kwargs):
+        self.compression_level = validate_compression_level(compression_level)
+        super().__init__(path, **kwargs)
+
+    def _save(self) -> None:
+        timer = instrumentation.timer('save', writer='openpyxl')
+        book = self.book
+        if book.write_only and not book.worksheets:
+            book.create_sheet()
+        book.properties.modified = dt.datetime.now(tz=dt.timezone.utc).replace(tzinfo=None)
+        archive = ZipFile(self._handles.handle, 'w', ZIP_DEFLATED, allowZip64=True,
+                          compresslevel=self.compression_level)
+        _PackageWriter(book, archive).save()
+        if 'r+' in self._mode and not isinstance(self._handles.handle, mmap.mmap):
+            # truncate file to the written content
+            self._handles.handle.truncate()
+        timer.lap('save', sheets=len(book.worksheets))
@@ -0,0 +1,167 @@
+from contextlib import contextmanager
+from threading import RLock
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+
+class PhaseTiming(NamedTuple):
+    """
+    .. versionadded:: 4.3
+
+    The timing of a single phase of an operation, passed to the callbacks registered with
+    :meth:`Instrumentation.add_callback`.
+
+    :param str operation: ``'to_excel'``, ``'read_excel'`` or ``'save'`` (saving a workbook when its writer is closed)
+    :param str phase: The phase's name, ie ``'values'`` or ``'styling'``
+    :param float duration: The phase's duration in seconds
+    :param dict stats: The phase's counters (ie ``cells`` or ``unique_styles``) and the operation's details
+        (ie ``sheet_name``)
+    """
+
+    operation: str
+    phase: str
+    duration: float
+    stats: Dict[str, Any]
+
+
+class PhaseTimer:
+    """Times the consecutive phases of a single operation. Each phase lasts from the end of the previous one
+    (or the timer's creation) until :meth:`lap` is called, and is then reported to the callbacks.
+    """
+
+    def __init__(self, callbacks: List[Callable[[PhaseTiming], Any]], operation: str, **details):
+        self._callbacks = callbacks
+        self._operation = operation
+        self._details = details
+        self._start = perf_counter()
+
+    def __bool__(self) -> bool:
+        return True
+
+    def lap(self, phase: str, **stats):
+        end = perf_counter()
+        timing = PhaseTiming(self._operation, phase, end - self._start, dict(self._details, **stats))
+        for callback in self._callbacks:
+            callback(timing)
+        # the callbacks' own duration is not counted in the next phase
+        self._start = perf_counter()
+
+
+class _NullPhaseTimer:
+    """The timer used when no callbacks are registered. It is falsy, so counters that are costly to calculate
+    can be skipped with ``if timer:``.
+    """
+
+    def __bool__(self) -> bool:
+        return False
+
+    def lap(self, phase: str, **stats):
+        pass
+
+
+_null_phase_timer = _NullPhaseTimer()
+
+
+class Instrumentation:
+    """
+    .. versionadded:: 4.3
+
+    Reports the duration of each phase of :meth:`.StyleFrame.to_excel`, :meth:`.StyleFrame.read_excel` and of saving
+    the workbook, with counters such as the number of cells, the number of unique styles and the style cache's hits
+    and misses, to the registered callbacks. Use :attr:`.StyleFrame.instrumentation` rather than creating one.
+
+    While no callbacks are registered, nothing is measured.
+
+    The phases of each operation, in order (phases that don't apply to a call are skipped):
+
+    * ``to_excel``: ``values`` (extracting the values to export), ``pandas_to_excel`` (writing the values through
+      pandas, unless streaming or using a :class:`.NativeExcelWriter`), ``best_fit``, ``dimensions`` (columns
+      widths, rows heights, freeze panes and hidden columns), ``style_resolution``, ``styling`` (styling the cells,
+      or writing the rows when streaming or using a :class:`.NativeExcelWriter`) and ``sheet_settings``
+    * ``read_excel``: ``pandas_read_excel`` without ``read_style``, otherwise ``parse`` (reading the values and the
+      cells' style ids in a single pass) and ``read_style``, for each sheet read (and for each chunk
+      :meth:`.StyleFrame.iter_excel` reads, with a ``chunk`` stat)
+    * ``save``: ``save`` (serialising and compressing the workbook when its writer is closed)
+
+    Usage example:
+
+    .. code-block:: python
+
+        StyleFrame.instrumentation.add_callback(
+            lambda timing: metrics.timing('styleframe.{}.{}'.format(timing.operation, timing.phase), timing.duration)
+        )
+
+        with StyleFrame.instrumentation.record() as timings:
+            sf.to_excel('output.xlsx').close()
+        print(max(timings, key=lambda timing: timing.duration))
+
+    .. note:: The callbacks are called in the thread that runs the operation. The style cache's hits and misses are
+              counted across all threads.
+    """
+
+    def __init__(self):
+        # replaced rather than modified, so timers keep using the callbacks they were created with
+        self._callbacks: List[Callable[[PhaseTiming], Any]] = []
+        self._lock = RLock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._callbacks)
+
+    def add_callback(self, callback: Callable[[PhaseTiming], Any]):
+        """Registers a callback that is called with a :class:`PhaseTiming` at the end of each phase.
+
+        :param callback: Any callable that accepts a single :class:`PhaseTiming` argument
+        """
+
+        with self._lock:
+            self._callbacks = self._callbacks + [callback]
+
+    def remove_callback(self, callback: Callable[[PhaseTiming], Any]):
+        """Removes a callback registered with :meth:`add_callback`.
+
+        :raises ValueError: If callback is not registered
+        """
+
+        with self._lock:
+            callbacks = list(self._callbacks)
+            callbacks.remove(callback)
+            self._callbacks = callbacks
+
+    @contextmanager
+    def record(self, callback: Optional[Callable[[PhaseTiming], Any]] = None) -> Iterator[List[PhaseTiming]]:
+        """A context manager that collects the timings of the phases that end while it is active.
+
+        :param callback: An optional callback to also call with each timing
+        :return: The list the timings are collected into
+        :rtype: list[PhaseTiming]
+        """
+
+        timings = []
+
+        def collect(timing: PhaseTiming):
+            timings.append(timing)
+            if callback is not None:
+                callback(timing)
+
+        self.add_callback(collect)
+        try:
+            yield timings
+        finally:
+            self.remove_callback(collect)
+
+    def timer(self, operation: str, **details) -> PhaseTimer:
+        """Starts timing an operation.
+
+        :param str operation: The operation's name
+        :param details: Included in the stats of every phase of the operation
+        :return: A :class:`PhaseTimer`, or a falsy timer that does nothing if no callbacks are registered
+        """
+
+        callbacks = self._callbacks
+        if not callbacks:
+            return _null_phase_timer
+        return PhaseTimer(callbacks, operation, **details)
+
+
+instrumentation = Instrumentation()
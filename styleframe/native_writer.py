@@ -0,0 +1,403 @@
+import datetime as dt
+import math
+import pathlib
+import re
+import shutil
+import tempfile
+from decimal import Decimal
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterable, List, Optional, Union
+from xml.sax.saxutils import escape
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.comments.comment_sheet import CommentRecord
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.packaging.extended import ExtendedProperties
+from openpyxl.packaging.relationship import Relationship
+from openpyxl.styles.stylesheet import write_stylesheet
+from openpyxl.utils.datetime import to_excel
+from openpyxl.utils.exceptions import IllegalCharacterError
+from openpyxl.workbook._writer import WorkbookWriter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.writer.excel import ExcelWriter as _OpenpyxlPackageWriter
+from openpyxl.writer.theme import theme_xml
+from openpyxl.xml.constants import (ARC_APP, ARC_CORE, ARC_ROOT_RELS, ARC_SHARED_STRINGS, ARC_STYLE, ARC_THEME,
+                                    ARC_WORKBOOK, ARC_WORKBOOK_RELS, SHARED_STRINGS, SHEET_MAIN_NS)
+from openpyxl.xml.functions import tostring
+
+from styleframe.instrumentation import instrumentation
+
+# the style id attribute of a cell serialised by NativeWorksheet.cell_xml
+_CELL_STYLE_ID_RE = re.compile(rb'(<c r="[A-Z]+[0-9]+" s=")([0-9]+)')
+
+
+def validate_compression_level(compression_level: Optional[int]) -> Optional[int]:
+    if compression_level is not None and not (isinstance(compression_level, int) and 0 <= compression_level <= 9):
+        raise ValueError('compression_level must be an integer between 0 and 9 or None, got {}'.format(
+            compression_level))
+    return compression_level
+
+
+class _CommentedCell:
+    """What openpyxl's comments writer needs to know about a commented cell"""
+
+    __slots__ = ('coordinate', '_comment')
+
+    def __init__(self, coordinate: str, comment):
+        self.coordinate = coordinate
+        self._comment = comment
+
+
+class NativeWorksheet(WriteOnlyWorksheet):
+    """
+    .. versionadded:: 4.3
+
+    A write-only worksheet whose rows are serialised directly to XML, without creating openpyxl ``Cell`` objects.
+    Sheet-level settings (column dimensions, row heights, views and freeze panes, auto filter, protection and
+    conditional formatting) are set the same way they are set on an openpyxl worksheet.
+
+    Worksheets are created by :meth:`NativeExcelWriter.create_sheet`.
+    """
+
+    # the number of cells that are buffered before being written to the rows file
+    _flush_threshold = 1 << 16
+
+    def __init__(self, parent: 'NativeExcelWriter', title: str):
+        super().__init__(parent.book, title)
+        self._excel_writer = parent
+        # the rows are kept in memory if the workbook is written to memory anyway
+        self._rows_file: BinaryIO = BytesIO() if parent.in_memory else tempfile.TemporaryFile()
+        # the sheet's XML before and after the rows, see close
+        self._top: Optional[bytes] = None
+        self._tail: Optional[bytes] = None
+        self._buffer: List[str] = []
+        self._cell_comments: List[CommentRecord] = []
+        # the sheet's complete XML, if it was serialised elsewhere, see load_xml
+        self._serialised_xml: Optional[bytes] = None
+        self._is_closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._is_closed
+
+    def cell_xml(self, coordinate: str, value, style_id: int) -> str:
+        """Serialises a single cell.
+
+        :param str coordinate: The cell's coordinate, ie ``'B3'``
+        :param value: The cell's value. ``None`` and ``''`` result in an empty (but styled) cell, strings that start with
+            ``'='`` are written as formulas.
+        :param int style_id: The index of the cell's style in the workbook's ``cellXfs``
+        :rtype: str
+        """
+
+        if value is None or (isinstance(value, str) and value == ''):
+            return '<c r="{}" s="{}"/>'.format(coordinate, style_id)
+        if isinstance(value, bool):
+            return '<c r="{}" s="{}" t="b"><v>{:d}</v></c>'.format(coordinate, style_id, value)
+        if isinstance(value, (int, float, Decimal)):
+            if isinstance(value, float) and not math.isfinite(value):
+                value = str(value)
+            else:
+                return '<c r="{}" s="{}"><v>{}</v></c>'.format(coordinate, style_id, value)
+        elif isinstance(value, (dt.datetime, dt.date, dt.time, dt.timedelta)):
+            if getattr(value, 'tzinfo', None) is not None:
+                raise TypeError('Excel does not support timezones in datetimes. '
+                                'The tzinfo in the datetime/time object must be set to None.')
+            return '<c r="{}" s="{}"><v>{}</v></c>'.format(coordinate, style_id, to_excel(value))
+        elif not isinstance(value, str):
+            value = str(value)
+
+        if value.startswith('=') and len(value) > 1:
+            return '<c r="{}" s="{}"><f>{}</f></c>'.format(coordinate, style_id, escape(value[1:]))
+        if not self._excel_writer.shared_strings:
+            if ILLEGAL_CHARACTERS_RE.search(value):
+                raise IllegalCharacterError('{} cannot be used in worksheets.'.format(value))
+            return '<c r="{}" s="{}" t="inlineStr"><is><t xml:space="preserve">{}</t></is></c>'.format(
+                coordinate, style_id, escape(value))
+        return '<c r="{}" s="{}" t="s"><v>{}</v></c>'.format(coordinate, style_id,
+                                                            self._excel_writer.shared_string_id(value))
+
+    def write_row(self, row_index: int, cells_xml: Iterable[str]):
+        """Writes a row of already serialised cells, see :meth:`cell_xml`.
+
+        :param int row_index: The 1-based index of the row
+        :param cells_xml: The row's serialised cells
+        """
+
+        if self._is_closed:
+            self._already_saved()
+        attributes = ''
+        if row_index in self.row_dimensions:
+            row_dimension = self.row_dimensions[row_index]
+            if row_dimension.height is not None:
+                attributes = ' ht="{}" customHeight="1"'.format(row_dimension.height)
+        self._buffer.append('<row r="{}"{}>'.format(row_index, attributes))
+        self._buffer.extend(cells_xml)
+        self._buffer.append('</row>')
+        if len(self._buffer) >= self._flush_threshold:
+            self._flush()
+
+    def add_comment(self, coordinate: str, comment):
+        """
+        :param str coordinate: The coordinate of the commented cell
+        :param comment: The comment
+        :type comment: :class:`openpyxl.comments.Comment`
+        """
+
+        self._cell_comments.append(CommentRecord.from_cell(_CommentedCell(coordinate, comment)))
+
+    @property
+    def comments(self) -> List[CommentRecord]:
+        return self._cell_comments
+
+    def load_xml(self, xml: bytes, comments: Iterable[CommentRecord] = (), style_ids: Optional[Dict[int, int]] = None):
+        """Uses an already serialised sheet XML (see :meth:`read`) instead of rows written to this sheet.
+
+        :param bytes xml: The sheet's XML
+        :param comments: The sheet's comments
+        :param style_ids: If the XML was serialised in another workbook, maps the cells' style ids in that workbook to
+            the ids of the same styles in this sheet's workbook
+        :type style_ids: dict[int, int] or None
+        """
+
+        if style_ids and any(style_id != new_style_id for style_id, new_style_id in style_ids.items()):
+            style_ids = {str(style_id).encode(): str(new_style_id).encode()
+                         for style_id, new_style_id in style_ids.items()}
+            xml = _CELL_STYLE_ID_RE.sub(lambda match: match.group(1) + style_ids[match.group(2)], xml)
+        self._serialised_xml = xml
+        self._cell_comments = list(comments)
+
+    def close(self):
+        """Serialises everything but the rows. Called by the :class:`NativeExcelWriter` when it is saved."""
+
+        if self._is_closed:
+            self._already_saved()
+
+        if self._serialised_xml is None:
+            self._flush()
+            # openpyxl serialises everything except for the rows
+            top_writer = WorksheetWriter(self, out=_BytesOutput())
+            top_writer.write_top()
+            top_writer.close()
+            top = top_writer.read()
+            self._top = top[:top.rindex(b'</worksheet>')]
+
+        self._writer = WorksheetWriter(self, out=_BytesOutput())
+        self._comments = self._cell_comments
+        if self._serialised_xml is None:
+            self._writer.write_tail()
+            tail = self._writer.read()
+            self._tail = tail[tail.index(b'>', tail.index(b'<worksheet')) + 1:]
+        self._is_closed = True
+
+    def write_xml(self, out: BinaryIO):
+        """Closes the sheet (if it is not closed already) and writes its XML to out. Can only be called once.
+
+        :param out: A writable binary file-like object
+        """
+
+        if not self._is_closed:
+            self.close()
+        if self._serialised_xml is None:
+            out.write(self._top)
+            out.write(b'<sheetData>')
+            self._rows_file.seek(0)
+            shutil.copyfileobj(self._rows_file, out)
+            out.write(b'</sheetData>')
+            out.write(self._tail)
+        else:
+            out.write(self._serialised_xml)
+        self._rows_file.close()
+
+    def read(self) -> bytes:
+        """Closes the sheet (if it is not closed already) and returns its XML. The sheet can't be saved as part of its
+        workbook afterwards.
+
+        :rtype: bytes
+        """
+
+        xml = BytesIO()
+        self.write_xml(xml)
+        return xml.getvalue()
+
+    def _flush(self):
+        if self._buffer:
+            self._rows_file.write(''.join(self._buffer).encode('utf-8'))
+            self._buffer = []
+
+
+class _BytesOutput(BytesIO):
+    """An in-memory output for openpyxl's ``WorksheetWriter`` which can still be read after the writer closed it"""
+
+    def close(self):
+        pass
+
+
+class _SharedStringsPart:
+    path = '/' + ARC_SHARED_STRINGS
+    mime_type = SHARED_STRINGS
+
+
+class _PackageWriter(_OpenpyxlPackageWriter):
+    """openpyxl's package writer, writing the worksheets' XML straight to the archive instead of through a temporary
+    file per worksheet. The rows of openpyxl's own write-only worksheets are already in temporary files, so these
+    are written by openpyxl.
+    """
+
+    def write_worksheet(self, ws):
+        if self.workbook.write_only and not isinstance(ws, NativeWorksheet):
+            super().write_worksheet(ws)
+            return
+
+        ws._drawing = SpreadsheetDrawing()
+        ws._drawing.charts = ws._charts
+        ws._drawing.images = ws._images
+        with self._archive.open(ws.path[1:], 'w') as out:
+            if isinstance(ws, NativeWorksheet):
+                ws.write_xml(out)
+                writer = ws._writer
+            else:
+                writer = WorksheetWriter(ws, out=out)
+                writer.write()
+        ws._rels = writer._rels
+        self.manifest.append(ws)
+
+
+class _NativePackageWriter(_PackageWriter):
+    """openpyxl's package writer, adding a shared strings table (if provided) to the package"""
+
+    def __init__(self, workbook: Workbook, archive: ZipFile, shared_strings: Optional[Dict[str, int]]):
+        super().__init__(workbook, archive)
+        self._shared_strings = shared_strings
+
+    def write_data(self):
+        archive = self._archive
+
+        archive.writestr(ARC_APP, tostring(ExtendedProperties().to_tree()))
+        archive.writestr(ARC_CORE, tostring(self.workbook.properties.to_tree()))
+        archive.writestr(ARC_THEME, theme_xml)
+
+        self._write_worksheets()
+        if self._shared_strings is not None:
+            self._write_shared_strings()
+
+        archive.writestr(ARC_STYLE, tostring(write_stylesheet(self.workbook)))
+
+        writer = WorkbookWriter(self.workbook)
+        archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
+        archive.writestr(ARC_WORKBOOK, writer.write())
+        if self._shared_strings is not None:
+            writer.rels.append(Relationship(type='sharedStrings', Target='sharedStrings.xml'))
+        archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
+
+        self.manifest._write(archive, self.workbook)
+
+    def _write_shared_strings(self):
+        with self._archive.open(ARC_SHARED_STRINGS, 'w') as shared_strings_file:
+            shared_strings_file.write('<sst xmlns="{}" uniqueCount="{}">'.format(
+                SHEET_MAIN_NS, len(self._shared_strings)).encode('utf-8'))
+            # dicts preserve insertion order, which is the order of the strings' ids
+            chunk = []
+            for string in self._shared_strings:
+                chunk.append('<si><t xml:space="preserve">{}</t></si>'.format(escape(string)))
+                if len(chunk) >= NativeWorksheet._flush_threshold:
+                    shared_strings_file.write(''.join(chunk).encode('utf-8'))
+                    chunk = []
+            chunk.append('</sst>')
+            shared_strings_file.write(''.join(chunk).encode('utf-8'))
+        self.manifest.append(_SharedStringsPart)
+
+
+class NativeExcelWriter:
+    """
+    .. versionadded:: 4.3
+
+    An Excel writer that serialises the worksheets' XML directly from a StyleFrame's values and styles, instead of
+    going through pandas and openpyxl ``Cell`` objects. Pass it as ``excel_writer`` to :meth:`.StyleFrame.to_excel`
+    to use it.
+
+    Strings are written to a shared strings table and the styles' ``cellXfs``, fonts, fills and borders are built
+    from the distinct styles that were exported. Column widths, row heights, freeze panes, auto filters, hidden columns,
+    comments and color scale conditional formatting are supported, the same as with :meth:`.StyleFrame.ExcelWriter`.
+
+    :param path: File path or an open binary file-like object to write the workbook to
+    :type path: str or :class:`pathlib.Path` or file-like object
+    :param bool shared_strings: If ``False``, strings are written inline in the sheets instead of to a shared strings
+        table. This makes each sheet's XML self-contained, at the expense of a larger file if strings repeat.
+    :param compression_level: The deflate compression level of the package, from 0 (fastest, no compression)
+        to 9 (slowest, smallest file). If ``None`` (the default), zlib's default level (6) is used.
+    :type compression_level: int or None
+
+    When writing to a file-like object (ie :class:`io.BytesIO`), no temporary files are used.
+
+    Usage example:
+
+    .. code-block:: python
+
+        with NativeExcelWriter('output.xlsx') as excel_writer:
+            sf.to_excel(excel_writer, sheet_name='Sheet1')
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path, BinaryIO], shared_strings: bool = True,
+                 compression_level: Optional[int] = None):
+        self.path = path
+        self.shared_strings = shared_strings
+        self.compression_level = validate_compression_level(compression_level)
+        # the sheets' rows are kept in memory rather than in temporary files when writing to a file-like object
+        self.in_memory = hasattr(path, 'write')
+        # the workbook holds the styles and the worksheets' settings, its rows are never populated
+        self.book = Workbook(write_only=True)
+        self.sheets: Dict[str, NativeWorksheet] = {}
+        self._shared_strings: Dict[str, int] = {}
+        self._closed = False
+
+    def __enter__(self) -> 'NativeExcelWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def create_sheet(self, title: Optional[str] = None) -> NativeWorksheet:
+        """
+        :param title: The sheet's name
+        :type title: str or None
+        :rtype: :class:`NativeWorksheet`
+        """
+
+        if title in self.sheets:
+            raise ValueError('Sheet {} already exists'.format(title))
+        sheet = NativeWorksheet(self, title)
+        self.book._add_sheet(sheet)
+        self.sheets[sheet.title] = sheet
+        return sheet
+
+    def shared_string_id(self, string: str) -> int:
+        """
+        :param str string:
+        :return: The index of string in the workbook's shared strings table, adding it if it is not there yet
+        :rtype: int
+        """
+
+        try:
+            return self._shared_strings[string]
+        except KeyError:
+            if ILLEGAL_CHARACTERS_RE.search(string):
+                raise IllegalCharacterError('{} cannot be used in worksheets.'.format(string))
+            string_id = self._shared_strings[string] = len(self._shared_strings)
+            return string_id
+
+    def close(self):
+        """Writes the workbook. A writer can only be closed once."""
+
+        if self._closed:
+            return
+        timer = instrumentation.timer('save', writer='native')
+        if not self.sheets:
+            self.create_sheet()
+        archive = ZipFile(self.path, 'w', ZIP_DEFLATED, allowZip64=True, compresslevel=self.compression_level)
+        _NativePackageWriter(self.book, archive, self._shared_strings if self.shared_strings else None).save()
+        self._closed = True
+        timer.lap('save', sheets=len(self.sheets), shared_strings=len(self._shared_strings))
@@ -10,7 +10,7 @@ class Series(pd.Series):
         # enabling the styler accessor (for now only usable using .loc), for example:
         #         sf.loc[sf['col_name'].style.bg_color == utils.colors.yellow]
         #         sf.loc[~sf['col_name'].style.bold]
-        for attr in Styler().__dict__:
+        for attr in Styler._attributes:
             # a dirty hack to avoid hard-coding all of Styler's attributes
             setattr(self, attr, pd.Series(getattr(i, attr) for i in self if isinstance(i, Styler)))
 
@@ -1,24 +1,36 @@
+import asyncio
 import datetime as dt
+import os
 import pathlib
 
 from collections import OrderedDict
 from collections.abc import Iterable
-from copy import deepcopy
+from concurrent.futures import Executor, ProcessPoolExecutor
+from copy import copy, deepcopy
 from functools import partial
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from itertools import count, islice, repeat
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import pandas as pd
 
-from openpyxl import load_workbook, Workbook
-from openpyxl.cell.cell import get_column_letter, Cell
+from openpyxl.cell.cell import get_column_letter, WriteOnlyCell
+from openpyxl.comments import Comment
 from openpyxl.utils import cell
 from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.xml.functions import fromstring, QName
+from openpyxl.xml.constants import MAX_ROW
 
 from styleframe.container import Container
+from styleframe.excel_reader import OpenpyxlExcelReader, SheetStyles, StyleTranslator, parse_usecols
+from styleframe.excel_writer import OpenpyxlExcelWriter
+from styleframe.instrumentation import Instrumentation, instrumentation
+from styleframe.native_writer import NativeExcelWriter, NativeWorksheet
 from styleframe.series import Series
+from styleframe.style_matrix import StyleMatrix
+from styleframe.style_registry import StyleRegistry
 from styleframe.styler import Styler, ColorScaleConditionalFormatRule
+from styleframe.template import CompiledTemplate
 from . import utils
 
 try:
@@ -41,12 +53,36 @@ class StyleFrame:
     """
     P_FACTOR: Union[int, float] = 1.3
     A_FACTOR: Union[int, float] = 13
+    # the executor the async methods (ie to_excel_async) run in, None meaning the event loop's default executor,
+    # and the maximum number of them that may run at the same time in each event loop (None for no limit)
+    ASYNC_EXECUTOR: Optional[Executor] = None
+    ASYNC_MAX_CONCURRENCY: Optional[int] = 4
+    # reports the duration of to_excel's and read_excel's phases to the callbacks registered with it
+    instrumentation: Instrumentation = instrumentation
+    # event loop -> (the ASYNC_MAX_CONCURRENCY it was created with, semaphore capping the async methods in it)
+    _async_semaphores: 'WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[int, asyncio.Semaphore]]' = \
+        WeakKeyDictionary()
+
+    # the Styler attributes holding the number formats of dates, times and datetimes. Values are given the id
+    # (position) of the attribute matching their exact type, 0 meaning the value is not a date, time or datetime
+    _date_time_format_attributes = (None, 'date_time_format', 'date_format', 'time_format')
+    _date_time_types_to_format_ids = {pd_timestamp: 1, dt.datetime: 1, dt.date: 2, dt.time: 3}
+    # pandas.api.types.infer_dtype results of columns that can't hold dates, times or datetimes
+    _no_date_time_inferred_types = frozenset(('empty', 'string', 'bytes', 'floating', 'integer', 'mixed-integer-float',
+                                              'decimal', 'complex', 'boolean', 'datetime64', 'timedelta', 'timedelta64',
+                                              'period', 'interval', 'categorical'))
+    # pandas.api.types.infer_dtype results of columns whose values can't contain a hyperlink when converted to str
+    _no_hyperlink_inferred_types = frozenset(('empty', 'floating', 'integer', 'mixed-integer-float', 'decimal',
+                                              'complex', 'boolean', 'datetime', 'datetime64', 'date', 'time',
+                                              'timedelta', 'timedelta64', 'period', 'interval'))
 
     def __init__(self, obj, styler_obj: Optional[Styler] = None, columns: Optional[List[str]] = None):
         from_another_styleframe = False
         from_pandas_dataframe = False
         if styler_obj and not isinstance(styler_obj, Styler):
             raise TypeError('styler_obj must be {}, got {} instead.'.format(Styler.__name__, type(styler_obj).__name__))
+        # all the new containers share the same immutable style, restyling a container replaces its style
+        default_style = styler_obj.intern() if styler_obj else None
         if isinstance(obj, (pd.DataFrame, np.ndarray)):
             from_pandas_dataframe = True
             if isinstance(obj, np.ndarray):
@@ -56,19 +92,19 @@ class StyleFrame:
             if obj.empty:
                 self.data_df = deepcopy(obj)
             else:
-                self.data_df = obj.map(lambda x: Container(x, deepcopy(styler_obj)) if not isinstance(x, Container) else x)
+                self.data_df = obj.map(lambda x: Container(x, default_style) if not isinstance(x, Container) else x)
         elif isinstance(obj, pd.Series):
-            self.data_df = obj.apply(lambda x: Container(x, deepcopy(styler_obj)) if not isinstance(x, Container) else x)
+            self.data_df = obj.apply(lambda x: Container(x, default_style) if not isinstance(x, Container) else x)
         elif isinstance(obj, (dict, list)):
-            self.data_df = pd.DataFrame(obj).map(lambda x: Container(x, deepcopy(styler_obj)) if not isinstance(x, Container) else x)
+            self.data_df = pd.DataFrame(obj).map(lambda x: Container(x, default_style) if not isinstance(x, Container) else x)
         elif isinstance(obj, StyleFrame):
             self.data_df = deepcopy(obj.data_df)
             from_another_styleframe = True
         else:
             raise TypeError("{} __init__ doesn't support {}".format(type(self).__name__, type(obj).__name__))
-        self.data_df.columns = [Container(col, deepcopy(styler_obj)) if not isinstance(col, Container) else deepcopy(col)
+        self.data_df.columns = [Container(col, default_style) if not isinstance(col, Container) else deepcopy(col)
                                 for col in self.data_df.columns]
-        self.data_df.index = [Container(index, deepcopy(styler_obj)) if not isinstance(index, Container) else deepcopy(index)
+        self.data_df.index = [Container(index, default_style) if not isinstance(index, Container) else deepcopy(index)
                               for index in self.data_df.index]
 
         if from_pandas_dataframe:
@@ -78,19 +114,23 @@ class StyleFrame:
         self._rows_height = obj._rows_height if from_another_styleframe else OrderedDict()
         self._has_custom_headers_style = obj._has_custom_headers_style if from_another_styleframe else False
         self._cond_formatting: List[ColorScaleConditionalFormatRule] = []
-        self._default_style = styler_obj or Styler()
+        self._default_style = default_style or Styler().intern()
         self._index_header_style = obj._index_header_style if from_another_styleframe else self._default_style
 
-        self._known_attrs = {'at': self.data_df.at,
-                             'loc': self.data_df.loc,
-                             'iloc': self.data_df.iloc,
-                             'groupby': self.data_df.groupby,
-                             'index': self.data_df.index,
-                             'fillna': self.data_df.fillna,
+        self._known_attrs = self._get_known_attrs(self.data_df)
 
-                             # applymap is deprecated in pandas > 2
-                             'applymap': self.data_df.map,
-                             'map': self.data_df.map
+    @staticmethod
+    def _get_known_attrs(data_df: pd.DataFrame) -> Dict[str, Any]:
+        return {'at': data_df.at,
+                'loc': data_df.loc,
+                'iloc': data_df.iloc,
+                'groupby': data_df.groupby,
+                'index': data_df.index,
+                'fillna': data_df.fillna,
+
+                # applymap is deprecated in pandas > 2
+                'applymap': data_df.map,
+                'map': data_df.map
         }
 
     def __str__(self):
@@ -116,6 +156,9 @@ class StyleFrame:
         return self.data_df.__delitem__(item)
 
     def __getattr__(self, attr):
+        # data_df is missing while an instance is being unpickled
+        if attr == 'data_df':
+            raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, attr))
         if attr in self.data_df.columns:
             return self.data_df[attr]
         try:
@@ -132,7 +175,10 @@ class StyleFrame:
         self.data_df.columns = [col if isinstance(col, Container) else Container(value=col)
                                 for col in columns]
 
-    def _get_column_as_letter(self, sheet: Worksheet, column_to_convert, startcol: int = 0) -> str:
+    def _get_column_as_letter(self, sheet: Worksheet, column_to_convert, startcol: int = 0,
+                              max_column: Optional[int] = None) -> str:
+        if max_column is None:
+            max_column = sheet.max_column
         col = column_to_convert.value if isinstance(column_to_convert, Container) else column_to_convert
         if not isinstance(col, (int, str)):
             raise TypeError("column must be an index, column letter or column name")
@@ -146,16 +192,18 @@ class StyleFrame:
             column_as_letter = cell.get_column_letter(startcol + col)
 
         # assuming we got column letter
-        elif isinstance(col, str) and col <= get_column_letter(sheet.max_column):
+        elif isinstance(col, str) and col <= get_column_letter(max_column):
             column_as_letter = col
 
-        if column_as_letter is None or cell.column_index_from_string(column_as_letter) > sheet.max_column:
+        if column_as_letter is None or cell.column_index_from_string(column_as_letter) > max_column:
             raise IndexError("column: %s is out of columns range." % column_to_convert)
         return column_as_letter
 
     @classmethod
-    def read_excel(cls, path: str, sheet_name: Union[str, int] = 0, read_style: bool = False,
-                   use_openpyxl_styles: bool = False, read_comments: bool = False, **kwargs) -> 'StyleFrame':
+    def read_excel(cls, path: str, sheet_name: Union[str, int, List[Union[str, int]], None] = 0,
+                   read_style: bool = False, use_openpyxl_styles: bool = False, read_comments: bool = False,
+                   lazy_styles: bool = False, workers: Optional[int] = 1,
+                   **kwargs) -> Union['StyleFrame', Dict[Union[str, int], 'StyleFrame']]:
         """
         Creates a StyleFrame object from an existing Excel.
 
@@ -178,83 +226,293 @@ class StyleFrame:
         :param bool read_comments: If ``True`` (and `read_style` is also ``True``) cells' comments will be loaded to the returned StyleFrame object. Note
                 that reading comments without reading styles is currently not supported.
 
-        :return: StyleFrame object
-        :rtype: :class:`StyleFrame`
-        """
+        .. versionchanged:: 4.3
 
-        def _get_scheme_colors_from_excel(wb: Workbook) -> List[str]:
-            xlmns = 'http://schemas.openxmlformats.org/drawingml/2006/main'
-            if wb.loaded_theme is None:
-                return []
-            root = fromstring(wb.loaded_theme)
-            theme_element = root.find(QName(xlmns, 'themeElements').text)
-            color_schemes = theme_element.findall(QName(xlmns, 'clrScheme').text)
-            colors = []
-            for colorScheme in color_schemes:
-                for tag in ['lt1', 'dk1', 'lt2', 'dk2', 'accent1', 'accent2', 'accent3', 'accent4', 'accent5', 'accent6']:
-                    accent = list(colorScheme.find(QName(xlmns, tag).text))[0]
-                    if 'window' in accent.attrib['val']:
-                        colors.append(accent.attrib['lastClr'])
-                    else:
-                        colors.append(accent.attrib['val'])
-            return colors
-
-        def _get_style_object(sheet: Worksheet, theme_colors: List[str], row: int, column: int) -> Union[Cell, Styler]:
-            cell = sheet.cell(row=row, column=column)
-            if use_openpyxl_styles:
-                return cell
-            else:
-                return Styler.from_openpyxl_style(cell, theme_colors,
-                                                  read_comments and cell.comment)
-
-        def _read_style():
-            wb = load_workbook(path)
-            if isinstance(sheet_name, str):
-                sheet = wb[sheet_name]
-            elif isinstance(sheet_name, int):
-                sheet = wb.worksheets[sheet_name]
-            else:
-                raise TypeError("'sheet_name' must be a string or int, got {} instead".format(type(sheet_name)))
-            theme_colors = _get_scheme_colors_from_excel(wb)
+        With ``read_style=True`` the values and the styles are read in a single pass over the sheet's rows, using
+        openpyxl's read-only mode, and only the openpyxl engine is supported. The openpyxl style objects returned with
+        ``use_openpyxl_styles=True`` are :class:`.StyledCell` objects.
+
+        ``sheet_name`` may also be a list of sheets names and indexes, or ``None`` for all the sheets, in which case
+        a dict of the sheets (as given in ``sheet_name``, or the sheets names if ``None``) to their StyleFrames is
+        returned. With ``read_style=True`` the workbook, including its styles and theme, is loaded once for all the
+        sheets.
 
-            # Set the headers row height
-            if header_arg is not None:
-                headers_row_idx = header_arg + 1
-                sf._rows_height[headers_row_idx] = sheet.row_dimensions[headers_row_idx].height
+        :param bool lazy_styles: If ``True`` (and ``read_style`` is also ``True``), only each cell's style reference is
+            kept while reading, and its :class:`.Styler` is created the first time the cell's ``style`` is accessed.
+            Cells that share a style in the workbook share the created :class:`.Styler`, so each distinct style is
+            created at most once. Useful when only a few cells' styles will be used. Has no effect with
+            ``use_openpyxl_styles=True``.
+        :param workers: The maximum number of processes to read several sheets with (when ``read_style`` is also
+            ``True``). Each process loads the workbook once and reads its share of the sheets. If ``None``, the number
+            of CPUs is used. Default is 1, reading the sheets in the calling process.
 
-            get_style_object = partial(_get_style_object, sheet=sheet, theme_colors=theme_colors)
-            for col_index, col_name in enumerate(sf.columns):
-                col_index_in_excel = col_index + 1
-                if col_index_in_excel == excel_index_col:
-                    for row_index, sf_index in enumerate(sf.data_df.index, start=2):
-                        sf_index.style = get_style_object(row=row_index, column=col_index_in_excel)
-                    col_index_in_excel += 1  # Move next to excel indices column
+            .. note:: Since the StyleFrames are sent back from other processes, ``path`` must be a file path (or
+                      another picklable object), lazy styles are created before the StyleFrames are sent, and on
+                      platforms that spawn new processes (ie Windows) :meth:`read_excel` should be called under an
+                      ``if __name__ == '__main__':`` guard.
 
-                sf.columns[col_index].style = get_style_object(row=1, column=col_index_in_excel)
-                for row_index, sf_index in enumerate(sf.data_df.index, start=start_row_index):
-                    sf.at[sf_index, col_name].style = get_style_object(row=row_index, column=col_index_in_excel)
-                    sf._rows_height[row_index] = sheet.row_dimensions[row_index].height
+        :type workers: int or None
 
-                sf._columns_width[col_name] = sheet.column_dimensions[sf._get_column_as_letter(sheet, col_name)].width
+        :return: StyleFrame object, or a dict of StyleFrame objects if ``sheet_name`` is a list or ``None``
+        :rtype: :class:`StyleFrame` or dict
+        """
 
         header_arg = kwargs.get('header', 0)
         if read_style and isinstance(header_arg, Iterable):
             raise ValueError('Not supporting multiple index columns with read style.')
-        if header_arg is None:
-            start_row_index = 1
-        else:
-            start_row_index = header_arg + 2
         index_col = kwargs.get('index_col')
-        excel_index_col = index_col + 1 if index_col is not None else None
-        if read_style and isinstance(excel_index_col, Iterable):
+        if read_style and isinstance(index_col, Iterable):
             raise ValueError('Not supporting multiple index columns with read style.')
 
-        sf = cls(pd.read_excel(path, sheet_name, **kwargs))
-        if read_style:
-            _read_style()
-            sf._has_custom_headers_style = True
+        if not read_style:
+            timer = cls.instrumentation.timer('read_excel', sheet_name=sheet_name)
+            data = pd.read_excel(path, sheet_name, **kwargs)
+            if isinstance(data, dict):
+                sfs = {name: cls(df) for name, df in data.items()}
+                if timer:
+                    timer.lap('pandas_read_excel', rows=sum(len(sf) for sf in sfs.values()),
+                              columns=sum(len(sf.columns) for sf in sfs.values()),
+                              cells=sum(sf.data_df.size for sf in sfs.values()))
+                return sfs
+            sf = cls(data)
+            timer.lap('pandas_read_excel', rows=len(sf), columns=len(sf.columns), cells=sf.data_df.size)
+            return sf
+
+        if sheet_name is None or isinstance(sheet_name, list):
+            sheets_names = sheet_name
+        elif isinstance(sheet_name, (str, int)):
+            sheets_names = [sheet_name]
+        else:
+            raise TypeError("'sheet_name' must be a string, int, list or None, got {} instead".format(type(sheet_name)))
+        if workers is not None and workers < 1:
+            raise ValueError('workers must be a positive integer or None, got {}'.format(workers))
+        engine = kwargs.pop('engine', None)
+        if engine not in (None, 'openpyxl'):
+            raise ValueError('read_style=True is only supported with the openpyxl engine, got {}'.format(engine))
+        reader_kwargs = {kwarg: kwargs.pop(kwarg) for kwarg in ('storage_options', 'engine_kwargs') if kwarg in kwargs}
+        read_sheets = partial(cls._read_excel_sheets, path, use_openpyxl_styles=use_openpyxl_styles,
+                              read_comments=read_comments, lazy_styles=lazy_styles, reader_kwargs=reader_kwargs,
+                              kwargs=kwargs)
+
+        if sheets_names is None and workers != 1:
+            # the sheets must be known in advance to be divided between the processes
+            excel_reader = OpenpyxlExcelReader(path, **reader_kwargs)
+            try:
+                sheets_names = excel_reader.sheet_names
+            finally:
+                excel_reader.close()
+        if sheets_names is not None:
+            # duplicates are read once, as pandas does
+            sheets_names = list(dict.fromkeys(sheets_names))
+            workers = min(workers or os.cpu_count() or 1, len(sheets_names))
+
+        if sheets_names is None or workers <= 1:
+            sfs = read_sheets(sheets_names)
+        else:
+            # each process reads every workers-th sheet, so the sheets of similar sizes that tend to be next to
+            # each other are divided between the processes
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                sfs = {}
+                for processed_sfs in executor.map(read_sheets, [sheets_names[i::workers] for i in range(workers)]):
+                    sfs.update(processed_sfs)
+            sfs = {name: sfs[name] for name in sheets_names}
+
+        if isinstance(sheet_name, (str, int)):
+            return sfs[sheet_name]
+        return sfs
 
-        return sf
+    @classmethod
+    def _read_excel_sheets(cls, path: str, sheets_names: Optional[List[Union[str, int]]], use_openpyxl_styles: bool,
+                           read_comments: bool, lazy_styles: bool, reader_kwargs: Dict[str, Any],
+                           kwargs: Dict[str, Any]) -> Dict[Union[str, int], 'StyleFrame']:
+        """Reads the values and styles of several sheets (all of them if sheets_names is None) with a single
+        reader, so the workbook, its styles and its theme are loaded once. See :meth:`read_excel`.
+        """
+
+        header_arg = kwargs.get('header', 0)
+        index_col = kwargs.get('index_col')
+        # whether pandas skips a zero-based row of the sheet
+        skiprows = kwargs.get('skiprows')
+        if isinstance(skiprows, int):
+            skip_row = skiprows.__gt__
+        elif callable(skiprows):
+            skip_row = skiprows
+        else:
+            skip_row = set(skiprows or ()).__contains__
+
+        # the values and the styles are read in a single pass over each sheet's rows: pandas reads the values
+        # while the reader records the cells' style ids, the rows heights and the columns widths. Only the rows pandas
+        # needs (ie up to nrows) are parsed, and only the values and styles of the columns in usecols are decoded
+        excel_reader = OpenpyxlExcelReader(path, **reader_kwargs)
+        try:
+            style_translator = StyleTranslator(excel_reader.book, use_openpyxl_styles, read_comments, lazy_styles)
+            sfs = {}
+            for sheet_name in excel_reader.sheet_names if sheets_names is None else sheets_names:
+                timer = cls.instrumentation.timer('read_excel', sheet_name=sheet_name)
+                usecols = cls._read_excel_usecols(excel_reader, sheet_name, kwargs)
+                excel_reader.columns = None if usecols is None else {position + 1 for position in usecols}
+                excel_reader.skip_row = skip_row
+                sf = sfs[sheet_name] = cls(excel_reader.parse(sheet_name, **dict(kwargs, usecols=usecols)))
+                timer.lap('parse', rows=len(sf), columns=len(sf.columns), cells=sf.data_df.size)
+
+                # the one-based rows of the sheet pandas read the headers and the data from, after skipping skiprows
+                excel_rows = (row_index + 1 for row_index in count() if not skip_row(row_index))
+                headers_excel_row = next(islice(excel_rows, header_arg, None)) if header_arg is not None else None
+                cls._read_sheet_style(sf, excel_reader.sheet_styles, style_translator, headers_excel_row,
+                                      list(islice(excel_rows, len(sf))), usecols, index_col, header_arg)
+                if timer:
+                    stats = {'cells': sf.data_df.size}
+                    if not use_openpyxl_styles:
+                        stats['unique_styles'] = len(style_translator.stylers)
+                    timer.lap('read_style', **stats)
+        finally:
+            excel_reader.close()
+        return sfs
+
+    @staticmethod
+    def _read_excel_usecols(excel_reader: OpenpyxlExcelReader, sheet_name: Union[str, int],
+                            kwargs: Dict[str, Any]) -> Optional[List[int]]:
+        """Returns the zero-based positions of the sheet's columns kwargs' usecols selects (None for all of them)."""
+
+        # usecols may be names, which are only known once the headers are read (with all the columns)
+        excel_reader.columns = excel_reader.skip_row = excel_reader.sheet_data = None
+        return parse_usecols(kwargs.get('usecols'), lambda: excel_reader.parse(
+            sheet_name, **dict(kwargs, usecols=None, index_col=None, nrows=0)).columns)
+
+    @staticmethod
+    def _read_sheet_style(sf: 'StyleFrame', sheet_styles: SheetStyles, style_translator: StyleTranslator,
+                          headers_excel_row: Optional[int], data_excel_rows: List[int], usecols: Optional[List[int]],
+                          index_col: Optional[int], header_arg: Optional[int]):
+        """Sets the styles of sf's cells, headers and index, its columns widths and its rows heights from the sheet's
+        cells they were read from.
+
+        :param headers_excel_row: The one-based row of the sheet the headers were read from, None if there are no
+            headers (in which case the headers get the style of the first row)
+        :param data_excel_rows: The one-based rows of the sheet sf's rows were read from
+        :param usecols: The zero-based positions of the columns (including the index) that were read, None if all of
+            them were read
+        """
+
+        if headers_excel_row is None:
+            headers_excel_row = data_excel_rows[0] if data_excel_rows else 1
+        # the one-based columns of the sheet pandas read the index and the columns from
+        excel_columns = [position + 1 for position in usecols] if usecols is not None \
+            else list(range(1, len(sf.columns) + (index_col is not None) + 1))
+        set_style = partial(style_translator.set_style, sheet_styles=sheet_styles)
+        if index_col is not None:
+            index_excel_column = excel_columns.pop(index_col)
+            for row_index, sf_index in zip(data_excel_rows, sf.data_df.index):
+                set_style(sf_index, row=row_index, column=index_excel_column)
+
+        # Set the headers row height
+        if header_arg is not None:
+            sf._rows_height[header_arg + 1] = sheet_styles.row_height(headers_excel_row)
+
+        for col_index, (col_name, col_index_in_excel) in enumerate(zip(sf.columns, excel_columns)):
+            set_style(sf.columns[col_index], row=headers_excel_row, column=col_index_in_excel)
+            for row_index, container in zip(data_excel_rows, sf.data_df.iloc[:, col_index]):
+                set_style(container, row=row_index, column=col_index_in_excel)
+
+            sf._columns_width[col_name] = sheet_styles.column_width(get_column_letter(col_index_in_excel))
+
+        if len(sf.columns):
+            start_row_index = 1 if header_arg is None else header_arg + 2
+            for row_index, excel_row_index in enumerate(data_excel_rows, start=start_row_index):
+                sf._rows_height[row_index] = sheet_styles.row_height(excel_row_index)
+        sf._has_custom_headers_style = True
+
+    @classmethod
+    def iter_excel(cls, path: str, chunksize: int, sheet_name: Union[str, int] = 0, read_style: bool = False,
+                   use_openpyxl_styles: bool = False, read_comments: bool = False, lazy_styles: bool = False,
+                   **kwargs) -> Iterator['StyleFrame']:
+        """Reads a sheet in chunks of rows, yielding a StyleFrame of each chunk, so only one chunk (and the sheet's
+        headers) is held in memory at a time.
+
+        .. versionadded:: 4.3
+
+        Each StyleFrame has the sheet's headers, their styles and the columns widths, and its index continues the
+        previous chunk's (unless ``index_col`` is given). The workbook's theme and styles are loaded once, and the
+        :class:`.Styler` objects are shared by the chunks.
+
+        :param str path: The path to the Excel file to read.
+        :param int chunksize: The maximum number of rows of each StyleFrame
+        :param sheet_name: The sheet name to read. If an integer is provided then it be used as a zero-based
+                sheet index. Default is 0.
+        :type sheet_name: str or int
+        :param bool read_style: If ``True`` the sheet's style will be loaded to the StyleFrame objects.
+        :param bool use_openpyxl_styles: See :meth:`read_excel`
+        :param bool read_comments: See :meth:`read_excel`
+        :param bool lazy_styles: See :meth:`read_excel`
+        :param kwargs: Any other argument :meth:`read_excel` accepts, except for ``engine`` (only openpyxl is
+            supported), ``skiprows``, ``nrows`` and ``skipfooter``. Each chunk is parsed separately, so the types of
+            its columns are inferred from its own values.
+
+        :return: A generator of StyleFrame objects
+        :rtype: Iterator[:class:`StyleFrame`]
+
+        Usage example:
+
+        .. code-block:: python
+
+            for sf in StyleFrame.iter_excel('report.xlsx', chunksize=10000, read_style=True):
+                highlighted_rows = sf[[cell.style.bg_color == utils.colors.yellow for cell in sf['price']]]
+        """
+
+        if not isinstance(chunksize, int) or chunksize < 1:
+            raise ValueError('chunksize must be a positive integer, got {}'.format(chunksize))
+        if not isinstance(sheet_name, (str, int)):
+            raise TypeError("'sheet_name' must be a string or int, got {} instead".format(type(sheet_name)))
+        unsupported_kwargs = [kwarg for kwarg in ('skiprows', 'nrows', 'skipfooter') if kwargs.get(kwarg)]
+        if unsupported_kwargs:
+            raise ValueError('iter_excel does not support {}'.format(', '.join(unsupported_kwargs)))
+        engine = kwargs.pop('engine', None)
+        if engine not in (None, 'openpyxl'):
+            raise ValueError('iter_excel is only supported with the openpyxl engine, got {}'.format(engine))
+        header_arg = kwargs.get('header', 0)
+        index_col = kwargs.get('index_col')
+        if isinstance(header_arg, Iterable) or isinstance(index_col, Iterable):
+            raise ValueError('Not supporting multiple index columns with iter_excel.')
+
+        excel_reader = OpenpyxlExcelReader(path, **{kwarg: kwargs.pop(kwarg) for kwarg in ('storage_options',
+                                                                                          'engine_kwargs')
+                                                    if kwarg in kwargs})
+        try:
+            style_translator = StyleTranslator(excel_reader.book, use_openpyxl_styles, read_comments, lazy_styles)
+            usecols = cls._read_excel_usecols(excel_reader, sheet_name, kwargs)
+            excel_reader.columns = None if usecols is None else {position + 1 for position in usecols}
+            rows = excel_reader.iter_sheet_rows(sheet_name)
+            headers_rows = list(islice(rows, header_arg + 1)) if header_arg is not None else []
+            first_data_excel_row = len(headers_rows) + 1
+            width = 0
+            for chunk_index, first_row_index in enumerate(count(0, chunksize)):
+                timer = cls.instrumentation.timer('read_excel', sheet_name=sheet_name, chunk=chunk_index)
+                data = headers_rows + list(islice(rows, chunksize))
+                if len(data) == len(headers_rows):
+                    return
+                # the rows are padded as pandas pads a whole sheet's rows, to the widest row read so far
+                width = max(width, max(map(len, data)))
+                excel_reader.sheet_data = [row + [''] * (width - len(row)) for row in data]
+                try:
+                    df = excel_reader.parse(sheet_name, **dict(kwargs, usecols=usecols))
+                finally:
+                    excel_reader.sheet_data = None
+                if index_col is None:
+                    df.index = pd.RangeIndex(first_row_index, first_row_index + len(df))
+                sf = cls(df)
+                timer.lap('parse', rows=len(sf), columns=len(sf.columns), cells=sf.data_df.size)
+
+                data_excel_rows = list(range(first_data_excel_row + first_row_index,
+                                             first_data_excel_row + first_row_index + len(sf)))
+                sheet_styles = excel_reader.sheet_styles
+                if read_style:
+                    cls._read_sheet_style(sf, sheet_styles, style_translator,
+                                          header_arg + 1 if header_arg is not None else None, data_excel_rows,
+                                          usecols, index_col, header_arg)
+                    timer.lap('read_style', cells=sf.data_df.size)
+                sheet_styles.forget_rows(data_excel_rows)
+                yield sf
+        finally:
+            excel_reader.close()
 
     @classmethod
     def read_excel_as_template(cls, path: str, df: pd.DataFrame, use_df_boundaries: bool = False, **kwargs) -> 'StyleFrame':
@@ -275,54 +533,166 @@ class StyleFrame:
         """
 
         sf = cls.read_excel(path=path, read_style=True, **kwargs)
+        cls._fill_template(sf, df, use_df_boundaries)
+        return sf
+
+    @classmethod
+    def compile_template(cls, path: str, **kwargs) -> CompiledTemplate:
+        """
+        .. versionadded:: 4.3
+
+        Reads an excel template once, to fill it with different data many times without reading it again.
+
+        .. note:: :meth:`compile_template` also accepts all arguments that :meth:`read_excel` accepts as kwargs except for ``read_style`` which must be ``True``.
+
+        :param str path: The path to the Excel file to read.
+        :return: The compiled template, whose :meth:`~.CompiledTemplate.render` method returns the same StyleFrame
+            :meth:`read_excel_as_template` would
+        :rtype: :class:`.CompiledTemplate`
+
+        Usage example:
+
+        .. code-block:: python
+
+            template = StyleFrame.compile_template('template.xlsx')
+            for report_name, df in reports.items():
+                template.render_to_excel(df, '{}.xlsx'.format(report_name)).close()
+        """
+
+        kwargs.pop('lazy_styles', None)
+        return CompiledTemplate(cls.read_excel(path=path, read_style=True, **kwargs))
 
-        num_of_rows, num_of_cols = len(df.index), len(df.columns)
-        template_num_of_rows, template_num_of_cols = len(sf.data_df.index), len(sf.columns)
+    @staticmethod
+    def _fill_template(sf: 'StyleFrame', df: pd.DataFrame, use_df_boundaries: bool):
+        """Replaces the values of sf (a template read with its styles) with df's values, see
+        :meth:`read_excel_as_template`.
 
-        num_of_cols_to_copy_with_style = min(num_of_cols, template_num_of_cols)
+        The template's cells keep their styles. If df has more columns or rows than the template, the extra columns
+        get the styles of the template's last column and the extra rows get the styles of its last row, and they are
+        all added at once.
+        """
+
+        data_df = sf.data_df
+        num_of_rows, num_of_cols = df.shape
+        template_num_of_rows, template_num_of_cols = data_df.shape
         num_of_rows_to_copy_with_style = min(num_of_rows, template_num_of_rows)
-        for col_index in range(num_of_cols_to_copy_with_style):
-            for row_index in range(num_of_rows_to_copy_with_style):
-                sf.iloc[row_index, col_index].value = df.iloc[row_index, col_index]
 
-        # Insert extra data in cases where the df is larger than the template.
-        for extra_col in df.columns[template_num_of_cols:]:
-            sf[extra_col] = df[extra_col][:template_num_of_rows]
-        for row_index in df.index[template_num_of_rows:]:
-            sf_index = Container(value=row_index)
-            sf.loc[sf_index] = list(map(Container, df.loc[row_index]))
+        for col_index in range(min(num_of_cols, template_num_of_cols)):
+            for container, value in zip(data_df.iloc[:num_of_rows_to_copy_with_style, col_index],
+                                        df.iloc[:num_of_rows_to_copy_with_style, col_index]):
+                container.value = value
 
+        # Insert extra data in cases where the df is larger than the template.
+        if num_of_cols > template_num_of_cols:
+            if template_num_of_cols:
+                header_style = data_df.columns[-1].style
+                styles = [container.style for container in data_df.iloc[:, -1]]
+            else:
+                header_style, styles = None, [None] * template_num_of_rows
+            extra_columns = {}
+            for col_index in range(template_num_of_cols, num_of_cols):
+                values = df.iloc[:template_num_of_rows, col_index].tolist()
+                values += [np.nan] * (template_num_of_rows - len(values))
+                extra_columns[Container(df.columns[col_index], header_style)] = [
+                    Container(value, style) for value, style in zip(values, styles)
+                ]
+            data_df = pd.concat([data_df, pd.DataFrame(extra_columns, index=data_df.index)], axis=1)
+
+        if num_of_rows > template_num_of_rows:
+            if template_num_of_rows:
+                index_style = data_df.index[-1].style
+                styles = [container.style for container in data_df.iloc[-1]]
+            else:
+                index_style, styles = None, [None] * len(data_df.columns)
+            extra_df = df.iloc[template_num_of_rows:]
+            extra_rows = {}
+            for col_index, style in enumerate(styles):
+                values = extra_df.iloc[:, col_index] if col_index < num_of_cols else [np.nan] * len(extra_df)
+                extra_rows[col_index] = [Container(value, style) for value in values]
+            extra_rows = pd.DataFrame(extra_rows, index=pd.Index([Container(index, index_style)
+                                                                  for index in extra_df.index],
+                                                                 name=data_df.index.name))
+            extra_rows.columns = data_df.columns
+            data_df = pd.concat([data_df, extra_rows])
+
+        sf.data_df = data_df
+        sf._known_attrs = sf._get_known_attrs(data_df)
         sf.rename({sf.columns[col_index].value: df_col
                    for col_index, df_col in enumerate(df.columns)},
                   inplace=True)
 
         if use_df_boundaries:
             sf.data_df = sf.data_df.iloc[:num_of_rows, :num_of_cols]
-            rows_height = OrderedDict()
-            rows_height_range = range(num_of_rows)
-            for i, (k, v) in enumerate(sf._rows_height.items()):
-                if i in rows_height_range:
-                    rows_height[k] = v
-            sf._rows_height = rows_height
-
-            columns_width = OrderedDict()
-            columns_width_range = range(num_of_cols)
-            for i, (k, v) in enumerate(sf._columns_width.items()):
-                if i in columns_width_range:
-                    columns_width[k] = v
-            sf._columns_width = columns_width
-        return sf
+            sf._known_attrs = sf._get_known_attrs(sf.data_df)
+            sf._rows_height = OrderedDict(islice(sf._rows_height.items(), num_of_rows))
+            sf._columns_width = OrderedDict(islice(sf._columns_width.items(), num_of_cols))
+
+    @classmethod
+    async def read_excel_async(cls, path: str, sheet_name: Union[str, int, List[Union[str, int]], None] = 0,
+                               read_style: bool = False, use_openpyxl_styles: bool = False,
+                               read_comments: bool = False, lazy_styles: bool = False,
+                               executor: Optional[Executor] = None,
+                               **kwargs) -> Union['StyleFrame', Dict[Union[str, int], 'StyleFrame']]:
+        """
+        .. versionadded:: 4.3
+
+        The async counterpart of :meth:`read_excel`, see :meth:`to_excel_async`.
+
+        :param executor: The executor to read the file in. If ``None`` (the default), ``StyleFrame.ASYNC_EXECUTOR``.
+        :type executor: :class:`concurrent.futures.Executor` or None
+
+        :return: StyleFrame object, or a dict of StyleFrame objects if ``sheet_name`` is a list or ``None``
+        :rtype: :class:`StyleFrame` or dict
+        """
+
+        return await cls._run_async(executor, cls.read_excel, path, sheet_name=sheet_name, read_style=read_style,
+                                    use_openpyxl_styles=use_openpyxl_styles, read_comments=read_comments,
+                                    lazy_styles=lazy_styles, **kwargs)
+
+    @classmethod
+    async def _run_async(cls, executor: Optional[Executor], func: Callable, *args, **kwargs) -> Any:
+        """Runs func in executor (or in ``ASYNC_EXECUTOR``), once fewer than ``ASYNC_MAX_CONCURRENCY`` calls
+        are running in the current event loop.
+        """
+
+        loop = asyncio.get_running_loop()
+        if executor is None:
+            executor = cls.ASYNC_EXECUTOR
+        call = partial(func, *args, **kwargs)
+
+        max_concurrency = cls.ASYNC_MAX_CONCURRENCY
+        if max_concurrency is None:
+            return await loop.run_in_executor(executor, call)
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise ValueError('ASYNC_MAX_CONCURRENCY must be a positive integer or None, got {}'.format(max_concurrency))
+        semaphore_max_concurrency, semaphore = cls._async_semaphores.get(loop, (None, None))
+        if semaphore_max_concurrency != max_concurrency:
+            # ASYNC_MAX_CONCURRENCY was changed (or this is the loop's first call). Calls already holding
+            # the previous semaphore release it when they are done
+            semaphore = asyncio.Semaphore(max_concurrency)
+            cls._async_semaphores[loop] = max_concurrency, semaphore
+        async with semaphore:
+            return await loop.run_in_executor(executor, call)
 
     # noinspection PyPep8Naming
     @classmethod
-    def ExcelWriter(cls, path, **kwargs):
+    def ExcelWriter(cls, path, compression_level: Optional[int] = None, **kwargs):
         """
         A shortcut for :class:`pandas.ExcelWriter`, and accepts any argument it accepts except for ``engine``
+
+        .. versionadded:: 4.3
+
+        ``path`` may also be a writable binary file-like object (ie :class:`io.BytesIO`), in which case the workbook
+        is written to it without using temporary files (unless ``engine_kwargs={'write_only': True}`` is used).
+
+        :param compression_level: The deflate compression level of the file, from 0 (fastest, no compression)
+            to 9 (slowest, smallest file). If ``None`` (the default), zlib's default level (6) is used.
+        :type compression_level: int or None
         """
 
         if 'engine' in kwargs:
             raise ValueError('`engine` argument for StyleFrame.ExcelWriter can not be set')
-        return pd.ExcelWriter(path, engine='openpyxl', **kwargs)
+        return OpenpyxlExcelWriter(path, compression_level=compression_level, **kwargs)
 
     @property
     def row_indexes(self):
@@ -339,6 +709,169 @@ class StyleFrame:
 
         return tuple(range(1, len(self) + 2))
 
+    @classmethod
+    def _with_date_time_format(cls, style: Styler, value: Any) -> Styler:
+        """Returns the style with the number format matching the type of value if it is a date, time or datetime
+        """
+
+        return cls._with_date_time_format_id(style, cls._date_time_types_to_format_ids.get(type(value), 0))
+
+    @classmethod
+    def _with_date_time_format_id(cls, style: Styler, format_id: int) -> Styler:
+        """Returns the style with the number format of the date/time format id (see _date_time_format_ids)
+        """
+
+        format_attribute = cls._date_time_format_attributes[format_id]
+        if format_attribute is None:
+            return style
+        number_format = getattr(style, format_attribute)
+        if number_format is None or number_format == style.number_format:
+            return style
+        return style.evolve(number_format=number_format)
+
+    @classmethod
+    def _date_time_format_ids(cls, values: pd.Series, inferred_type: str) -> np.ndarray:
+        """Returns the date/time format id of every value (see _date_time_types_to_format_ids).
+
+        The ids are decided from the dtype of values when possible, otherwise from the distinct types of its values.
+
+        :param inferred_type: The result of ``pandas.api.types.infer_dtype(values, skipna=True)``
+        """
+
+        if values.dtype.kind == 'M':
+            return np.where(values.isna().to_numpy(), 0, 1).astype(np.int8)
+        if values.dtype.kind != 'O' or inferred_type in cls._no_date_time_inferred_types:
+            return np.zeros(len(values), dtype=np.int8)
+        value_types = values.map(type)
+        types_to_format_ids = {value_type: cls._date_time_types_to_format_ids.get(value_type, 0)
+                               for value_type in pd.unique(value_types)}
+        if len(types_to_format_ids) == 1:
+            return np.full(len(values), next(iter(types_to_format_ids.values())), dtype=np.int8)
+        return value_types.map(types_to_format_ids).to_numpy(dtype=np.int8)
+
+    @classmethod
+    def _hyperlinks_mask(cls, values: pd.Series, inferred_type: str) -> np.ndarray:
+        """Returns a boolean array telling which of the values are hyperlinks (``=HYPERLINK`` formulas).
+
+        :param inferred_type: The result of ``pandas.api.types.infer_dtype(values, skipna=True)``
+        """
+
+        if inferred_type in cls._no_hyperlink_inferred_types:
+            return np.zeros(len(values), dtype=bool)
+        if inferred_type == 'string':
+            return values.str.contains('=HYPERLINK', regex=False, na=False).to_numpy(dtype=bool)
+        return np.fromiter(('=HYPERLINK' in str(value) for value in values), dtype=bool, count=len(values))
+
+    @staticmethod
+    def _max_str_length(values: pd.Series) -> int:
+        """Returns the length of the longest value when converted to str.
+
+        Numeric and boolean columns are measured without converting each value to a Python str, strings columns are
+        measured as they are and in other columns only the distinct values are converted.
+        """
+
+        if len(values) == 0:
+            return 0
+        kind = values.dtype.kind
+        if kind == 'b':
+            return len(str(True)) if values.all() else len(str(False))
+        if kind in 'iu':
+            return max(len(str(values.min())), len(str(values.max())))
+        if kind == 'f':
+            return int(np.char.str_len(values.to_numpy().astype(str)).max())
+        if kind in 'mM':
+            # the cells hold Timestamp and Timedelta objects, whose str differs from numpy's. Apart from the fraction
+            # of a second, which is only shown when needed, the longest str is the one of the earliest or latest value
+            values = values.dropna()
+            if len(values) == 0:
+                return len(str(pd.NaT))
+
+            # the names of the fraction of a second's components, in Timestamp and Timedelta objects
+            microsecond, nanosecond = ('microsecond', 'nanosecond') if kind == 'M' else ('microseconds', 'nanoseconds')
+
+            def get_fraction_length(values_or_bound) -> int:
+                if np.any(getattr(values_or_bound, nanosecond)):
+                    return len('.000000000')
+                if np.any(getattr(values_or_bound, microsecond)):
+                    return len('.000000')
+                return 0
+
+            return max(len(str(bound)) - get_fraction_length(bound) for bound in (values.min(), values.max())) + \
+                get_fraction_length(values.dt)
+
+        max_length = 0
+        if kind == 'O' and pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            lengths = values.str.len()
+            max_length = int(lengths.max()) if lengths.notna().any() else 0
+            # only missing values are left
+            values = values[lengths.isna()]
+        try:
+            distinct_values = pd.unique(values.to_numpy())
+        except TypeError:
+            distinct_values = values.to_numpy()
+        return max(max_length, max((len(str(value)) for value in distinct_values), default=0))
+
+    def _get_rows_block(self, start: int, end: int, header: bool) -> 'StyleFrame':
+        """Returns a StyleFrame of the rows between start and end (exclusive), sharing this StyleFrame's containers
+        and settings. The data rows heights are shifted to the block's rows, the header's height is kept.
+        """
+
+        block = copy(self)
+        block.data_df = self.data_df.iloc[start:end]
+        block._known_attrs = self._get_known_attrs(block.data_df)
+        # rows heights are set by row number, starting from 1 (the header's row, if there is one)
+        first_data_row = 2 if header else 1
+        block._rows_height = OrderedDict((row if row < first_data_row else row - start, height)
+                                         for row, height in self._rows_height.items()
+                                         if row < first_data_row or start + first_data_row <= row < end + first_data_row)
+        return block
+
+    def _get_export_df(self, na_rep: str) -> pd.DataFrame:
+        """Returns a dataframe of the StyleFrame's values. The values are extracted column by column, and missing values
+        in cells that are not containers (ie added by reindexing) are replaced with na_rep.
+        The StyleFrame itself is neither modified nor copied.
+        """
+
+        def get_value(cell):
+            return cell.value if isinstance(cell, Container) else cell
+
+        columns_values = {}
+        for col_index in range(self.data_df.shape[1]):
+            cells = self.data_df.iloc[:, col_index].to_numpy()
+            # cells that are not containers are usually missing values (ie added by reindexing)
+            missing_cells = pd.isna(cells)
+            if missing_cells.any():
+                values = (na_rep if cell_is_missing else get_value(cell)
+                          for cell, cell_is_missing in zip(cells, missing_cells.tolist()))
+            else:
+                try:
+                    values = [cell.value for cell in cells]
+                except AttributeError:
+                    values = map(get_value, cells)
+            columns_values[col_index] = pd.Series(np.fromiter(values, dtype=object, count=len(cells)),
+                                                  copy=False).infer_objects()
+
+        export_df = pd.DataFrame(columns_values, index=pd.RangeIndex(len(self.data_df)))
+        export_df.columns = [col.value for col in self.data_df.columns]
+        # noinspection PyTypeChecker
+        export_df.index = [row_index.value for row_index in self.data_df.index]
+        export_df.index.name = self.data_df.index.name
+        return export_df
+
+    @staticmethod
+    def _to_cell_value(value: Any, na_rep: str) -> Any:
+        if pd.api.types.is_scalar(value) and pd.isna(value):
+            return na_rep
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    @staticmethod
+    def _get_comment(style) -> Optional[Comment]:
+        if isinstance(style, Styler):
+            return style.generate_comment()
+        return getattr(style, 'comment', None)
+
     @staticmethod
     def _to_excel_pandas_defaults(kwargs: Dict[str, Any]) -> Tuple[bool, int, int, str]:
         """Returns the provided or default values for specific arguments as set by :meth:`pandas.DataFrame.to_excel`
@@ -351,18 +884,22 @@ class StyleFrame:
 
         return header, startcol, startrow, na_rep
 
-    def to_excel(self, excel_writer: Union[str, pd.ExcelWriter, pathlib.Path] = 'output.xlsx',
+    def to_excel(self, excel_writer: Union[str, pd.ExcelWriter, pathlib.Path, BinaryIO, NativeExcelWriter] = 'output.xlsx',
                  sheet_name: str = 'Sheet1', allow_protection: bool = False, right_to_left: bool = False,
                  columns_to_hide: Union[None, str, list, tuple, set] = None, row_to_add_filters: Optional[int] = None,
                  columns_and_rows_to_freeze: Optional[str] = None, best_fit: Union[None, str, list, tuple, set] = None,
-                 index: bool = False,
-                 **kwargs) -> pd.ExcelWriter:
+                 index: bool = False, streaming: bool = False, split_sheets: bool = False,
+                 rows_per_sheet: Optional[int] = None,
+                 **kwargs) -> Union[pd.ExcelWriter, NativeExcelWriter]:
         """Saves the dataframe to excel and applies the styles.
 
         .. note:: :meth:`to_excel` also accepts all arguments that :meth:`pandas.DataFrame.to_excel` accepts as kwargs.
 
-        :param excel_writer: File path or existing ExcelWriter
-        :type excel_writer: str or :class:`pandas.ExcelWriter` or :class:`pathlib.Path`
+        :param excel_writer: File path, a writable binary file-like object (ie :class:`io.BytesIO`) or existing
+            ExcelWriter. If a :class:`.NativeExcelWriter` is provided, the sheet's XML is serialised directly from the
+            StyleFrame's values and styles (see :class:`.NativeExcelWriter`).
+        :type excel_writer: str or :class:`pandas.ExcelWriter` or :class:`pathlib.Path` or file-like object or
+            :class:`.NativeExcelWriter`
         :param str sheet_name: Name of sheet the StyleFrame will be exported to
         :param bool allow_protection: Allow to protect the cells that specified as protected. If used ``protection=True``
             in a Styler object this must be set to ``True``.
@@ -395,40 +932,103 @@ class StyleFrame:
         .. versionadded:: 4.2
 
         :param bool index: Write row names.
-        :rtype: :class:`pandas.ExcelWriter`
+
+        .. versionadded:: 4.3
+
+        :param bool streaming: If ``True``, the sheet is written row by row to a write-only openpyxl worksheet, so the
+            sheet is never held in memory as a whole. ``excel_writer`` must either be a path or an ExcelWriter created
+            with ``engine_kwargs={'write_only': True}``.
+
+            .. note:: When using ``streaming=True``, :meth:`to_excel` does not accept any of the extra arguments
+                      :meth:`pandas.DataFrame.to_excel` accepts except for ``header``, ``startcol``, ``startrow``
+                      and ``na_rep``. The same applies when exporting with a :class:`.NativeExcelWriter`.
+
+        :param bool split_sheets: If ``True``, the rows are split into blocks of ``rows_per_sheet`` rows, each exported to
+            its own sheet named ``<sheet_name>_1``, ``<sheet_name>_2`` and so on. Only one block's values are extracted
+            at a time, and the styles, headers, columns widths, rows heights and all the other sheet-level settings are
+            repeated for each sheet (``best_fit`` widths are calculated per sheet).
+            Without it, a StyleFrame with more rows than a sheet can hold (1,048,576 including the header and
+            ``startrow``) raises ``ValueError`` before anything is exported.
+        :param rows_per_sheet: The number of rows in each sheet when ``split_sheets=True``. If ``None`` (the default),
+            as many rows as a sheet can hold.
+        :type rows_per_sheet: int or None
+
+        :rtype: :class:`pandas.ExcelWriter` or :class:`.NativeExcelWriter`
 
         """
 
         if isinstance(excel_writer, pd.ExcelWriter):
             if excel_writer.engine != 'openpyxl':
                 raise TypeError('styleframe supports only openpyxl, attempted to use {}'.format(excel_writer.engine))
+            if streaming and not excel_writer.book.write_only:
+                raise ValueError('streaming=True requires an ExcelWriter created with '
+                                 "engine_kwargs={'write_only': True}")
+
+        native = isinstance(excel_writer, NativeExcelWriter)
+        # both the streaming and the native exports write the sheet row by row, after the sheet-level settings are set
+        row_by_row = streaming or native
 
         header, startcol, startrow, na_rep = self._to_excel_pandas_defaults(kwargs)
 
-        def get_values(x):
-            if isinstance(x, Container):
-                return x.value
+        if row_by_row and kwargs:
+            raise TypeError('The following arguments are not supported when {}: {}'.format(
+                'using NativeExcelWriter' if native else 'streaming=True', ', '.join(kwargs)))
+
+        if isinstance(excel_writer, (str, pathlib.Path)) or hasattr(excel_writer, 'write'):
+            if streaming:
+                excel_writer = self.ExcelWriter(excel_writer, engine_kwargs={'write_only': True})
             else:
-                try:
-                    if np.isnan(x):
-                        return na_rep
-                    else:
-                        return x
-                except TypeError:
-                    return x
+                excel_writer = self.ExcelWriter(excel_writer)
+
+        # the number of data rows that fit in a sheet below startrow and the header
+        max_rows_per_sheet = MAX_ROW - startrow - (1 if header else 0)
+        if split_sheets:
+            if rows_per_sheet is None:
+                rows_per_sheet = max_rows_per_sheet
+            elif not 1 <= rows_per_sheet <= max_rows_per_sheet:
+                raise ValueError('rows_per_sheet must be between 1 and {}, got {}'.format(max_rows_per_sheet,
+                                                                                          rows_per_sheet))
+            for sheet_number, first_row in enumerate(range(0, max(len(self), 1), rows_per_sheet), start=1):
+                self._get_rows_block(first_row, first_row + rows_per_sheet, header).to_excel(
+                    excel_writer, sheet_name='{}_{}'.format(sheet_name, sheet_number),
+                    allow_protection=allow_protection, right_to_left=right_to_left, columns_to_hide=columns_to_hide,
+                    row_to_add_filters=row_to_add_filters, columns_and_rows_to_freeze=columns_and_rows_to_freeze,
+                    best_fit=best_fit, index=index, streaming=streaming, header=header, startcol=startcol,
+                    startrow=startrow, na_rep=na_rep, **kwargs
+                )
+            return excel_writer
+        if len(self) > max_rows_per_sheet:
+            raise ValueError('A sheet can hold at most {} rows of data, got {}. '
+                             'Use split_sheets=True to export them to several sheets'.format(max_rows_per_sheet,
+                                                                                             len(self)))
+
+        timer = self.instrumentation.timer('to_excel', sheet_name=sheet_name)
+
+        def get_sheet_dimensions() -> Tuple[int, int]:
+            if row_by_row:
+                # a write-only sheet does not know its dimensions until it is saved
+                return (startrow + len(self) + (1 if header else 0),
+                        startcol + len(self.data_df.columns) + (1 if index else 0))
+            return sheet.max_row, sheet.max_column
 
         def within_sheet_boundaries(row: Union[int, str] = 1, column: str = 'A'):
-            return (1 <= int(row) <= sheet.max_row
+            max_row, max_column = get_sheet_dimensions()
+            return (1 <= int(row) <= max_row
                         and
-                    1 <= cell.column_index_from_string(column) <= sheet.max_column)
+                    1 <= cell.column_index_from_string(column) <= max_column)
+
+        def get_column_as_letter(column_to_convert) -> str:
+            # the index column (if written) shifts the data columns by one
+            return self._get_column_as_letter(sheet, column_to_convert, startcol + (1 if index else 0),
+                                              max_column=get_sheet_dimensions()[1])
 
         def get_range_of_cells(row_index=None, columns=None):
             if columns is None:
-                start_letter = self._get_column_as_letter(sheet, self.data_df.columns[0], startcol)
-                end_letter = self._get_column_as_letter(sheet, self.data_df.columns[-1], startcol)
+                start_letter = get_column_as_letter(self.data_df.columns[0])
+                end_letter = get_column_as_letter(self.data_df.columns[-1])
             else:
-                start_letter = self._get_column_as_letter(sheet, columns[0], startcol)
-                end_letter = self._get_column_as_letter(sheet, columns[-1], startcol)
+                start_letter = get_column_as_letter(columns[0])
+                end_letter = get_column_as_letter(columns[-1])
             if row_index is None:  # returns cells range for the entire dataframe
                 start_index = startrow + 1
                 end_index = start_index + len(self)
@@ -440,125 +1040,51 @@ class StyleFrame:
                                                                                 end_letter=end_letter,
                                                                                 end_index=end_index)
 
-        if len(self.data_df) > 0:
-            export_df = self.data_df.map(get_values)
+        export_df = self._get_export_df(na_rep)
+        num_of_cells = export_df.size
+        timer.lap('values', rows=len(export_df), columns=len(export_df.columns), cells=num_of_cells)
 
+        if native:
+            sheet = excel_writer.create_sheet(sheet_name)
+        elif streaming:
+            sheet = excel_writer.book.create_sheet(sheet_name)
         else:
-            export_df = deepcopy(self.data_df)
-
-        export_df.columns = [col.value for col in export_df.columns]
-        # noinspection PyTypeChecker
-        export_df.index = [row_index.value for row_index in export_df.index]
-        export_df.index.name = self.data_df.index.name
-
-        if isinstance(excel_writer, (str, pathlib.Path)):
-            excel_writer = self.ExcelWriter(excel_writer)
+            export_df.to_excel(excel_writer, sheet_name=sheet_name, engine='openpyxl', header=header,
+                               index=index, startcol=startcol, startrow=startrow, na_rep=na_rep, **kwargs)
 
-        export_df.to_excel(excel_writer, sheet_name=sheet_name, engine='openpyxl', header=header,
-                           index=index, startcol=startcol, startrow=startrow, na_rep=na_rep, **kwargs)
-
-        sheet = excel_writer.sheets[sheet_name]
+            sheet = excel_writer.sheets[sheet_name]
+            timer.lap('pandas_to_excel', cells=num_of_cells)
 
         sheet.sheet_view.rightToLeft = right_to_left
 
-        self.data_df.fillna(Container('NaN'), inplace=True)
-
-        if index:
-            if self.data_df.index.name:
-                index_name_cell = sheet.cell(row=startrow + 1, column=startcol + 1)
-                index_name_cell.style = self._index_header_style.to_openpyxl_style()
-            for row_index, index in enumerate(self.data_df.index):
-                try:
-                    date_time_types_to_formats = {pd_timestamp: index.style.date_time_format,
-                                                  dt.datetime: index.style.date_time_format,
-                                                  dt.date: index.style.date_format,
-                                                  dt.time: index.style.time_format}
-                    index.style.number_format = date_time_types_to_formats.get(type(index.value),
-                                                                               index.style.number_format)
-                    style_to_apply = index.style.to_openpyxl_style()
-                except AttributeError:
-                    style_to_apply = index.style
-                current_cell = sheet.cell(row=startrow + row_index + 2, column=startcol + 1)
-                current_cell.style = style_to_apply
-                if isinstance(index.style, Styler):
-                    current_cell.comment = index.style.generate_comment()
-                else:
-                    if hasattr(index.style, 'comment'):
-                        index.style.comment.parent = None
-                        current_cell.comment = index.style.comment
-
-            startcol += 1
-
+        # the default headers style is used for this export only, the StyleFrame's own headers are left untouched
         if header and not self._has_custom_headers_style:
-            self.apply_headers_style(Styler.default_header_style())
-
-        # Iterating over the dataframe's elements and applying their styles
-        # openpyxl's rows and cols start from 1,1 while the dataframe is 0,0
-        for col_index, column in enumerate(self.data_df.columns):
-            try:
-                date_time_types_to_formats = {pd_timestamp: column.style.date_time_format,
-                                              dt.datetime: column.style.date_time_format,
-                                              dt.date: column.style.date_format,
-                                              dt.time: column.style.time_format}
-
-                column.style.number_format = date_time_types_to_formats.get(type(column.value),
-                                                                            column.style.number_format)
-                style_to_apply = column.style.to_openpyxl_style()
-            except AttributeError:
-                style_to_apply = Styler.from_openpyxl_style(column.style, [],
-                                                            openpyxl_comment=column.style.comment).to_openpyxl_style()
-            column_header_cell = sheet.cell(row=startrow + 1, column=col_index + startcol + 1)
-            column_header_cell.style = style_to_apply
-            if isinstance(column.style, Styler):
-                column_header_cell.comment = column.style.generate_comment()
-            else:
-                if hasattr(column.style, 'comment') and column.style.comment is not None:
-                    column_header_cell.comment = column.style.comment
-            for row_index, index in enumerate(self.data_df.index):
-                current_cell = sheet.cell(row=row_index + startrow + (2 if header else 1), column=col_index + startcol + 1)
-                data_df_style = self.data_df.at[index, column].style
-                try:
-                    if '=HYPERLINK' in str(current_cell.value):
-                        data_df_style.font_color = utils.colors.blue
-                        data_df_style.underline = utils.underline.single
-                    else:
-                        if best_fit and column.value in best_fit:
-                            data_df_style.wrap_text = False
-                            data_df_style.shrink_to_fit = False
-                    try:
-                        date_time_types_to_formats = {pd_timestamp: data_df_style.date_time_format,
-                                                      dt.datetime: data_df_style.date_time_format,
-                                                      dt.date: data_df_style.date_format,
-                                                      dt.time: data_df_style.time_format}
-
-                        data_df_style.number_format = date_time_types_to_formats.get(type(self.data_df.at[index,column].value),
-                                                                                     data_df_style.number_format)
-                        style_to_apply = data_df_style.to_openpyxl_style()
-                    except AttributeError:
-                        style_to_apply = Styler.from_openpyxl_style(data_df_style, [],
-                                                                    openpyxl_comment=data_df_style.comment).to_openpyxl_style()
-                    current_cell.style = style_to_apply
-                    if isinstance(data_df_style, Styler):
-                        current_cell.comment = data_df_style.generate_comment()
-                    else:
-                        if hasattr(data_df_style, 'comment') and data_df_style.comment is not None:
-                            current_cell.comment = data_df_style.comment
-                except AttributeError:  # if the element in the dataframe is not Container creating a default style
-                    current_cell.style = Styler().to_openpyxl_style()
+            default_headers_style = Styler.default_header_style()
+            index_header_style = default_headers_style
+        else:
+            default_headers_style = None
+            index_header_style = self._index_header_style
 
+        # Sheet-level settings are applied before the cells are styled since a write-only sheet
+        # must have its columns and rows dimensions and views set before any row is written
         if best_fit:
             if not isinstance(best_fit, (list, set, tuple)):
                 best_fit = [best_fit]
-            self.set_column_width_dict(
+            # the best fit widths are used for this export only, the StyleFrame's columns widths are left untouched
+            columns_width = dict(self._columns_width)
+            columns_width.update(
                 {
-                    column: (max(self.data_df[column].astype(str).str.len(), default=0) + self.A_FACTOR) * self.P_FACTOR
+                    column: float((self._max_str_length(export_df[column]) + self.A_FACTOR) * self.P_FACTOR)
                     for column in best_fit
                 }
             )
+            timer.lap('best_fit', columns=len(best_fit))
+        else:
+            columns_width = self._columns_width
 
-        for column in self._columns_width:
-            column_letter = self._get_column_as_letter(sheet, column, startcol)
-            sheet.column_dimensions[column_letter].width = self._columns_width[column]
+        for column in columns_width:
+            column_letter = get_column_as_letter(column)
+            sheet.column_dimensions[column_letter].width = columns_width[column]
 
         for row in self._rows_height:
             if within_sheet_boundaries(row=(row + startrow)):
@@ -566,15 +1092,6 @@ class StyleFrame:
             else:
                 raise IndexError('row: {} is out of range'.format(row))
 
-        if row_to_add_filters is not None:
-            try:
-                row_to_add_filters = int(row_to_add_filters)
-                if not within_sheet_boundaries(row=(row_to_add_filters + startrow + 1)):
-                    raise IndexError('row: {} is out of rows range'.format(row_to_add_filters))
-                sheet.auto_filter.ref = get_range_of_cells(row_index=row_to_add_filters)
-            except (TypeError, ValueError):
-                raise TypeError("row must be an index and not {}".format(type(row_to_add_filters)))
-
         if columns_and_rows_to_freeze is not None:
             if not isinstance(columns_and_rows_to_freeze, str) or len(columns_and_rows_to_freeze) < 2:
                 raise TypeError("columns_and_rows_to_freeze must be a str for example: 'C3'")
@@ -582,11 +1099,7 @@ class StyleFrame:
                 raise IndexError("column: %s is out of columns range." % columns_and_rows_to_freeze[0])
             if not within_sheet_boundaries(row=columns_and_rows_to_freeze[1]):
                 raise IndexError("row: %s is out of rows range." % columns_and_rows_to_freeze[1])
-            sheet.freeze_panes = sheet[columns_and_rows_to_freeze]
-
-        if allow_protection:
-            sheet.protection.autoFilter = False
-            sheet.protection.enable()
+            sheet.freeze_panes = columns_and_rows_to_freeze
 
         # Iterating over the columns_to_hide and check if the format is columns name, column index as number or letter
         if columns_to_hide:
@@ -594,15 +1107,518 @@ class StyleFrame:
                 columns_to_hide = [columns_to_hide]
 
             for column in columns_to_hide:
-                column_letter = self._get_column_as_letter(sheet, column, startcol)
+                column_letter = get_column_as_letter(column)
                 sheet.column_dimensions[column_letter].hidden = True
 
+        timer.lap('dimensions')
+
+        # every distinct style is registered in the workbook once, cells are then given a copy of its style array
+        style_registry = StyleRegistry.for_workbook(excel_writer.book)
+        if timer:
+            registered_styles, cache_hits, cache_misses = len(style_registry), Styler.cache.hits, Styler.cache.misses
+
+        get_index_style, get_header_style, get_index_header_style = self._get_headers_styles_getters(
+            style_registry, default_headers_style, index_header_style
+        )
+
+        # style attributes that are overridden for all the cells in a column, whatever their own styles are.
+        # best fit columns must not wrap or shrink their values
+        best_fit_style_overrides = (('wrap_text', False), ('shrink_to_fit', False))
+        columns_style_overrides = [best_fit_style_overrides if best_fit and column.value in best_fit else ()
+                                   for column in self.data_df.columns]
+        resolved_style_matrix = self._resolve_style_matrix(export_df, style_registry, columns_style_overrides)
+        if timer:
+            timer.lap('style_resolution', unique_styles=len(resolved_style_matrix.palette),
+                      registered_styles=len(style_registry) - registered_styles,
+                      style_cache_hits=Styler.cache.hits - cache_hits,
+                      style_cache_misses=Styler.cache.misses - cache_misses)
+
+        if native:
+            self._write_native_rows(sheet, export_df, resolved_style_matrix, header, index, startcol, startrow,
+                                    na_rep, get_index_style, get_header_style, get_index_header_style)
+        elif streaming:
+            self._stream_rows(sheet, export_df, resolved_style_matrix, header, index, startcol, startrow, na_rep,
+                              get_index_style, get_header_style, get_index_header_style)
+        else:
+            if index:
+                if self.data_df.index.name:
+                    index_name_cell = sheet.cell(row=startrow + 1, column=startcol + 1)
+                    index_name_cell._style = copy(get_index_header_style())
+                for row_index, index_container in enumerate(self.data_df.index):
+                    style_array, comment = get_index_style(index_container)
+                    current_cell = sheet.cell(row=startrow + row_index + 2, column=startcol + 1)
+                    current_cell._style = copy(style_array)
+                    current_cell.comment = comment
+
+                startcol += 1
+
+            # openpyxl's rows and cols start from 1,1 while the dataframe is 0,0
+            for col_index, column in enumerate(self.data_df.columns):
+                column_header_cell = sheet.cell(row=startrow + 1, column=col_index + startcol + 1)
+                style_array, comment = get_header_style(column)
+                column_header_cell._style = copy(style_array)
+                if comment is not None:
+                    column_header_cell.comment = comment
+
+            # Applying the data cells' styles column by column. Each distinct style was resolved once, its style array
+            # is copied to its cells, which pandas already created when it wrote the values
+            first_data_row = startrow + (2 if header else 1)
+            first_data_column = startcol + 1
+            cells = sheet._cells
+            style_arrays = [style_array for style_array, _ in resolved_style_matrix.palette]
+            styles_with_comment = {style_id for style_id, (_, data_df_style) in enumerate(resolved_style_matrix.palette)
+                                   if self._get_comment(data_df_style) is not None}
+            for col_offset in range(resolved_style_matrix.ids.shape[1]):
+                col_index = first_data_column + col_offset
+                column_style_ids = resolved_style_matrix.ids[:, col_offset].tolist()
+                for row_index, style_id in enumerate(column_style_ids, start=first_data_row):
+                    current_cell = cells.get((row_index, col_index))
+                    if current_cell is None:
+                        current_cell = sheet.cell(row=row_index, column=col_index)
+                    current_cell._style = copy(style_arrays[style_id])
+                    if style_id in styles_with_comment:
+                        current_cell.comment = self._get_comment(resolved_style_matrix.palette[style_id][1])
+
+            if index:
+                startcol -= 1
+
+        timer.lap('styling', cells=num_of_cells)
+
+        if row_to_add_filters is not None:
+            try:
+                row_to_add_filters = int(row_to_add_filters)
+                if not within_sheet_boundaries(row=(row_to_add_filters + startrow + 1)):
+                    raise IndexError('row: {} is out of rows range'.format(row_to_add_filters))
+                sheet.auto_filter.ref = get_range_of_cells(row_index=row_to_add_filters)
+            except (TypeError, ValueError):
+                raise TypeError("row must be an index and not {}".format(type(row_to_add_filters)))
+
+        if allow_protection:
+            sheet.protection.autoFilter = False
+            sheet.protection.enable()
+
         for cond_formatting in self._cond_formatting:
             sheet.conditional_formatting.add(get_range_of_cells(columns=cond_formatting.columns),
                                              cond_formatting.rule)
 
+        timer.lap('sheet_settings')
+
+        return excel_writer
+
+    async def to_excel_async(self, excel_writer: Union[str, pd.ExcelWriter, pathlib.Path, BinaryIO,
+                                                       NativeExcelWriter] = 'output.xlsx',
+                             executor: Optional[Executor] = None,
+                             **kwargs) -> Union[pd.ExcelWriter, NativeExcelWriter]:
+        """
+        .. versionadded:: 4.3
+
+        The async counterpart of :meth:`to_excel`, which doesn't block the event loop. The export (the values
+        extraction, the styles resolution and, if ``excel_writer`` is a path or a file-like object, the XML
+        serialisation of the whole workbook) runs in an executor. At most ``StyleFrame.ASYNC_MAX_CONCURRENCY``
+        (4 by default, ``None`` for no limit) async reads and exports run at the same time in each event loop, the
+        others wait for their turn without occupying the executor.
+
+        :param excel_writer: File path, a writable binary file-like object or an existing ExcelWriter. If a path or a
+            file-like object is provided, the workbook is also saved. An existing ExcelWriter is not saved, so more
+            sheets may be added to it.
+        :type excel_writer: str or :class:`pandas.ExcelWriter` or :class:`pathlib.Path` or file-like object or
+            :class:`.NativeExcelWriter`
+        :param executor: The executor to export in. If ``None`` (the default), ``StyleFrame.ASYNC_EXECUTOR``, which in
+            turn defaults to the event loop's default executor.
+        :type executor: :class:`concurrent.futures.Executor` or None
+        :param kwargs: Any argument :meth:`to_excel` accepts
+
+        :rtype: :class:`pandas.ExcelWriter` or :class:`.NativeExcelWriter`
+
+        .. note:: The export runs in a thread of the executor, so the StyleFrame should not be modified before the
+                  export is done. Cancelling the returned coroutine does not stop an export that already started.
+
+        Usage example:
+
+        .. code-block:: python
+
+            async def handler(request):
+                output = io.BytesIO()
+                await sf.to_excel_async(output, best_fit=['a', 'b'])
+                return web.Response(body=output.getvalue())
+        """
+
+        def export():
+            used_excel_writer = self.to_excel(excel_writer, **kwargs)
+            if used_excel_writer is not excel_writer:
+                # to_excel created the writer, save it in the executor as well
+                used_excel_writer.close()
+            return used_excel_writer
+
+        return await self._run_async(executor, export)
+
+    @classmethod
+    def to_excel_many(cls, style_frames: Dict[str, 'StyleFrame'], path: Union[str, pathlib.Path, BinaryIO],
+                      workers: Optional[int] = None, **kwargs) -> None:
+        """Exports several StyleFrames, each to its own sheet, to a single workbook.
+
+        Each sheet's XML is serialised (see :class:`.NativeExcelWriter`) in a separate process and the workbook is then
+        assembled in the calling process, so the export takes about as long as the slowest sheet rather than the sum of
+        all of them.
+
+        .. versionadded:: 4.3
+
+        :param style_frames: Sheets names to the StyleFrames to export to them, in the order of the sheets
+        :type style_frames: dict[str, :class:`StyleFrame`]
+        :param path: File path or an open binary file-like object to write the workbook to
+        :type path: str or :class:`pathlib.Path` or file-like object
+        :param workers: The maximum number of processes to use. If ``None`` (the default) the number of CPUs is used.
+            If only a single process would be used, the sheets are serialised in the calling process.
+        :type workers: int or None
+        :param kwargs: Passed to :meth:`to_excel` for every sheet. The same arguments :meth:`to_excel` accepts when
+            exporting with a :class:`.NativeExcelWriter` are accepted.
+        :rtype: None
+
+        .. note:: Since the StyleFrames are sent to other processes, on platforms that spawn new processes (ie Windows)
+                  :meth:`to_excel_many` should be called under an ``if __name__ == '__main__':`` guard.
+
+        Usage example:
+
+        .. code-block:: python
+
+            StyleFrame.to_excel_many({'January': january_sf, 'February': february_sf}, 'output.xlsx', workers=4)
+        """
+
+        if workers is not None and workers < 1:
+            raise ValueError('workers must be a positive integer or None, got {}'.format(workers))
+
+        sheets_names = list(style_frames)
+        workers = min(workers or os.cpu_count() or 1, len(sheets_names))
+        if workers <= 1:
+            sheets_parts = [cls._to_excel_sheet_part(style_frames[sheet_name], sheet_name, kwargs)
+                            for sheet_name in sheets_names]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                sheets_parts = list(executor.map(cls._to_excel_sheet_part,
+                                                 [style_frames[sheet_name] for sheet_name in sheets_names],
+                                                 sheets_names, repeat(kwargs)))
+
+        excel_writer = NativeExcelWriter(path, shared_strings=False)
+        style_registry = StyleRegistry.for_workbook(excel_writer.book)
+        cell_styles = excel_writer.book._cell_styles
+        for sheet_name, (xml, styles, comments) in zip(sheets_names, sheets_parts):
+            style_ids = {style_id: cell_styles.add(style_registry.register(style))
+                         for style_id, style in styles.items()}
+            excel_writer.create_sheet(sheet_name).load_xml(xml, comments, style_ids)
+        excel_writer.close()
+
+    @staticmethod
+    def _to_excel_sheet_part(style_frame: 'StyleFrame', sheet_name: str,
+                             kwargs: Dict[str, Any]) -> Tuple[bytes, Dict[int, Styler], List[Any]]:
+        """Serialises a single sheet in a workbook of its own, see :meth:`to_excel_many`.
+
+        :return: The sheet's XML, the styles its cells' style ids refer to and its comments
+        """
+
+        excel_writer = NativeExcelWriter(None, shared_strings=False)
+        style_frame.to_excel(excel_writer, sheet_name=sheet_name, **kwargs)
+        sheet = excel_writer.sheets[sheet_name]
+        xml = sheet.read()
+        cell_styles = excel_writer.book._cell_styles
+        styles = {cell_styles.add(style_array): style
+                  for style, style_array in StyleRegistry.for_workbook(excel_writer.book).items()}
+        return xml, styles, sheet.comments
+
+    @classmethod
+    def to_excel_stream(cls, chunks: Iterable[pd.DataFrame],
+                        excel_writer: Union[str, pathlib.Path, BinaryIO, NativeExcelWriter] = 'output.xlsx',
+                        sheet_name: str = 'Sheet1', styler_obj: Optional[Styler] = None,
+                        column_styles: Optional[Dict[Any, Styler]] = None,
+                        row_style_fn: Optional[Callable[[pd.Series], Optional[Styler]]] = None,
+                        columns_width: Optional[Dict[Any, Union[int, float]]] = None,
+                        columns_and_rows_to_freeze: Optional[str] = None, header: bool = True, index: bool = False,
+                        na_rep: str = '') -> NativeExcelWriter:
+        """Exports DataFrames, ie the chunks of ``pandas.read_csv(..., chunksize=...)``, one after the other to a single
+        sheet, so only one chunk is held in memory at a time.
+
+        Each chunk is wrapped in a StyleFrame, styled and serialised with a :class:`.NativeExcelWriter`. The styles are
+        registered in the workbook once and reused by all the chunks.
+
+        .. versionadded:: 4.3
+
+        :param chunks: The DataFrames to export. All of them must have the same columns.
+        :type chunks: Iterable[:class:`pandas.DataFrame`]
+        :param excel_writer: File path, an open binary file-like object or an existing :class:`.NativeExcelWriter`
+        :type excel_writer: str or :class:`pathlib.Path` or file-like object or :class:`.NativeExcelWriter`
+        :param str sheet_name: Name of sheet the chunks will be exported to
+        :param styler_obj: Will be used as the default style of all cells
+        :type styler_obj: None or :class:`.Styler`
+        :param column_styles: Columns names to the styles to apply to them (see :meth:`apply_column_style`)
+        :type column_styles: None or dict[str, :class:`.Styler`]
+        :param row_style_fn: Called with every row (a :class:`pandas.Series` of the row's values). If it returns a
+            :class:`.Styler`, the style is applied to the row (see :meth:`apply_style_by_indexes`), taking precedence
+            over ``column_styles``.
+        :type row_style_fn: None or callable
+        :param columns_width: Columns names to their widths
+        :type columns_width: None or dict[str, int or float]
+        :param columns_and_rows_to_freeze: Column and row string to freeze.
+            For example "C3" will freeze columns: A, B and rows: 1, 2.
+        :type columns_and_rows_to_freeze: None or str
+        :param bool header: Write the columns names (with the default headers style) before the first chunk
+        :param bool index: Write row names
+        :param str na_rep: Missing data representation
+        :return: The writer, which must be closed to save the workbook
+        :rtype: :class:`.NativeExcelWriter`
+
+        Usage example:
+
+        .. code-block:: python
+
+            StyleFrame.to_excel_stream(pd.read_csv('data.csv', chunksize=100000), 'output.xlsx',
+                                       column_styles={'price': Styler(number_format=utils.number_formats.thousands_comma_sep)},
+                                       row_style_fn=lambda row: Styler(bg_color=utils.colors.red) if row['price'] < 0 else None).close()
+        """
+
+        if not isinstance(excel_writer, NativeExcelWriter):
+            excel_writer = NativeExcelWriter(excel_writer)
+        sheet = excel_writer.create_sheet(sheet_name)
+        style_registry = StyleRegistry.for_workbook(excel_writer.book)
+
+        columns = None
+        get_index_style = get_header_style = get_index_header_style = None
+        # the number of the sheet's rows written so far
+        rows_written = 0
+        for chunk in chunks:
+            style_frame = cls(chunk, styler_obj)
+            if columns is None:
+                columns = list(chunk.columns)
+                # the sheet-level settings must be set before the first row is written
+                columns_letters = {column: get_column_letter(col_index + (2 if index else 1))
+                                   for col_index, column in enumerate(columns)}
+                for column, width in (columns_width or {}).items():
+                    sheet.column_dimensions[columns_letters[column]].width = width
+                if columns_and_rows_to_freeze is not None:
+                    sheet.freeze_panes = columns_and_rows_to_freeze
+                default_headers_style = Styler.default_header_style()
+                get_index_style, get_header_style, get_index_header_style = style_frame._get_headers_styles_getters(
+                    style_registry, default_headers_style, default_headers_style
+                )
+            elif list(chunk.columns) != columns:
+                raise ValueError('All the chunks must have the same columns, expected {} got {}'.format(
+                    columns, list(chunk.columns)))
+
+            for column, column_style in (column_styles or {}).items():
+                style_frame.apply_column_style(column, column_style)
+            if row_style_fn is not None:
+                # style -> positions of the rows to apply it to
+                rows_by_style = {}
+                for position, (_, row) in enumerate(chunk.iterrows()):
+                    row_style = row_style_fn(row)
+                    if row_style is not None:
+                        rows_by_style.setdefault(row_style, []).append(position)
+                for row_style, positions in rows_by_style.items():
+                    style_frame.apply_style_by_indexes(positions, row_style)
+
+            write_header = header and rows_written == 0
+            if rows_written + len(chunk) + (1 if write_header else 0) > MAX_ROW:
+                raise ValueError('A sheet can hold at most {} rows'.format(MAX_ROW))
+            export_df = style_frame._get_export_df(na_rep)
+            style_frame._write_native_rows(sheet, export_df,
+                                           style_frame._resolve_style_matrix(export_df, style_registry,
+                                                                             [()] * len(columns)),
+                                           write_header, index, 0, rows_written, na_rep, get_index_style,
+                                           get_header_style, get_index_header_style)
+            rows_written += len(chunk) + (1 if write_header else 0)
+
         return excel_writer
 
+    def _get_headers_styles_getters(self, style_registry: StyleRegistry, default_headers_style: Optional[Styler],
+                                    index_header_style: Styler) -> Tuple[Callable, Callable, Callable]:
+        """Returns the functions the rows writers use to get the registered style array (and comment) of an index cell,
+        of a header cell and of the index's header cell.
+
+        :param default_headers_style: If provided, used for the headers instead of their own styles
+        """
+
+        def get_index_style(index: Container):
+            if isinstance(index.style, Styler):
+                style_array = style_registry.register(self._with_date_time_format(index.style, index.value))
+                comment = index.style.generate_comment()
+            else:
+                style_array = style_registry.register(Styler.from_openpyxl_style(index.style, []))
+                comment = getattr(index.style, 'comment', None)
+                if comment is not None:
+                    comment.parent = None
+            return style_array, comment
+
+        def get_header_style(column: Container):
+            column_style = column.style if default_headers_style is None else default_headers_style
+            if isinstance(column_style, Styler):
+                style_array = style_registry.register(self._with_date_time_format(column_style, column.value))
+                comment = column_style.generate_comment()
+            else:
+                style_array = style_registry.register(Styler.from_openpyxl_style(column_style, []))
+                comment = getattr(column_style, 'comment', None)
+            return style_array, comment
+
+        def get_index_header_style():
+            return style_registry.register(index_header_style)
+
+        return get_index_style, get_header_style, get_index_header_style
+
+    def _resolve_style_matrix(self, export_df: pd.DataFrame, style_registry: StyleRegistry,
+                              columns_style_overrides: List[Tuple[Tuple[str, Any], ...]]) -> StyleMatrix:
+        """Resolves the data cells' styles to the styles they are exported with (hyperlinks, date and time formats and
+        the columns' style overrides applied) and registers them.
+
+        :return: A style matrix whose palette holds ``(registered style array, source style)`` pairs
+        """
+
+        style_matrix = StyleMatrix.from_data_df(self.data_df)
+        # (style id, date/time format id, is hyperlink, column style overrides) -> id in resolved_palette
+        resolved_style_ids = {}
+        # (registered style array, style to generate the comment from)
+        resolved_palette = []
+
+        def resolve_style_id(style_id: int, format_id: int, is_hyperlink: bool,
+                             column_style_overrides: Tuple[Tuple[str, Any], ...]) -> int:
+            key = (style_id, format_id, is_hyperlink, column_style_overrides)
+            try:
+                return resolved_style_ids[key]
+            except KeyError:
+                pass
+            data_df_style = style_matrix.palette[style_id]
+            if isinstance(data_df_style, Styler):
+                if is_hyperlink:
+                    data_df_style = data_df_style.evolve(font_color=utils.colors.blue,
+                                                         underline=utils.underline.single)
+                elif column_style_overrides:
+                    data_df_style = data_df_style.evolve(**dict(column_style_overrides))
+                data_df_style = self._with_date_time_format_id(data_df_style, format_id).intern()
+                style_array = style_registry.register(data_df_style)
+            else:
+                style_array = style_registry.register(Styler.from_openpyxl_style(data_df_style, []))
+            resolved_style_ids[key] = len(resolved_palette)
+            resolved_palette.append((style_array, data_df_style))
+            return resolved_style_ids[key]
+
+        # the number formats and hyperlinks are decided once per column, then every distinct
+        # (style id, date/time format id, is hyperlink) combination of the column is resolved once
+        num_of_format_ids = len(self._date_time_format_attributes)
+        resolved_ids = np.empty_like(style_matrix.ids)
+        for col_index, column_style_overrides in enumerate(columns_style_overrides):
+            values = export_df.iloc[:, col_index]
+            inferred_type = pd.api.types.infer_dtype(values, skipna=True)
+            format_ids = self._date_time_format_ids(values, inferred_type)
+            hyperlinks = self._hyperlinks_mask(values, inferred_type)
+            keys = (style_matrix.ids[:, col_index].astype(np.int64) * num_of_format_ids + format_ids) * 2 + hyperlinks
+            unique_keys, inverse = np.unique(keys, return_inverse=True)
+            column_resolved_ids = [resolve_style_id(key // (2 * num_of_format_ids), key // 2 % num_of_format_ids,
+                                                    bool(key % 2), column_style_overrides)
+                                   for key in unique_keys.tolist()]
+            resolved_ids[:, col_index] = np.asarray(column_resolved_ids, dtype=resolved_ids.dtype)[inverse]
+        return StyleMatrix(resolved_ids, resolved_palette)
+
+    def _stream_rows(self, sheet: Worksheet, export_df: pd.DataFrame, style_matrix: StyleMatrix,
+                     header: Union[bool, List[str]], index: bool, startcol: int, startrow: int, na_rep: str,
+                     get_index_style, get_header_style, get_index_header_style) -> None:
+        """Writes the header and data rows, values and styles together, to a write-only sheet one row at a time.
+        ``style_matrix``'s palette holds ``(registered style array, source style)`` pairs.
+        """
+
+        def styled_cell(value, style_array, comment=None) -> WriteOnlyCell:
+            current_cell = WriteOnlyCell(sheet, value=self._to_cell_value(value, na_rep))
+            current_cell._style = copy(style_array)
+            if comment is not None:
+                current_cell.comment = comment
+            return current_cell
+
+        for _ in range(startrow):
+            sheet.append([])
+
+        row_prefix = [None] * startcol
+
+        if header:
+            headers_values = header if isinstance(header, (list, tuple)) else export_df.columns
+            row = list(row_prefix)
+            if index:
+                if self.data_df.index.name:
+                    row.append(styled_cell(self.data_df.index.name, get_index_header_style()))
+                else:
+                    row.append(None)
+            for column, header_value in zip(self.data_df.columns, headers_values):
+                row.append(styled_cell(header_value, *get_header_style(column)))
+            sheet.append(row)
+
+        for row_index, values in enumerate(export_df.itertuples(index=False, name=None)):
+            row = list(row_prefix)
+            if index:
+                index_container = self.data_df.index[row_index]
+                row.append(styled_cell(index_container.value, *get_index_style(index_container)))
+            for value, style_id in zip(values, style_matrix.ids[row_index]):
+                style_array, data_df_style = style_matrix.palette[style_id]
+                row.append(styled_cell(value, style_array, self._get_comment(data_df_style)))
+            sheet.append(row)
+
+    def _write_native_rows(self, sheet: NativeWorksheet, export_df: pd.DataFrame, style_matrix: StyleMatrix,
+                           header: Union[bool, List[str]], index: bool, startcol: int, startrow: int, na_rep: str,
+                           get_index_style, get_header_style, get_index_header_style) -> None:
+        """Serialises the header and data rows directly to a native sheet's XML. The data cells are serialised one
+        column of a chunk of rows at a time. ``style_matrix``'s palette holds ``(registered style array, source style)``
+        pairs.
+        """
+
+        rows_per_chunk = 4096
+        # the index of each registered style array in the workbook's cellXfs
+        cell_styles = sheet.parent._cell_styles
+        first_data_column = startcol + (2 if index else 1)
+        first_data_row = startrow + (2 if header else 1)
+        columns_letters = [get_column_letter(first_data_column + col_index)
+                           for col_index in range(len(self.data_df.columns))]
+
+        if header:
+            headers_values = header if isinstance(header, (list, tuple)) else export_df.columns
+            row_cells = []
+            if index and self.data_df.index.name:
+                coordinate = '{}{}'.format(get_column_letter(startcol + 1), startrow + 1)
+                style_id = cell_styles.add(get_index_header_style())
+                row_cells.append(sheet.cell_xml(coordinate, self.data_df.index.name, style_id))
+            for column, header_value, column_letter in zip(self.data_df.columns, headers_values, columns_letters):
+                coordinate = '{}{}'.format(column_letter, startrow + 1)
+                style_array, comment = get_header_style(column)
+                row_cells.append(sheet.cell_xml(coordinate, self._to_cell_value(header_value, na_rep),
+                                                cell_styles.add(style_array)))
+                if comment is not None:
+                    sheet.add_comment(coordinate, comment)
+            sheet.write_row(startrow + 1, row_cells)
+
+        style_ids = np.array([cell_styles.add(style_array) for style_array, _ in style_matrix.palette], dtype=np.int64)
+        index_column_letter = get_column_letter(startcol + 1)
+        for chunk_start in range(0, len(export_df), rows_per_chunk):
+            chunk_end = min(chunk_start + rows_per_chunk, len(export_df))
+            rows_numbers = range(first_data_row + chunk_start, first_data_row + chunk_end)
+            columns_cells = []
+            if index:
+                index_cells = []
+                for row_number, index_container in zip(rows_numbers, self.data_df.index[chunk_start:chunk_end]):
+                    coordinate = '{}{}'.format(index_column_letter, row_number)
+                    style_array, comment = get_index_style(index_container)
+                    index_cells.append(sheet.cell_xml(coordinate, self._to_cell_value(index_container.value, na_rep),
+                                                      cell_styles.add(style_array)))
+                    if comment is not None:
+                        sheet.add_comment(coordinate, comment)
+                columns_cells.append(index_cells)
+            for col_index, column_letter in enumerate(columns_letters):
+                values = export_df.iloc[chunk_start:chunk_end, col_index].tolist()
+                column_style_ids = style_ids[style_matrix.ids[chunk_start:chunk_end, col_index]].tolist()
+                columns_cells.append([sheet.cell_xml('{}{}'.format(column_letter, row_number),
+                                                     self._to_cell_value(value, na_rep), style_id)
+                                      for row_number, value, style_id in zip(rows_numbers, values, column_style_ids)])
+            for row_number, row_cells in zip(rows_numbers, zip(*columns_cells)):
+                sheet.write_row(row_number, row_cells)
+
+        for style_id, (_, data_df_style) in enumerate(style_matrix.palette):
+            if self._get_comment(data_df_style) is None:
+                continue
+            for row_index, col_index in zip(*np.nonzero(style_matrix.ids == style_id)):
+                sheet.add_comment('{}{}'.format(columns_letters[col_index], first_data_row + row_index),
+                                  self._get_comment(data_df_style))
+
     def apply_style_by_indexes(self,
                                indexes_to_style: Union[list, tuple, int, Container],
                                styler_obj: Styler,
@@ -662,9 +1678,9 @@ class StyleFrame:
             cols_to_style = list(self.data_df.columns)
 
         if overwrite_default_style:
-            style_to_apply = deepcopy(styler_obj)
+            style_to_apply = styler_obj.intern()
         else:
-            style_to_apply = Styler.combine(self._default_style, styler_obj)
+            style_to_apply = Styler.combine(self._default_style, styler_obj).intern()
 
         for index in indexes_to_style:
             index.style = style_to_apply
@@ -715,24 +1731,44 @@ class StyleFrame:
             raise KeyError("one of the columns in {} wasn't found".format(cols_to_style))
 
         if overwrite_default_style:
-            style_to_apply = styler_obj
+            style_to_apply = styler_obj.intern()
         else:
-            style_to_apply = Styler.combine(self._default_style, styler_obj)
+            style_to_apply = Styler.combine(self._default_style, styler_obj).intern()
+
+        # value type -> style_to_apply with the default number format of that type
+        styles_by_value_type = {}
+        # number format -> style_to_apply with that number format
+        styles_with_default_formats = {None: style_to_apply}
+
+        def get_style_for_value_type(value_type: type) -> Styler:
+            try:
+                return styles_by_value_type[value_type]
+            except KeyError:
+                pass
+            if not use_default_formats:
+                number_format = None
+            elif issubclass(value_type, pd_timestamp):
+                number_format = utils.number_formats.date_time
+            elif issubclass(value_type, dt.date):
+                number_format = utils.number_formats.date
+            elif issubclass(value_type, dt.time):
+                number_format = utils.number_formats.time_24_hours
+            else:
+                number_format = None
+            try:
+                style = styles_with_default_formats[number_format]
+            except KeyError:
+                style = styles_with_default_formats[number_format] = style_to_apply.evolve(number_format=number_format)
+            styles_by_value_type[value_type] = style
+            return style
 
         for col_name in cols_to_style:
+            col_index = self.columns.get_loc(col_name)
             if style_header:
-                self.columns[self.columns.get_loc(col_name)].style = style_to_apply
+                self.columns[col_index].style = style_to_apply
                 self._has_custom_headers_style = True
-            for index in self.data_df.index:
-                if use_default_formats:
-                    if isinstance(self.at[index, col_name].value, pd_timestamp):
-                        style_to_apply.number_format = utils.number_formats.date_time
-                    elif isinstance(self.at[index, col_name].value, dt.date):
-                        style_to_apply.number_format = utils.number_formats.date
-                    elif isinstance(self.at[index, col_name].value, dt.time):
-                        style_to_apply.number_format = utils.number_formats.time_24_hours
-
-                self.at[index, col_name].style = style_to_apply
+            for container in self.data_df.iloc[:, col_index].to_numpy():
+                container.style = get_style_for_value_type(type(container.value))
 
         if width:
             self.set_column_width(columns=cols_to_style, width=width)
@@ -771,6 +1807,7 @@ class StyleFrame:
         if not all(col in self.columns for col in cols_to_style):
             raise KeyError("one of the columns in {} wasn't found".format(cols_to_style))
 
+        styler_obj = styler_obj.intern()
         if style_index_header:
             self._index_header_style = styler_obj
 
@@ -0,0 +1,77 @@
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from styleframe.container import Container
+from styleframe.styler import Styler
+
+
+class StyleMatrix:
+    """
+    .. versionadded:: 4.3
+
+    A columnar snapshot of a dataframe's styles: a 2D ``numpy.int32`` matrix of style ids (with the same shape as the
+    dataframe) and a palette of the distinct style objects these ids refer to. The cells of the dataframe keep their
+    own styles, the matrix is built from them when exporting, so that each distinct style is translated only once.
+
+    :param ids: 2D array of style ids, each one is an index into ``palette``
+    :type ids: :class:`numpy.ndarray`
+    :param palette: The distinct style objects
+    :type palette: list
+    """
+
+    def __init__(self, ids: np.ndarray, palette: List[Any]):
+        self.ids = ids
+        self.palette = palette
+
+    def __len__(self) -> int:
+        return len(self.palette)
+
+    def __getitem__(self, item: Tuple[int, int]) -> Any:
+        return self.palette[self.ids[item]]
+
+    @classmethod
+    def from_data_df(cls, data_df: pd.DataFrame, default_style: Any = None) -> 'StyleMatrix':
+        """Builds a style matrix from a dataframe of :class:`.Container` objects.
+
+        :param data_df: The dataframe to read the styles from
+        :type data_df: :class:`pandas.DataFrame`
+        :param default_style: The style to use for cells that are not :class:`.Container` objects.
+            If not provided, ``Styler()`` will be used.
+        :rtype: :class:`StyleMatrix`
+        """
+
+        palette = []
+        style_ids_by_identity: Dict[int, int] = {}
+        style_ids_by_value: Dict[Styler, int] = {}
+
+        def get_style_id(style) -> int:
+            # looking up by identity first since most cells share their style object with other cells,
+            # and hashing a Styler is considerably more expensive than hashing its id
+            try:
+                return style_ids_by_identity[id(style)]
+            except KeyError:
+                pass
+            if isinstance(style, Styler):
+                try:
+                    style_id = style_ids_by_value[style]
+                except KeyError:
+                    style_id = style_ids_by_value[style] = len(palette)
+                    palette.append(style)
+            else:
+                style_id = len(palette)
+                palette.append(style)
+            style_ids_by_identity[id(style)] = style_id
+            return style_id
+
+        if default_style is None:
+            default_style = Styler()
+
+        ids = np.empty(data_df.shape, dtype=np.int32)
+        for col_index in range(data_df.shape[1]):
+            column_ids = ids[:, col_index]
+            for row_index, container in enumerate(data_df.iloc[:, col_index].to_numpy()):
+                column_ids[row_index] = get_style_id(container.style if isinstance(container, Container) else default_style)
+
+        return cls(ids, palette)
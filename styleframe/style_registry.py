@@ -0,0 +1,179 @@
+from collections import OrderedDict
+from copy import copy
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from weakref import WeakKeyDictionary, ref
+
+from openpyxl import Workbook
+from openpyxl.styles import NamedStyle
+from openpyxl.styles.cell_style import StyleArray
+
+
+class StyleCache:
+    """
+    .. versionadded:: 4.3
+
+    A thread-safe mapping, optionally bounded as an LRU cache. Used by :class:`.Styler` to cache the translation of
+    styles to openpyxl's ``NamedStyle`` objects across workbooks.
+
+    :param maxsize: The maximum number of entries to keep. If ``None`` (the default) the cache is unbounded.
+        May be changed later by setting the ``maxsize`` attribute, ie ``Styler.cache.maxsize = 1024``.
+    :type maxsize: int or None
+
+    ``hits`` and ``misses`` count the lookups of :meth:`get_or_create` that found and didn't find the key.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = RLock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: Optional[int]):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be a positive integer or None, got {}'.format(maxsize))
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Returns the value cached for key, creating (and caching) it with factory if it is missing.
+        The lookup and the creation are atomic, so concurrent callers always get the same object.
+        """
+
+        with self._lock:
+            try:
+                value = self[key]
+            except KeyError:
+                self.misses += 1
+                value = self[key] = factory()
+                return value
+            self.hits += 1
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self):
+        if self._maxsize is not None:
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+class StyleRegistry:
+    """
+    .. versionadded:: 4.3
+
+    Registers styles in a single workbook. Each distinct style is added to the workbook once, as a named style owned by
+    that workbook, and the resulting style array is handed out for cells to copy, so styling a cell doesn't require
+    looking the named style up in the workbook.
+
+    Use :meth:`for_workbook` to get the registry of a workbook rather than creating one directly.
+
+    :param workbook: The workbook to register the styles in
+    :type workbook: :class:`openpyxl.workbook.Workbook`
+    """
+
+    # workbook -> its registry. The registries only hold a weak reference to their workbook,
+    # so a registry is discarded together with its workbook
+    _registries: 'WeakKeyDictionary[Workbook, StyleRegistry]' = WeakKeyDictionary()
+    _registries_lock = RLock()
+
+    def __init__(self, workbook: Workbook):
+        self._workbook = ref(workbook)
+        self._style_arrays: Dict[Hashable, StyleArray] = {}
+        # name -> the style array of the workbook's named style. The named styles themselves are not kept since they
+        # refer to the workbook
+        self._named_style_arrays: Dict[str, StyleArray] = {named_style.name: copy(named_style._style)
+                                                           for named_style in workbook._named_styles}
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._style_arrays)
+
+    def items(self) -> List[Tuple[Hashable, StyleArray]]:
+        """
+        :return: The registered styles and their style arrays
+        :rtype: list[tuple[Styler, StyleArray]]
+        """
+
+        with self._lock:
+            return list(self._style_arrays.items())
+
+    @classmethod
+    def for_workbook(cls, workbook: Workbook) -> 'StyleRegistry':
+        """Returns the registry of workbook, creating it on first use.
+
+        :param workbook: The workbook to get the registry of
+        :type workbook: :class:`openpyxl.workbook.Workbook`
+        :rtype: :class:`StyleRegistry`
+        """
+
+        with cls._registries_lock:
+            try:
+                return cls._registries[workbook]
+            except KeyError:
+                registry = cls._registries[workbook] = cls(workbook)
+                return registry
+
+    def register(self, styler) -> StyleArray:
+        """Registers a style in the workbook (if it was not registered already).
+
+        :param styler: The style to register
+        :type styler: :class:`.Styler`
+        :return: The style array to assign (a copy of) to cells, ie ``cell._style = copy(style_array)``
+        :rtype: :class:`openpyxl.styles.cell_style.StyleArray`
+        """
+
+        with self._lock:
+            try:
+                return self._style_arrays[styler]
+            except KeyError:
+                pass
+
+            workbook = self._workbook()
+            if workbook is None:
+                raise ReferenceError('The workbook of this registry no longer exists')
+
+            openpyxl_style = styler.to_openpyxl_style()
+            named_style_array = self._named_style_arrays.get(openpyxl_style.name)
+            if named_style_array is None:
+                # the cached NamedStyle is shared by every workbook, so the workbook gets its own copy of it
+                named_style = NamedStyle(
+                    name=openpyxl_style.name, font=openpyxl_style.font, fill=openpyxl_style.fill,
+                    border=openpyxl_style.border, alignment=openpyxl_style.alignment,
+                    number_format=openpyxl_style.number_format, protection=openpyxl_style.protection
+                )
+                workbook.add_named_style(named_style)
+                named_style_array = self._named_style_arrays[openpyxl_style.name] = copy(named_style._style)
+
+            style_array = self._style_arrays[styler] = copy(named_style_array)
+            # the shared NamedStyle gets the ids the style has in the workbook it was last used with, as it used to
+            # when it was assigned to cells directly, without being bound to (and keeping alive) that workbook
+            openpyxl_style._style[:] = style_array
+            return style_array
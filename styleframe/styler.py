@@ -7,7 +7,12 @@ from openpyxl.styles import PatternFill, NamedStyle, Color as OpenPyColor, Borde
 from openpyxl.comments import Comment
 from pprint import pformat
 
-from typing import Dict, List, Optional, Union, Set
+from threading import RLock
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union, Set
+from weakref import WeakValueDictionary
+
+from styleframe.style_registry import StyleCache
 
 
 class Styler:
@@ -78,7 +83,19 @@ class Styler:
     :param bool italic:
     """
 
-    cache: Dict['Styler', NamedStyle] = {}
+    __slots__ = ('bold', 'font', 'font_size', 'number_format', 'protection', 'underline', 'horizontal_alignment',
+                 'vertical_alignment', 'bg_color', 'font_color', 'shrink_to_fit', 'wrap_text', 'indent',
+                 'comment_author', 'comment_text', 'text_rotation', 'date_format', 'time_format', 'date_time_format',
+                 'strikethrough', 'italic', 'fill_pattern_type', 'border_type')
+
+    _attributes = tuple(sorted(__slots__))
+
+    # Styler -> openpyxl NamedStyle, shared by all workbooks. May be bounded by setting cache.maxsize
+    cache = StyleCache()
+
+    # attributes tuple -> interned FrozenStyler
+    _interned: 'WeakValueDictionary[tuple, FrozenStyler]' = WeakValueDictionary()
+    _interned_lock = RLock()
 
     def __init__(self,
                  bg_color: Optional[str] = None,
@@ -137,8 +154,9 @@ class Styler:
 
         if isinstance(border_type, set):
             self.border_type = {border_location: utils.borders.thin for border_location in border_type}
-        elif isinstance(border_type, dict):
-            self.border_type = border_type
+        elif isinstance(border_type, Mapping):
+            # copied, so styles created from another style (ie by evolve) don't share its borders
+            self.border_type = dict(border_type)
         else:
             self.border_type = {
                 utils.border_locations.top: border_type,
@@ -154,22 +172,73 @@ class Styler:
             self.fill_pattern_type = None
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+        return self is other or (isinstance(other, Styler) and self._as_dict() == other._as_dict())
 
     def __hash__(self):
-        return hash(tuple((k, v) if not isinstance(v, (dict, set)) else hash(tuple(v.items()))
-                          for k, v in sorted(self.__dict__.items())))
+        return hash(tuple((k, v) if not isinstance(v, (Mapping, set)) else hash(tuple(v.items()))
+                          for k, v in self._as_dict().items()))
 
     def __add__(self, other):
-        default = Styler().__dict__
-        d = dict(self.__dict__)
-        for k, v in other.__dict__.items():
+        default = Styler()._as_dict()
+        d = self._as_dict()
+        for k, v in other._as_dict().items():
             if v != default[k]:
                 d[k] = v
         return Styler(**d)
 
     def __repr__(self):
-        return pformat(self.__dict__)
+        return pformat(self._as_dict())
+
+    def _as_dict(self) -> Dict[str, Any]:
+        return {attr: getattr(self, attr) for attr in self._attributes}
+
+    def evolve(self, **changes) -> 'Styler':
+        """
+        .. versionadded:: 4.3
+
+        Returns a copy of this style with the provided attributes changed, leaving this object untouched.
+        For example:
+
+        .. code-block:: python
+
+            Styler(bg_color='yellow', bold=True).evolve(bold=False)
+
+        will return
+
+        .. code-block:: python
+
+            Styler(bg_color='yellow', bold=False)
+
+        :param changes: Any argument :class:`Styler` accepts
+        :return: A new :class:`Styler` (or an interned one if this object is interned)
+        :rtype: :class:`Styler`
+        """
+
+        kwargs = self._as_dict()
+        if kwargs['border_type'] is None:
+            # border_type=utils.borders.default_grid is stored as no border and no fill
+            kwargs.update(border_type=utils.borders.default_grid, bg_color=None,
+                          fill_pattern_type=utils.fill_pattern_types.solid)
+        kwargs.update(changes)
+        return Styler(**kwargs)
+
+    def intern(self) -> 'FrozenStyler':
+        """
+        .. versionadded:: 4.3
+
+        Returns the immutable, interned equivalent of this style. Equal styles are interned to the very same object,
+        so interned styles can be shared freely (copying them returns the same object), compared by identity and
+        their hash is calculated only once.
+
+        :rtype: :class:`FrozenStyler`
+        """
+
+        key = tuple((k, tuple(sorted(v.items())) if isinstance(v, Mapping) else v) for k, v in self._as_dict().items())
+        with self._interned_lock:
+            interned = self._interned.get(key)
+            if interned is None:
+                interned = self._interned[key] = FrozenStyler._from_dict(self._as_dict())
+        return interned
 
     def generate_comment(self):
         if any((self.comment_author, self.comment_text)):
@@ -181,30 +250,29 @@ class Styler:
         return cls(bold=True)
 
     def to_openpyxl_style(self):
-        try:
-            openpyxl_style = self.cache[self]
-        except KeyError:
-            if isinstance(self.border_type, str):
-                side = Side(border_style=self.border_type, color=utils.colors.black)
-                border = Border(left=side, right=side, top=side, bottom=side)
-            else:
-                border = Border(**{border_location: Side(border_style=border_type, color=utils.colors.black)
-                                   for border_location, border_type in self.border_type.items()})
-
-            openpyxl_style = self.cache[self] = NamedStyle(
-                name=str(hash(self)),
-                font=Font(name=self.font, size=self.font_size, color=OpenPyColor(self.font_color),
-                          bold=self.bold, underline=self.underline, strikethrough=self.strikethrough,
-                          italic=self.italic),
-                fill=PatternFill(patternType=self.fill_pattern_type, fgColor=self.bg_color),
-                alignment=Alignment(horizontal=self.horizontal_alignment, vertical=self.vertical_alignment,
-                                    wrap_text=self.wrap_text, shrink_to_fit=self.shrink_to_fit,
-                                    indent=self.indent, text_rotation=self.text_rotation),
-                border=border,
-                number_format=self.number_format,
-                protection=Protection(locked=self.protection)
-            )
-        return openpyxl_style
+        return self.cache.get_or_create(self, self._create_openpyxl_style)
+
+    def _create_openpyxl_style(self) -> NamedStyle:
+        if isinstance(self.border_type, str):
+            side = Side(border_style=self.border_type, color=utils.colors.black)
+            border = Border(left=side, right=side, top=side, bottom=side)
+        else:
+            border = Border(**{border_location: Side(border_style=border_type, color=utils.colors.black)
+                               for border_location, border_type in self.border_type.items()})
+
+        return NamedStyle(
+            name=str(hash(self)),
+            font=Font(name=self.font, size=self.font_size, color=OpenPyColor(self.font_color),
+                      bold=self.bold, underline=self.underline, strikethrough=self.strikethrough,
+                      italic=self.italic),
+            fill=PatternFill(patternType=self.fill_pattern_type, fgColor=self.bg_color),
+            alignment=Alignment(horizontal=self.horizontal_alignment, vertical=self.vertical_alignment,
+                                wrap_text=self.wrap_text, shrink_to_fit=self.shrink_to_fit,
+                                indent=self.indent, text_rotation=self.text_rotation),
+            border=border,
+            number_format=self.number_format,
+            protection=Protection(locked=self.protection)
+        )
 
     @classmethod
     def from_openpyxl_style(cls, openpyxl_style: Cell, theme_colors: List[str],
@@ -322,6 +390,63 @@ class Styler:
     create_style = to_openpyxl_style
 
 
+class FrozenStyler(Styler):
+    """
+    .. versionadded:: 4.3
+
+    An immutable :class:`Styler`. Should not be created directly, but through :meth:`Styler.intern`.
+    Use :meth:`Styler.evolve` to get a modified copy.
+    """
+
+    __slots__ = ('_hash', '__weakref__')
+
+    @classmethod
+    def _from_dict(cls, attributes: Dict[str, Any]) -> 'FrozenStyler':
+        frozen_styler = cls.__new__(cls)
+        for attr, value in attributes.items():
+            # border_type is the only mutable attribute, it is kept as a read-only view of a copy
+            if isinstance(value, Mapping):
+                value = MappingProxyType(dict(value))
+            object.__setattr__(frozen_styler, attr, value)
+        object.__setattr__(frozen_styler, '_hash', Styler.__hash__(frozen_styler))
+        return frozen_styler
+
+    def __setattr__(self, key, value):
+        raise AttributeError('{} is immutable, use evolve() to get a modified copy'.format(type(self).__name__))
+
+    def __delattr__(self, item):
+        raise AttributeError('{} is immutable, use evolve() to get a modified copy'.format(type(self).__name__))
+
+    def __hash__(self):
+        return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __repr__(self):
+        return pformat(self._as_mutable_dict())
+
+    def __reduce__(self):
+        return _unpickle_frozen_styler, (self._as_mutable_dict(),)
+
+    def _as_mutable_dict(self) -> Dict[str, Any]:
+        # with border_type as a dict, the way Styler keeps it (mappingproxy objects can't be pickled)
+        return {attr: dict(value) if isinstance(value, Mapping) else value for attr, value in self._as_dict().items()}
+
+    def evolve(self, **changes) -> 'FrozenStyler':
+        return super().evolve(**changes).intern()
+
+    def intern(self) -> 'FrozenStyler':
+        return self
+
+
+def _unpickle_frozen_styler(attributes: Dict[str, Any]) -> FrozenStyler:
+    return Styler.intern(FrozenStyler._from_dict(attributes))
+
+
 class ColorScaleConditionalFormatRule:
     """Creates a color scale conditional format rule. Wraps openpyxl's ColorScaleRule.
     Mostly should not be used directly, but through StyleFrame.add_color_scale_conditional_formatting
@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Type
+
+import numpy as np
+import pandas as pd
+
+from styleframe.container import Container
+from styleframe.styler import FrozenStyler
+
+if TYPE_CHECKING:
+    from styleframe.style_frame import StyleFrame
+
+
+class CompiledTemplate:
+    """
+    .. versionadded:: 4.3
+
+    An Excel template that was read once and can be filled with different data any number of times, see
+    :meth:`.StyleFrame.compile_template`.
+
+    The template is kept as its values and a grid of ids of its distinct styles (interned, immutable
+    :class:`.Styler` objects), along with its headers, index, columns widths and rows heights. Rendering only creates
+    the containers of the template's cells and fills them with the data, as :meth:`.StyleFrame.read_excel_as_template`
+    does, without reading the workbook again.
+
+    Compiled templates can be pickled, ie to be sent to the processes of a :class:`concurrent.futures.ProcessPoolExecutor`.
+    """
+
+    def __init__(self, template_sf: 'StyleFrame'):
+        self._style_frame_class: Type['StyleFrame'] = type(template_sf)
+        data_df = template_sf.data_df
+        # the template's distinct styles, the grids refer to them by their position
+        self._styles: List[FrozenStyler] = []
+        style_ids: Dict[FrozenStyler, int] = {}
+
+        def get_style_id(container: Container) -> int:
+            style = container.style.intern()
+            style_id = style_ids.get(style)
+            if style_id is None:
+                style_id = style_ids[style] = len(self._styles)
+                self._styles.append(style)
+            return style_id
+
+        self._values = np.empty(data_df.shape, dtype=object)
+        self._style_ids = np.empty(data_df.shape, dtype=np.int32)
+        for col_index in range(data_df.shape[1]):
+            for row_index, container in enumerate(data_df.iloc[:, col_index]):
+                self._values[row_index, col_index] = container.value
+                self._style_ids[row_index, col_index] = get_style_id(container)
+        self._columns = [(col.value, get_style_id(col)) for col in data_df.columns]
+        self._index = [(index.value, get_style_id(index)) for index in data_df.index]
+        self._index_name = data_df.index.name
+        self._columns_width = OrderedDict(template_sf._columns_width)
+        self._rows_height = OrderedDict(template_sf._rows_height)
+
+    def _new_template_frame(self) -> 'StyleFrame':
+        styles = self._styles
+        data_df = pd.DataFrame({col_index: [Container(value, styles[style_id])
+                                            for value, style_id in zip(self._values[:, col_index],
+                                                                       self._style_ids[:, col_index])]
+                                for col_index in range(len(self._columns))},
+                               index=pd.Index([Container(value, styles[style_id]) for value, style_id in self._index],
+                                              name=self._index_name, dtype=object))
+        data_df.columns = [Container(value, styles[style_id]) for value, style_id in self._columns]
+        sf = self._style_frame_class(data_df)
+        sf._columns_width = OrderedDict(self._columns_width)
+        sf._rows_height = OrderedDict(self._rows_height)
+        sf._has_custom_headers_style = True
+        return sf
+
+    def render(self, df: pd.DataFrame, use_df_boundaries: bool = False) -> 'StyleFrame':
+        """Creates a StyleFrame of the template filled with the data of the given DataFrame, the same one
+        :meth:`.StyleFrame.read_excel_as_template` would create.
+
+        :param df: The data to apply to the template.
+        :type df: :class:`pandas.DataFrame`
+        :param bool use_df_boundaries: If ``True`` the template will be cut according to the boundaries of the given DataFrame.
+
+        :return: StyleFrame object
+        :rtype: :class:`.StyleFrame`
+        """
+
+        sf = self._new_template_frame()
+        self._style_frame_class._fill_template(sf, df, use_df_boundaries)
+        return sf
+
+    def render_to_excel(self, df: pd.DataFrame, excel_writer: Any = 'output.xlsx', use_df_boundaries: bool = False,
+                        **kwargs) -> Any:
+        """Renders the template with the given DataFrame (see :meth:`render`) and exports it.
+
+        :param df: The data to apply to the template.
+        :type df: :class:`pandas.DataFrame`
+        :param excel_writer: Anything :meth:`.StyleFrame.to_excel` accepts as ``excel_writer``
+        :param bool use_df_boundaries: If ``True`` the template will be cut according to the boundaries of the given DataFrame.
+        :param kwargs: Any other argument :meth:`.StyleFrame.to_excel` accepts
+        :return: What :meth:`.StyleFrame.to_excel` returns, the writer must be closed to save the workbook
+        """
+
+        return self.render(df, use_df_boundaries).to_excel(excel_writer, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def columns(self) -> List[Any]:
+        """The template's headers."""
+
+        return [value for value, _ in self._columns]
+
+    @property
+    def styles_count(self) -> int:
+        """The number of the template's distinct styles."""
+
+        return len(self._styles)
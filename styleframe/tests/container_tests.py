@@ -1,6 +1,8 @@
+import pickle
 import unittest
 
-from styleframe import Container
+from styleframe import Container, Styler
+from styleframe.container import LazyStyle
 
 
 class ContainerTest(unittest.TestCase):
@@ -103,3 +105,32 @@ class ContainerTest(unittest.TestCase):
         self.assertEqual(bool(self.cont_1), bool(self.cont_1.value))
         self.assertEqual(bool(self.cont_true), True)
         self.assertEqual(bool(self.cont_true), bool(self.cont_true.value))
+
+    def test_lazy_style(self):
+        created = []
+
+        def create_style():
+            created.append(None)
+            return Styler(bold=True)
+
+        lazy_style = LazyStyle(create_style)
+        containers = [Container(1), Container(2)]
+        for container in containers:
+            container._set_lazy_style(lazy_style)
+        self.assertEqual(created, [])
+        self.assertIs(containers[0].style, containers[1].style)
+        self.assertEqual(len(created), 1)
+        self.assertTrue(containers[0].style.bold)
+
+        container = Container(3)
+        container._set_lazy_style(LazyStyle(lambda: Styler(italic=True)))
+        self.assertTrue(pickle.loads(pickle.dumps(container)).style.italic)
+
+        container._set_lazy_style(LazyStyle(lambda: Styler(italic=True)))
+        container.style = Styler(bold=True)
+        self.assertNotIn('_lazy_style', vars(container))
+        unpickled_container = pickle.loads(pickle.dumps(container))
+        self.assertTrue(unpickled_container.style.bold)
+        self.assertFalse(unpickled_container.style.italic)
+        with self.assertRaises(AttributeError):
+            container.missing_attribute
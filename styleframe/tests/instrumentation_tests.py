@@ -0,0 +1,61 @@
+import unittest
+
+from io import BytesIO
+
+from styleframe import NativeExcelWriter, PhaseTiming, StyleFrame, Styler
+from styleframe.instrumentation import Instrumentation
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        self.sf = StyleFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']}, Styler(font='Arial'))
+        self.sf.apply_column_style('a', Styler(bold=True))
+
+    def test_disabled_by_default(self):
+        instrumentation = Instrumentation()
+        self.assertFalse(instrumentation.enabled)
+        timer = instrumentation.timer('to_excel')
+        self.assertFalse(timer)
+        timer.lap('values', cells=1)
+
+    def test_callbacks(self):
+        instrumentation = Instrumentation()
+        timings = []
+        instrumentation.add_callback(timings.append)
+        self.assertTrue(instrumentation.enabled)
+        timer = instrumentation.timer('to_excel', sheet_name='Sheet1')
+        timer.lap('values', cells=6)
+        timer.lap('styling')
+        self.assertEqual([(timing.operation, timing.phase, timing.stats) for timing in timings],
+                         [('to_excel', 'values', {'sheet_name': 'Sheet1', 'cells': 6}),
+                          ('to_excel', 'styling', {'sheet_name': 'Sheet1'})])
+        self.assertTrue(all(isinstance(timing, PhaseTiming) and timing.duration >= 0 for timing in timings))
+
+        instrumentation.remove_callback(timings.append)
+        self.assertFalse(instrumentation.enabled)
+        with self.assertRaises(ValueError):
+            instrumentation.remove_callback(timings.append)
+
+    def test_to_excel_phases(self):
+        with StyleFrame.instrumentation.record() as timings:
+            self.sf.to_excel(BytesIO(), best_fit='b').close()
+        self.assertFalse(StyleFrame.instrumentation.enabled)
+        self.assertEqual([(timing.operation, timing.phase) for timing in timings],
+                         [('to_excel', 'values'), ('to_excel', 'pandas_to_excel'), ('to_excel', 'best_fit'),
+                          ('to_excel', 'dimensions'), ('to_excel', 'style_resolution'), ('to_excel', 'styling'),
+                          ('to_excel', 'sheet_settings'), ('save', 'save')])
+        phases = {timing.phase: timing.stats for timing in timings}
+        self.assertEqual(phases['values'], {'sheet_name': 'Sheet1', 'rows': 3, 'columns': 2, 'cells': 6})
+        self.assertEqual(phases['style_resolution']['unique_styles'], 2)
+        self.assertEqual(phases['save'], {'writer': 'openpyxl', 'sheets': 1})
+
+    def test_native_and_read_excel_phases(self):
+        output = BytesIO()
+        with StyleFrame.instrumentation.record() as timings:
+            self.sf.to_excel(NativeExcelWriter(output)).close()
+            StyleFrame.read_excel(BytesIO(output.getvalue()), read_style=True)
+        self.assertEqual([(timing.operation, timing.phase) for timing in timings],
+                         [('to_excel', 'values'), ('to_excel', 'dimensions'), ('to_excel', 'style_resolution'),
+                          ('to_excel', 'styling'), ('to_excel', 'sheet_settings'), ('save', 'save'),
+                          ('read_excel', 'parse'), ('read_excel', 'read_style')])
+        self.assertEqual(timings[-1].stats, {'sheet_name': 0, 'cells': 6, 'unique_styles': 2})
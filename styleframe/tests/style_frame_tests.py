@@ -1,15 +1,25 @@
+import asyncio
+import datetime as dt
 import inspect
 import os
+import pickle
+import threading
+import time
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from io import BytesIO
 
 import numpy as np
 import pandas as pd
 
+from openpyxl import load_workbook, Workbook
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 from pandas.testing import assert_frame_equal
 
-from styleframe import Container, StyleFrame, Styler, utils
+from styleframe import Container, NativeExcelWriter, StyleFrame, Styler, utils
 from styleframe.tests import TEST_FILENAME
 
 
@@ -73,6 +83,26 @@ class StyleFrameTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             StyleFrame({}, styler_obj=1)
 
+    def test_init_shares_default_style(self):
+        styler_obj = Styler(bg_color=utils.colors.yellow)
+        sf = StyleFrame(pd.DataFrame({'a': [1, 2], 'b': [pd.Timestamp('2000-01-01'), dt.time(10)]}), styler_obj=styler_obj)
+        containers = list(sf.data_df['a']) + list(sf.data_df['b']) + list(sf.columns) + list(sf.index)
+        self.assertTrue(all(container.style is sf._default_style for container in containers))
+        self.assertEqual(sf._default_style, styler_obj)
+
+        # changing the style passed to the constructor or restyling a cell leaves the other cells untouched
+        styler_obj.bold = True
+        sf.apply_style_by_indexes(sf.index[0], self.styler_obj_1, cols_to_style='a')
+        self.assertEqual(sf.loc[1, 'a'].style, Styler(bg_color=utils.colors.yellow))
+        with self.assertRaises(AttributeError):
+            sf.loc[1, 'a'].style.bold = True
+
+        sf = StyleFrame({'a': [1, 2], 'b': [pd.Timestamp('2000-01-01'), dt.date(2000, 1, 2)]})
+        self.assertIs(sf.loc[0, 'a'].style, sf.loc[1, 'a'].style)
+        self.assertIs(sf.loc[0, 'a'].style, sf.columns[0].style)
+        self.assertEqual(sf.loc[0, 'b'].style, Styler(number_format=utils.number_formats.default_date_time_format))
+        self.assertEqual(sf.loc[1, 'b'].style, Styler(number_format=utils.number_formats.default_date_format))
+
     def test_init_dataframe(self):
         self.assertIsInstance(StyleFrame(pd.DataFrame({'a': [1, 2, 3], 'b': [1, 2, 3]})), StyleFrame)
         self.assertIsInstance(StyleFrame(pd.DataFrame()), StyleFrame)
@@ -176,6 +206,28 @@ class StyleFrameTest(unittest.TestCase):
         self.assertTrue(all(sheet.cell(row=i, column=1)._style == Styler.combine(self.default_styler_obj, self.styler_obj_1).to_openpyxl_style()._style
                             for i in range(2, len(self.sf))))
 
+    def test_apply_column_style_date_time_values(self):
+        sf = StyleFrame({'a': [dt.date(2020, 1, 1), pd.Timestamp('2020-01-01 10:00'), dt.time(10, 30), 1]})
+        sf.apply_column_style(cols_to_style='a', styler_obj=Styler(bold=True))
+        self.assertEqual([container.style.number_format for container in sf.data_df['a']],
+                         [utils.number_formats.date, utils.number_formats.date_time,
+                          utils.number_formats.time_24_hours, utils.number_formats.general])
+        self.assertTrue(all(container.style.bold for container in sf.data_df['a']))
+
+    def test_to_excel_date_time_formats(self):
+        sf = StyleFrame({'datetimes': pd.date_range('2020-01-01', periods=3),
+                         'mixed': [dt.date(2020, 1, 1), dt.datetime(2020, 1, 1, 10), dt.time(10, 30)],
+                         'hyperlinks': ['a', '=HYPERLINK("http://example.com", "b")', None]},
+                        Styler(date_format='DD/MM', time_format='hh', date_time_format='YYYY-MM-DD hh'))
+        sf.to_excel(self.ew)
+        sheet = self.ew.sheets['Sheet1']
+        self.assertEqual([sheet.cell(row=row, column=1).number_format for row in range(2, 5)],
+                         ['YYYY-MM-DD hh'] * 3)
+        self.assertEqual([sheet.cell(row=row, column=2).number_format for row in range(2, 5)],
+                         ['DD/MM', 'YYYY-MM-DD hh', 'hh'])
+        self.assertEqual([sheet.cell(row=row, column=3).font.u for row in range(2, 5)],
+                         [None, utils.underline.single, None])
+
     def test_apply_style_by_indexes_single_col(self):
         with self.assertRaises(TypeError):
             # noinspection PyTypeChecker
@@ -364,6 +416,126 @@ class StyleFrameTest(unittest.TestCase):
             for excel_cell, self_cell in zip(row_in_excel[1:], row_in_self[1:]):
                 self.assertEqual(self_cell.style, Styler.from_openpyxl_style(excel_cell.style, []))
 
+    def save_styled_grid(self):
+        """Saves a sheet whose headers are h1-h4 and every other cell's value and font size are row * 10 + column"""
+
+        workbook = Workbook()
+        sheet = workbook.active
+        for col_index in range(1, 5):
+            sheet.cell(row=1, column=col_index, value='h{}'.format(col_index)).font = Font(size=col_index)
+            sheet.column_dimensions[get_column_letter(col_index)].width = col_index * 5
+            for row_index in range(2, 9):
+                sheet.cell(row=row_index, column=col_index, value=row_index * 10 + col_index).font = \
+                    Font(size=row_index * 10 + col_index)
+        workbook.save(TEST_FILENAME)
+
+    def assert_styles_match_values(self, sf, index=False):
+        for col in sf.columns:
+            self.assertEqual(col.style.font_size, int(col.value[1:]))
+            for container in sf[col]:
+                if not pd.isna(container.value):
+                    self.assertEqual(container.style.font_size, container.value)
+        if index:
+            for container in sf.index:
+                if not pd.isna(container.value):
+                    self.assertEqual(container.style.font_size, container.value)
+
+    def test_read_excel_with_style_window(self):
+        self.save_styled_grid()
+        for kwargs, columns, first_value, rows in (({'usecols': 'B,D:D'}, ['h2', 'h4'], 22, 7),
+                                                   ({'usecols': [0, 2]}, ['h1', 'h3'], 21, 7),
+                                                   ({'usecols': ['h3', 'h2']}, ['h2', 'h3'], 22, 7),
+                                                   ({'usecols': lambda name: name != 'h1'}, ['h2', 'h3', 'h4'], 22, 7),
+                                                   ({'nrows': 3}, ['h1', 'h2', 'h3', 'h4'], 21, 3),
+                                                   ({'skiprows': [1, 3], 'nrows': 2}, ['h1', 'h2', 'h3', 'h4'], 31,
+                                                    2),
+                                                   ({'skiprows': lambda row: row in (1, 2)},
+                                                    ['h1', 'h2', 'h3', 'h4'], 41, 5),
+                                                   ({'index_col': 0}, ['h2', 'h3', 'h4'], 22, 7),
+                                                   ({'index_col': 1, 'usecols': 'B:D', 'skiprows': [2]},
+                                                    ['h2', 'h4'], 22, 6)):
+            sf_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True, **kwargs)
+            self.assertEqual([col.value for col in sf_from_excel.columns], columns, kwargs)
+            self.assertEqual(len(sf_from_excel), rows, kwargs)
+            self.assertEqual(sf_from_excel.iloc[0, 0].value, first_value, kwargs)
+            self.assert_styles_match_values(sf_from_excel, index='index_col' in kwargs)
+            for col in columns:
+                self.assertEqual(sf_from_excel._columns_width[col], int(col[1:]) * 5, kwargs)
+
+        sf_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True, skiprows=2, header=None)
+        self.assertEqual(sf_from_excel.iloc[0, 0].value, 31)
+        self.assertEqual(sf_from_excel.iloc[0, 0].style.font_size, 31)
+
+        with self.assertRaises(ValueError):
+            StyleFrame.read_excel(TEST_FILENAME, read_style=True, usecols=['h5'])
+
+    def test_read_excel_with_style_usecols_names_multiple_sheets(self):
+        excel_writer = NativeExcelWriter(TEST_FILENAME)
+        StyleFrame({'a': [1], 'x': [2]}).to_excel(excel_writer, sheet_name='first')
+        StyleFrame({'x': [3], 'b': [4]}).to_excel(excel_writer, sheet_name='second')
+        excel_writer.close()
+
+        sfs_from_excel = StyleFrame.read_excel(TEST_FILENAME, sheet_name=None, read_style=True, usecols=['x'])
+        self.assertEqual([list(sf['x']) for sf in sfs_from_excel.values()], [[2], [3]])
+
+    def test_iter_excel(self):
+        self.save_styled_grid()
+        workbook = load_workbook(TEST_FILENAME)
+        # an empty row in the middle, that must be kept, and trailing empty rows, that must not
+        for col_index in range(1, 5):
+            workbook.active.cell(row=5, column=col_index).value = None
+        workbook.active.cell(row=12, column=1).font = Font(bold=True)
+        workbook.save(TEST_FILENAME)
+
+        for kwargs in ({}, {'usecols': ['h2', 'h4']}, {'index_col': 0, 'lazy_styles': True}):
+            sf_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True, **kwargs)
+            chunks = list(StyleFrame.iter_excel(TEST_FILENAME, chunksize=3, read_style=True, **kwargs))
+            self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1], kwargs)
+            for chunk in chunks:
+                self.assertEqual([col.value for col in chunk.columns], [col.value for col in sf_from_excel.columns])
+                self.assertEqual(chunk._columns_width, sf_from_excel._columns_width)
+                self.assert_styles_match_values(chunk, index='index_col' in kwargs)
+            # each chunk's types are inferred separately
+            assert_frame_equal(pd.concat([chunk.data_df for chunk in chunks]).map(lambda cell: cell.value)
+                               .reset_index().astype(float),
+                               sf_from_excel.data_df.map(lambda cell: cell.value).reset_index().astype(float))
+            self.assertTrue(pd.isna(chunks[1].iloc[0, 0].value))
+
+        chunks = list(StyleFrame.iter_excel(TEST_FILENAME, chunksize=4))
+        self.assertEqual(list(chunks[1].index), [4, 5, 6])
+        self.assertEqual(list(chunks[1]['h1']), [61, 71, 81])
+
+        with self.assertRaises(ValueError):
+            next(StyleFrame.iter_excel(TEST_FILENAME, chunksize=0))
+        with self.assertRaises(ValueError):
+            next(StyleFrame.iter_excel(TEST_FILENAME, chunksize=2, nrows=3))
+
+    def test_read_excel_multiple_sheets(self):
+        self.apply_column_style(cols_to_style=['a'])
+        other_sf = StyleFrame({'x': ['a', 'b']}, styler_obj=Styler(bg_color=utils.colors.green))
+        StyleFrame.to_excel_many({'first': self.sf, 'second': other_sf}, TEST_FILENAME, workers=1)
+
+        for workers in (1, 2):
+            sfs_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True, read_comments=True,
+                                                   sheet_name=None, workers=workers)
+            self.assertEqual(list(sfs_from_excel), ['first', 'second'])
+            for col in self.sf.columns:
+                self.assertEqual(list(sfs_from_excel['first'][col]), list(self.sf[col]))
+                self.assertEqual(list(sfs_from_excel['first'][col].style), list(self.sf[col].style))
+            self.assertEqual(list(sfs_from_excel['second']['x']), ['a', 'b'])
+            self.assertEqual(sfs_from_excel['second'].loc[0, 'x'].style.bg_color, utils.colors.green)
+
+        sfs_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True, sheet_name=[1, 'first', 1],
+                                               lazy_styles=True)
+        self.assertEqual(list(sfs_from_excel), [1, 'first'])
+        self.assertEqual(list(sfs_from_excel[1]['x']), ['a', 'b'])
+        self.assertEqual(list(StyleFrame.read_excel(TEST_FILENAME, sheet_name=None)), ['first', 'second'])
+
+        with self.assertRaises(TypeError):
+            StyleFrame.read_excel(TEST_FILENAME, read_style=True, sheet_name=('first', 'second'))
+        with self.assertRaises(ValueError):
+            StyleFrame.read_excel(TEST_FILENAME, read_style=True, sheet_name=None, workers=0)
+
     def test_read_excel_with_style_openpyxl_objects(self):
         self.export_and_get_default_sheet(save=True)
         sf_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True, use_openpyxl_styles=True)
@@ -438,6 +610,49 @@ class StyleFrameTest(unittest.TestCase):
                             for row_in_excel, row_in_self in zip(rows_in_excel, rows_in_self)
                             for excel_cell, self_cell in zip(row_in_excel[1:], row_in_self[1:])))
 
+    def test_read_excel_with_style_comments_openpyxl_objects_comments(self):
+        self.apply_column_style(cols_to_style=['a'])
+        self.export_and_get_default_sheet(save=True)
+        sf_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True, read_comments=True,
+                                              use_openpyxl_styles=True)
+        self.assertEqual(sf_from_excel.loc[0, 'a'].style.comment.text, 'styler_obj_1 comment')
+        self.assertEqual(sf_from_excel.loc[0, 'a'].style.font.name, 'Impact')
+        self.assertIsNone(sf_from_excel.loc[0, 'b'].style.comment)
+
+        with self.assertRaises(ValueError):
+            StyleFrame.read_excel(TEST_FILENAME, read_style=True, engine='calamine')
+
+    def test_read_excel_with_style_shares_stylers(self):
+        self.apply_column_style(cols_to_style=['a'])
+        self.export_and_get_default_sheet(save=True)
+        sf_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True)
+        self.assertEqual(len({id(container.style) for container in sf_from_excel['a']}), 1)
+        self.assertIs(sf_from_excel.loc[0, 'b'].style, sf_from_excel.loc[1, 'index'].style)
+        self.assertIsNot(sf_from_excel.loc[0, 'a'].style, sf_from_excel.loc[0, 'b'].style)
+
+        # cells with comments get their own Styler
+        sf_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True, read_comments=True)
+        self.assertEqual(sf_from_excel.loc[0, 'a'].style.comment_text, 'styler_obj_1 comment')
+        self.assertIsNone(sf_from_excel.loc[0, 'b'].style.comment_text)
+
+    def test_read_excel_with_lazy_styles(self):
+        self.apply_column_style(cols_to_style=['a'])
+        self.export_and_get_default_sheet(save=True)
+        sf_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True, lazy_styles=True)
+        self.assertFalse(any('style' in vars(container) for container in sf_from_excel['a']))
+
+        eager_sf_from_excel = StyleFrame.read_excel(TEST_FILENAME, read_style=True)
+        for col in sf_from_excel.columns:
+            self.assertEqual(list(sf_from_excel[col].style), list(eager_sf_from_excel[col].style))
+        self.assertEqual(sf_from_excel.columns[0].style, eager_sf_from_excel.columns[0].style)
+        self.assertIs(sf_from_excel.loc[0, 'b'].style, sf_from_excel.loc[1, 'index'].style)
+
+        # restyling some of the cells replaces their lazy styles, the StyleFrame can still be pickled
+        sf_from_excel.apply_style_by_indexes([0], self.styler_obj_2, cols_to_style='a')
+        unpickled_sf = pickle.loads(pickle.dumps(sf_from_excel))
+        self.assertEqual(unpickled_sf.loc[0, 'a'].style, self.styler_obj_2)
+        self.assertEqual(list(unpickled_sf['b'].style), list(eager_sf_from_excel['b'].style))
+
     def test_read_excel_with_style_header_arg_none(self):
         self.sf = StyleFrame({0: ['A1', 'A2', 'A3', 'A4', 'A5']})
         self.sf.apply_style_by_indexes(self.sf[self.sf.data_df[0].isin(('A2', 'A5'))], Styler(bold=True))
@@ -617,6 +832,70 @@ class StyleFrameTest(unittest.TestCase):
                          )
         self.assertEqual(sf_from_template['A'].iloc[0].value, 1)
 
+    def test_read_excel_template_extends_last_row_and_column_styles(self):
+        template_sf = StyleFrame({'a': ['col_a_row_1', 'col_a_row_2'], 'b': ['col_b_row_1', 'col_b_row_2']},
+                                 styler_obj=self.styler_obj_1)
+        template_sf.apply_style_by_indexes(template_sf.index[-1], styler_obj=self.styler_obj_2)
+        template_sf.apply_headers_style(Styler(italic=True), cols_to_style='b')
+        template_sf.to_excel(TEST_FILENAME).close()
+
+        df = pd.DataFrame({'A': [1, 2, 3, 4], 'B': [5, 6, 7, 8], 'C': [9, 10, 11, 12]})
+        sf_from_template = StyleFrame.read_excel_as_template(path=TEST_FILENAME, df=df)
+        self.assertEqual([col.value for col in sf_from_template.columns], ['A', 'B', 'C'])
+        assert_frame_equal(sf_from_template.data_df, df, check_index_type=False, check_dtype=False,
+                           check_column_type=False)
+        self.assertEqual([index.value for index in sf_from_template.index], [0, 1, 2, 3])
+        self.assertTrue(sf_from_template.columns[2].style.italic)
+        for col in sf_from_template.columns:
+            styles = [container.style for container in sf_from_template[col]]
+            self.assertEqual(styles[0].bg_color, self.styler_obj_1.bg_color)
+            self.assertEqual(styles[1:], [styles[1]] * 3)
+            self.assertEqual(styles[1].bg_color, self.styler_obj_2.bg_color)
+
+        # more columns but fewer rows than the template
+        sf_from_template = StyleFrame.read_excel_as_template(path=TEST_FILENAME, df=df.iloc[:1])
+        self.assertEqual(len(sf_from_template), 2)
+        self.assertEqual(sf_from_template['C'].iloc[0].value, 9)
+        self.assertTrue(pd.isna(sf_from_template['C'].iloc[1].value))
+
+    def test_compile_template(self):
+        template_sf = StyleFrame({'a': ['col_a_row_1', 'col_a_row_2', 'col_a_row_3'],
+                                  'b': ['col_b_row_1', 'col_b_row_2', 'col_b_row_3']},
+                                 styler_obj=self.styler_obj_1)
+        template_sf.data_df.index[0].style = self.styler_obj_2
+        template_sf.apply_style_by_indexes(template_sf.index[-1], styler_obj=self.styler_obj_2)
+        template_sf.set_column_width('b', 30)
+        template_sf.to_excel(TEST_FILENAME, index=True).close()
+
+        template = pickle.loads(pickle.dumps(StyleFrame.compile_template(TEST_FILENAME, index_col=0,
+                                                                          read_comments=True)))
+        self.assertEqual(template.columns, ['a', 'b'])
+        self.assertEqual(len(template), 3)
+        for df, use_df_boundaries in ((pd.DataFrame({'A': [1, 2], 'B': [3, 4]}), True),
+                                      (pd.DataFrame({'A': [1, 2, 3, 4], 'B': [5, 6, 7, 8], 'C': [9, 10, 11, 12]}),
+                                       False)):
+            sf_from_template = StyleFrame.read_excel_as_template(TEST_FILENAME, df, use_df_boundaries, index_col=0,
+                                                                 read_comments=True)
+            rendered_sf = template.render(df, use_df_boundaries)
+            self.assertEqual([(col.value, col.style) for col in rendered_sf.columns],
+                             [(col.value, col.style) for col in sf_from_template.columns])
+            self.assertEqual([(index.value, index.style) for index in rendered_sf.index],
+                             [(index.value, index.style) for index in sf_from_template.index])
+            for col in rendered_sf.columns:
+                self.assertEqual([(cell.value, cell.style) for cell in rendered_sf[col]],
+                                 [(cell.value, cell.style) for cell in sf_from_template[col]])
+            self.assertEqual(rendered_sf._columns_width, sf_from_template._columns_width)
+            self.assertEqual(rendered_sf._rows_height, sf_from_template._rows_height)
+
+        # each render gets its own containers
+        template.render(pd.DataFrame({'A': ['changed']}))
+        self.assertEqual(template.render(pd.DataFrame({'A': [1]}))['b'].iloc[0].value, 'col_b_row_1')
+
+        template.render_to_excel(pd.DataFrame({'A': [1], 'B': [2]}), TEST_FILENAME).close()
+        sheet = load_workbook(TEST_FILENAME).active
+        self.assertEqual([cell.value for cell in sheet[2]], [1, 2])
+        self.assertEqual(sheet['A2'].fill.fgColor.rgb, self.styler_obj_1.bg_color)
+
     def test_row_indexes(self):
         self.assertEqual(self.sf.row_indexes, (1, 2, 3, 4))
 
@@ -690,3 +969,283 @@ class StyleFrameTest(unittest.TestCase):
         self.assertEqual(startcol, sig.parameters['startcol'].default)
         self.assertEqual(startrow, sig.parameters['startrow'].default)
         self.assertEqual(na_rep, sig.parameters['na_rep'].default)
+
+    def test_to_excel_streaming(self):
+        self.apply_column_style(cols_to_style=['a'])
+        self.sf.set_row_height(rows=2, height=20)
+        self.sf.to_excel(TEST_FILENAME, streaming=True, columns_and_rows_to_freeze='A2', row_to_add_filters=0).close()
+        streamed_sheet = load_workbook(TEST_FILENAME).active
+
+        self.assertEqual(streamed_sheet.freeze_panes, 'A2')
+        self.assertEqual(streamed_sheet.auto_filter.ref, 'A1:C1')
+        self.assertEqual(streamed_sheet.column_dimensions['A'].width, 10)
+        self.assertEqual(streamed_sheet.row_dimensions[2].height, 20)
+        self.assertEqual([col.value for col in next(streamed_sheet.iter_rows(max_row=1))],
+                         [col.value for col in self.sf.columns])
+
+        for row_index, index in enumerate(self.sf.data_df.index, start=2):
+            for col_index, column in enumerate(self.sf.columns, start=1):
+                excel_cell = streamed_sheet.cell(row=row_index, column=col_index)
+                self.assertEqual(excel_cell.value, self.sf.at[index, column].value)
+                self.assertEqual(Styler.from_openpyxl_style(excel_cell, [], excel_cell.comment),
+                                 self.sf.at[index, column].style)
+
+    def test_to_excel_best_fit(self):
+        sf = StyleFrame({'ints': [1, -2000], 'floats': [0.5, np.nan], 'strings': ['a', 'abcdef'],
+                         'mixed': ['ab', pd.Timestamp('2020-01-01')],
+                         'datetimes': pd.date_range('2020-01-01', periods=2),
+                         'timedeltas': pd.to_timedelta([1, 10], unit='D')})
+        sf.to_excel(TEST_FILENAME, best_fit=['ints', 'floats', 'strings', 'mixed', 'datetimes', 'timedeltas']).close()
+        sheet = load_workbook(TEST_FILENAME).active
+
+        for column_letter, longest_value in zip('ABCDEF', ('-2000', 'nan', 'abcdef', '2020-01-01 00:00:00',
+                                                          '2020-01-02 00:00:00', '10 days 00:00:00')):
+            self.assertAlmostEqual(sheet.column_dimensions[column_letter].width,
+                                   (len(longest_value) + StyleFrame.A_FACTOR) * StyleFrame.P_FACTOR)
+            self.assertFalse(sheet['{}2'.format(column_letter)].alignment.wrap_text)
+            self.assertFalse(sheet['{}2'.format(column_letter)].alignment.shrink_to_fit)
+        self.assertTrue(sf.loc[0, 'ints'].style.wrap_text)
+
+    def test_to_excel_index_columns_settings(self):
+        sf = StyleFrame({'a': ['x', 'longer value'], 'b': ['y', 'z'], 'c': [1, 2]})
+        sf.set_column_width('c', 30)
+        sf.add_color_scale_conditional_formatting(start_type=utils.conditional_formatting_types.num, start_value=0,
+                                                  start_color=utils.colors.red,
+                                                  end_type=utils.conditional_formatting_types.num, end_value=2,
+                                                  end_color=utils.colors.green, columns_range=['c'])
+        for streaming in (False, True):
+            sf.to_excel(TEST_FILENAME, index=True, best_fit='a', columns_to_hide='b', row_to_add_filters=0,
+                        streaming=streaming).close()
+            sheet = load_workbook(TEST_FILENAME).active
+
+            # the index is in column A, the settings of the columns are shifted by one column
+            self.assertAlmostEqual(sheet.column_dimensions['B'].width,
+                                   (len('longer value') + StyleFrame.A_FACTOR) * StyleFrame.P_FACTOR)
+            self.assertEqual([sheet.column_dimensions[column_letter].hidden for column_letter in 'ABCD'],
+                             [False, False, True, False])
+            self.assertEqual(sheet.column_dimensions['D'].width, 30)
+            self.assertEqual(sheet.auto_filter.ref, 'B1:D1')
+            self.assertEqual([str(cf_range.sqref) for cf_range in sheet.conditional_formatting], ['D1:D3'])
+
+    def test_to_excel_does_not_modify_style_frame(self):
+        self.sf.data_df.iloc[1, 0] = np.nan
+        headers_styles = [column.style for column in self.sf.columns]
+
+        for _ in range(2):
+            self.sf.to_excel(TEST_FILENAME, na_rep='-', best_fit='b').close()
+            sheet = load_workbook(TEST_FILENAME).active
+            self.assertEqual(sheet['A3'].value, '-')
+            self.assertTrue(sheet['A1'].font.b)
+
+        self.assertTrue(np.isnan(self.sf.data_df.iloc[1, 0]))
+        self.assertEqual([column.style for column in self.sf.columns], headers_styles)
+        self.assertFalse(self.sf._has_custom_headers_style)
+        self.assertEqual(len(self.sf._columns_width), 0)
+
+    def test_to_excel_split_sheets(self):
+        self.apply_column_style(cols_to_style=['a'])
+        self.sf.set_row_height(rows=[1, 3], height=20)
+        self.sf.to_excel(TEST_FILENAME, split_sheets=True, rows_per_sheet=2, columns_and_rows_to_freeze='A2',
+                         streaming=True).close()
+        workbook = load_workbook(TEST_FILENAME)
+
+        self.assertEqual(workbook.sheetnames, ['Sheet1_1', 'Sheet1_2'])
+        self.assertEqual([[cell.value for cell in row] for row in workbook['Sheet1_2'].iter_rows()],
+                         [['a', 'b', 'index'], ['col_a_row_3', 'col_b_row_3', 'col_c_row_3']])
+        for sheet in workbook:
+            self.assertEqual(sheet.freeze_panes, 'A2')
+            self.assertEqual(sheet.column_dimensions['A'].width, 10)
+            self.assertTrue(sheet['A1'].font.b)
+            self.assertEqual(sheet['A2'].font.name, 'Impact')
+            self.assertEqual(sheet.row_dimensions[1].height, 20)
+        self.assertEqual(workbook['Sheet1_1'].row_dimensions[3].height, 20)
+        self.assertIsNone(workbook['Sheet1_2'].row_dimensions[3].height)
+
+        with self.assertRaises(ValueError):
+            self.sf.to_excel(TEST_FILENAME, split_sheets=True, rows_per_sheet=0)
+
+    def test_to_excel_too_many_rows(self):
+        # only one data row fits below the header when starting at the sheet's last 2 rows
+        with self.assertRaises(ValueError):
+            self.sf.to_excel(self.ew, startrow=1048574)
+
+        self.sf.to_excel(self.ew, startrow=1048574, split_sheets=True)
+        self.assertEqual(list(self.ew.sheets), ['Sheet1_1', 'Sheet1_2', 'Sheet1_3'])
+
+    def test_to_excel_stream(self):
+        chunks = (pd.DataFrame({'a': range(first_row, first_row + 2), 'b': ['x', 'y']}) for first_row in range(0, 6, 2))
+        StyleFrame.to_excel_stream(chunks, TEST_FILENAME, styler_obj=self.default_styler_obj,
+                                   column_styles={'a': self.styler_obj_1}, columns_width={'b': 30},
+                                   row_style_fn=lambda row: self.styler_obj_2 if row['a'] == 3 else None,
+                                   columns_and_rows_to_freeze='A2').close()
+        sheet = load_workbook(TEST_FILENAME).active
+
+        self.assertEqual([[cell.value for cell in row] for row in sheet.iter_rows()],
+                         [['a', 'b'], [0, 'x'], [1, 'y'], [2, 'x'], [3, 'y'], [4, 'x'], [5, 'y']])
+        self.assertTrue(sheet['A1'].font.b)
+        self.assertEqual(sheet.freeze_panes, 'A2')
+        self.assertEqual(sheet.column_dimensions['B'].width, 30)
+        self.assertEqual([sheet.cell(row=row, column=1).font.name for row in range(2, 8)],
+                         ['Impact', 'Impact', 'Impact', self.styler_obj_2.font, 'Impact', 'Impact'])
+        self.assertEqual(sheet['B5'].fill.fgColor.rgb, sheet['A5'].fill.fgColor.rgb)
+        self.assertEqual(sheet['B5'].comment.text, 'styler_obj_2 comment')
+
+        with self.assertRaises(ValueError):
+            StyleFrame.to_excel_stream([pd.DataFrame({'a': [1]}), pd.DataFrame({'b': [1]})], TEST_FILENAME)
+
+    def test_to_excel_file_like(self):
+        self.apply_column_style(cols_to_style=['a'])
+        outputs = [BytesIO() for _ in range(3)]
+        excel_writers = [outputs[0], StyleFrame.ExcelWriter(outputs[1], compression_level=1),
+                         NativeExcelWriter(outputs[2], compression_level=9)]
+        for output, excel_writer in zip(outputs, excel_writers):
+            self.sf.to_excel(excel_writer).close()
+            sheet = load_workbook(output).active
+            self.assertEqual([[cell.value for cell in row] for row in sheet.iter_rows(max_row=2)],
+                             [['a', 'b', 'index'], ['col_a_row_1', 'col_b_row_1', 'col_c_row_1']])
+            self.assertEqual(sheet['A2'].font.name, 'Impact')
+
+    def test_excel_writer_compression_level(self):
+        sf = StyleFrame({'a': ['{} value'.format(i) for i in range(1000)]})
+        sizes = []
+        for compression_level in (0, 9):
+            output = BytesIO()
+            sf.to_excel(StyleFrame.ExcelWriter(output, compression_level=compression_level)).close()
+            sizes.append(len(output.getvalue()))
+        self.assertGreater(sizes[0], sizes[1])
+
+        for compression_level in (-1, 10, 'a'):
+            with self.assertRaises(ValueError):
+                StyleFrame.ExcelWriter(BytesIO(), compression_level=compression_level)
+            with self.assertRaises(ValueError):
+                NativeExcelWriter(BytesIO(), compression_level=compression_level)
+
+    def test_to_excel_async(self):
+        self.apply_column_style(cols_to_style=['a'])
+        output = BytesIO()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            excel_writer = asyncio.run(self.sf.to_excel_async(output, executor=executor, best_fit=['a']))
+        self.assertIsInstance(excel_writer, pd.ExcelWriter)
+        sheet = load_workbook(output).active
+        self.assertEqual([[cell.value for cell in row] for row in sheet.iter_rows(max_row=2)],
+                         [['a', 'b', 'index'], ['col_a_row_1', 'col_b_row_1', 'col_c_row_1']])
+        self.assertEqual(sheet['A2'].font.name, 'Impact')
+
+        # an existing writer is not saved
+        excel_writer = asyncio.run(self.sf.to_excel_async(self.ew, sheet_name='Async'))
+        self.assertIs(excel_writer, self.ew)
+        self.assertIn('Async', self.ew.sheets)
+
+        async def read():
+            return await StyleFrame.read_excel_async(BytesIO(output.getvalue()), read_style=True)
+
+        sf_from_excel = asyncio.run(read())
+        self.assertEqual(sf_from_excel.loc[0, 'a'].value, 'col_a_row_1')
+        self.assertEqual(sf_from_excel.loc[0, 'a'].style.font, 'Impact')
+
+    def test_async_max_concurrency(self):
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def export():
+            with lock:
+                running.append(None)
+                max_running.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+        async def export_concurrently():
+            await asyncio.gather(*(StyleFrame._run_async(None, export) for _ in range(6)))
+
+        default_max_concurrency = StyleFrame.ASYNC_MAX_CONCURRENCY
+        try:
+            for max_concurrency, expected_max_running in ((1, 1), (2, 2)):
+                StyleFrame.ASYNC_MAX_CONCURRENCY = max_concurrency
+                max_running.clear()
+                asyncio.run(export_concurrently())
+                self.assertEqual(max(max_running), expected_max_running)
+
+            StyleFrame.ASYNC_MAX_CONCURRENCY = 0
+            with self.assertRaises(ValueError):
+                asyncio.run(export_concurrently())
+        finally:
+            StyleFrame.ASYNC_MAX_CONCURRENCY = default_max_concurrency
+
+    def test_to_excel_native(self):
+        self.apply_column_style(cols_to_style=['a'])
+        self.sf.set_row_height(rows=2, height=20)
+        with NativeExcelWriter(TEST_FILENAME) as excel_writer:
+            self.sf.to_excel(excel_writer, columns_and_rows_to_freeze='A2', row_to_add_filters=0,
+                             columns_to_hide='b', allow_protection=True)
+        native_sheet = load_workbook(TEST_FILENAME).active
+
+        self.assertEqual(native_sheet.freeze_panes, 'A2')
+        self.assertEqual(native_sheet.auto_filter.ref, 'A1:C1')
+        self.assertEqual(native_sheet.column_dimensions['A'].width, 10)
+        self.assertTrue(native_sheet.column_dimensions['B'].hidden)
+        self.assertEqual(native_sheet.row_dimensions[2].height, 20)
+        self.assertTrue(native_sheet.protection.sheet)
+        self.assertEqual([col.value for col in next(native_sheet.iter_rows(max_row=1))],
+                         [col.value for col in self.sf.columns])
+
+        for row_index, index in enumerate(self.sf.data_df.index, start=2):
+            for col_index, column in enumerate(self.sf.columns, start=1):
+                excel_cell = native_sheet.cell(row=row_index, column=col_index)
+                self.assertEqual(excel_cell.value, self.sf.at[index, column].value)
+                self.assertEqual(Styler.from_openpyxl_style(excel_cell, [], excel_cell.comment),
+                                 self.sf.at[index, column].style)
+
+    def test_to_excel_native_several_sheets(self):
+        self.sf.add_color_scale_conditional_formatting(start_type=utils.conditional_formatting_types.min,
+                                                       start_value=0, start_color=utils.colors.red,
+                                                       end_type=utils.conditional_formatting_types.max,
+                                                       end_value=0, end_color=utils.colors.green)
+        with NativeExcelWriter(TEST_FILENAME) as excel_writer:
+            self.sf.to_excel(excel_writer, sheet_name='first')
+            self.sf.to_excel(excel_writer, sheet_name='second', startrow=2, index=True)
+            with self.assertRaises(TypeError):
+                self.sf.to_excel(excel_writer, sheet_name='third', float_format='%.2f')
+
+        workbook = load_workbook(TEST_FILENAME)
+        self.assertEqual(workbook.sheetnames, ['first', 'second'])
+        self.assertEqual(workbook['second'].cell(row=4, column=2).value, self.sf.iloc[0, 0].value)
+        self.assertEqual([rule.type for conditional_formatting in workbook['first'].conditional_formatting
+                          for rule in conditional_formatting.rules], ['colorScale'])
+
+    def test_to_excel_many(self):
+        self.apply_column_style(cols_to_style=['a'])
+        other_sf = StyleFrame({'x': ['a', 'b']}, styler_obj=Styler(bg_color=utils.colors.green))
+        StyleFrame.to_excel_many({'first': self.sf, 'second': other_sf}, TEST_FILENAME, workers=2,
+                                 columns_and_rows_to_freeze='A2')
+        workbook = load_workbook(TEST_FILENAME)
+
+        self.assertEqual(workbook.sheetnames, ['first', 'second'])
+        first_sheet, second_sheet = workbook['first'], workbook['second']
+        self.assertEqual(first_sheet.freeze_panes, 'A2')
+        for row_index, index in enumerate(self.sf.data_df.index, start=2):
+            for col_index, column in enumerate(self.sf.columns, start=1):
+                excel_cell = first_sheet.cell(row=row_index, column=col_index)
+                self.assertEqual(excel_cell.value, self.sf.at[index, column].value)
+                self.assertEqual(Styler.from_openpyxl_style(excel_cell, [], excel_cell.comment),
+                                 self.sf.at[index, column].style)
+        self.assertEqual([cell.value for cell in second_sheet['A']], ['x', 'a', 'b'])
+        self.assertEqual(second_sheet['A2'].fill.fgColor.rgb, utils.colors.green)
+
+        with self.assertRaises(ValueError):
+            StyleFrame.to_excel_many({'first': self.sf}, TEST_FILENAME, workers=0)
+
+    def test_pickle(self):
+        self.apply_column_style(cols_to_style=['a'])
+        unpickled_sf = pickle.loads(pickle.dumps(self.sf))
+        self.assertEqual(unpickled_sf.at[0, 'a'].style, self.sf.at[0, 'a'].style)
+        self.assertEqual(list(unpickled_sf.columns), list(self.sf.columns))
+
+    def test_to_excel_streaming_requires_write_only_writer(self):
+        with self.assertRaises(ValueError):
+            self.sf.to_excel(self.ew, streaming=True)
+
+        with self.assertRaises(TypeError):
+            self.sf.to_excel(StyleFrame.ExcelWriter(TEST_FILENAME, engine_kwargs={'write_only': True}),
+                             streaming=True, float_format='%.2f')
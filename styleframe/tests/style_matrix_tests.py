@@ -0,0 +1,36 @@
+import unittest
+
+import numpy as np
+
+from styleframe import StyleFrame, Styler, utils
+from styleframe.style_matrix import StyleMatrix
+
+
+class StyleMatrixTest(unittest.TestCase):
+    def setUp(self):
+        self.sf = StyleFrame({'a': [1, 2, 3, 4], 'b': [5, 6, 7, 8]})
+
+    def test_from_data_df_shape_and_dtype(self):
+        style_matrix = StyleMatrix.from_data_df(self.sf.data_df)
+        self.assertEqual(style_matrix.ids.shape, self.sf.data_df.shape)
+        self.assertEqual(style_matrix.ids.dtype, np.int32)
+
+    def test_palette_is_deduplicated(self):
+        self.sf.apply_style_by_indexes(self.sf[self.sf['a'] > 2], styler_obj=Styler(bold=True))
+        style_matrix = StyleMatrix.from_data_df(self.sf.data_df)
+        self.assertEqual(len(style_matrix), 2)
+        self.assertEqual(style_matrix.ids[:, 0].tolist(), [0, 0, 1, 1])
+        self.assertEqual(style_matrix.ids[:, 1].tolist(), [0, 0, 1, 1])
+
+    def test_equal_styles_share_an_id(self):
+        self.sf.apply_column_style('a', Styler(bg_color=utils.colors.yellow))
+        self.sf.apply_column_style('b', Styler(bg_color=utils.colors.yellow))
+        style_matrix = StyleMatrix.from_data_df(self.sf.data_df)
+        self.assertEqual(len(style_matrix), 1)
+        self.assertEqual(style_matrix[3, 1], Styler(bg_color=utils.colors.yellow))
+
+    def test_non_container_cells_use_default_style(self):
+        self.sf.data_df.iloc[0, 0] = None
+        default_style = Styler(italic=True)
+        style_matrix = StyleMatrix.from_data_df(self.sf.data_df, default_style=default_style)
+        self.assertIs(style_matrix[0, 0], default_style)
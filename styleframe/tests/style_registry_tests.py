@@ -0,0 +1,119 @@
+import gc
+import io
+import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from openpyxl import Workbook, load_workbook
+
+from styleframe import StyleFrame, Styler, utils
+from styleframe.style_registry import StyleCache, StyleRegistry
+
+
+class StyleCacheTest(unittest.TestCase):
+    def test_unbounded_by_default(self):
+        cache = StyleCache()
+        for i in range(100):
+            cache[i] = i
+        self.assertEqual(len(cache), 100)
+
+    def test_lru_eviction(self):
+        cache = StyleCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+        cache['c'] = 3
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_shrinking_maxsize_evicts(self):
+        cache = StyleCache()
+        for i in range(10):
+            cache[i] = i
+        cache.maxsize = 3
+        self.assertEqual(len(cache), 3)
+        self.assertIn(9, cache)
+
+        with self.assertRaises(ValueError):
+            cache.maxsize = 0
+
+    def test_get_or_create_counts_hits_and_misses(self):
+        cache = StyleCache()
+        cache.get_or_create('a', lambda: 1)
+        cache.get_or_create('a', lambda: 2)
+        cache.get_or_create('b', lambda: 3)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_get_or_create_is_atomic(self):
+        cache = StyleCache()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values = list(executor.map(lambda _: cache.get_or_create('key', object), range(100)))
+        self.assertTrue(all(value is values[0] for value in values))
+
+
+class StyleRegistryTest(unittest.TestCase):
+    def test_for_workbook(self):
+        workbook = Workbook()
+        self.assertIs(StyleRegistry.for_workbook(workbook), StyleRegistry.for_workbook(workbook))
+        self.assertIsNot(StyleRegistry.for_workbook(workbook), StyleRegistry.for_workbook(Workbook()))
+
+    def test_registers_each_style_once(self):
+        workbook = Workbook()
+        registry = StyleRegistry.for_workbook(workbook)
+        num_of_named_styles = len(workbook._named_styles)
+        style_array = registry.register(Styler(bold=True))
+        self.assertIs(registry.register(Styler(bold=True)), style_array)
+        self.assertEqual(len(registry), 1)
+        self.assertEqual(len(workbook._named_styles), num_of_named_styles + 1)
+
+    def test_workbooks_do_not_share_named_styles(self):
+        first_workbook, second_workbook = Workbook(), Workbook()
+        StyleRegistry.for_workbook(first_workbook).register(Styler(bold=True))
+        StyleRegistry.for_workbook(second_workbook).register(Styler(bold=True))
+        name = Styler(bold=True).to_openpyxl_style().name
+        first_named_style = first_workbook._named_styles[first_workbook._named_styles.names.index(name)]
+        second_named_style = second_workbook._named_styles[second_workbook._named_styles.names.index(name)]
+        self.assertIsNot(first_named_style, second_named_style)
+
+    def test_does_not_keep_workbook_alive(self):
+        workbook = Workbook()
+        StyleRegistry.for_workbook(workbook).register(Styler(italic=True))
+        workbook_ref = weakref.ref(workbook)
+        del workbook
+        gc.collect()
+        self.assertIsNone(workbook_ref())
+        self.assertIsNone(getattr(Styler(italic=True).to_openpyxl_style(), '_wb', None))
+
+    def test_bounded_translation_cache(self):
+        maxsize = Styler.cache.maxsize
+        Styler.cache.maxsize = 2
+        try:
+            sf = StyleFrame({'a': [1, 2, 3]})
+            sf.apply_style_by_indexes(sf.index[0], Styler(bg_color=utils.colors.red))
+            sf.apply_style_by_indexes(sf.index[1], Styler(bg_color=utils.colors.green))
+            sf.apply_style_by_indexes(sf.index[2], Styler(bg_color=utils.colors.blue))
+            output = io.BytesIO()
+            sf.to_excel(StyleFrame.ExcelWriter(output)).close()
+            self.assertLessEqual(len(Styler.cache), 2)
+        finally:
+            Styler.cache.maxsize = maxsize
+
+        sheet = load_workbook(output).active
+        self.assertEqual([sheet.cell(row=row, column=1).fill.fgColor.rgb for row in (2, 3, 4)],
+                         [utils.colors.red, utils.colors.green, utils.colors.blue])
+
+    def test_export_to_several_workbooks(self):
+        sf = StyleFrame({'a': [1, 2]}, styler_obj=Styler(bg_color=utils.colors.yellow))
+        outputs = [io.BytesIO(), io.BytesIO()]
+        excel_writers = [StyleFrame.ExcelWriter(output) for output in outputs]
+        for excel_writer in excel_writers:
+            sf.to_excel(excel_writer)
+        # closing in reverse order, the first workbook must not be affected by styles registered in the second
+        for excel_writer in reversed(excel_writers):
+            excel_writer.close()
+
+        for output in outputs:
+            sheet = load_workbook(output).active
+            self.assertEqual(sheet['A2'].fill.fgColor.rgb, utils.colors.yellow)
+            self.assertTrue(sheet['A1'].font.b)
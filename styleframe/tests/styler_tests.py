@@ -1,6 +1,9 @@
+import copy
+import pickle
 import unittest
 
 from styleframe import Styler, utils
+from styleframe.styler import FrozenStyler
 
 
 class StylerTests(unittest.TestCase):
@@ -44,3 +47,47 @@ class StylerTests(unittest.TestCase):
             Styler(border_type=utils.borders.default_grid, bg_color=utils.colors.yellow,
                    fill_pattern_type=utils.fill_pattern_types.light_grid)
 
+    def test_evolve(self):
+        evolved = self.yellow_bold_underline.evolve(bold=False, bg_color='blue')
+        self.assertEqual(evolved, Styler(bg_color='blue', underline='single'))
+        self.assertTrue(self.yellow_bold_underline.bold)
+        self.assertEqual(self.yellow_bold_underline.bg_color, utils.colors.yellow)
+
+        default_grid = Styler(border_type=utils.borders.default_grid)
+        self.assertEqual(default_grid.evolve(bold=True), Styler(border_type=utils.borders.default_grid, bold=True))
+
+        bordered = Styler(border_type={utils.border_locations.top: utils.borders.thick})
+        evolved = bordered.evolve(bold=True)
+        evolved.border_type[utils.border_locations.bottom] = utils.borders.thick
+        self.assertEqual(bordered.border_type, {utils.border_locations.top: utils.borders.thick})
+
+    def test_intern(self):
+        interned = self.yellow_1.intern()
+        self.assertIsInstance(interned, FrozenStyler)
+        self.assertIs(interned, self.yellow_2.intern())
+        self.assertIs(interned, interned.intern())
+        self.assertEqual(interned, self.yellow_1)
+        self.assertEqual(self.yellow_1, interned)
+        self.assertEqual(hash(interned), hash(self.yellow_1))
+        self.assertIsNot(interned, self.blue.intern())
+
+    def test_interned_is_immutable(self):
+        interned = self.yellow_1.intern()
+        with self.assertRaises(AttributeError):
+            interned.bold = True
+        self.assertIs(copy.copy(interned), interned)
+        self.assertIs(copy.deepcopy(interned), interned)
+        self.assertIs(interned.evolve(bold=True), self.yellow_1.evolve(bold=True).intern())
+        self.assertIs(pickle.loads(pickle.dumps(interned)), interned)
+
+        interned = Styler(border_type={utils.border_locations.top: utils.borders.thick}).intern()
+        with self.assertRaises(TypeError):
+            interned.border_type[utils.border_locations.bottom] = utils.borders.thick
+        self.assertEqual(interned.border_type, {utils.border_locations.top: utils.borders.thick})
+        self.assertEqual(hash(interned), hash(Styler(border_type={utils.border_locations.top: utils.borders.thick})))
+        self.assertIs(pickle.loads(pickle.dumps(interned)), interned)
+        self.assertEqual(repr(interned), repr(Styler(border_type={utils.border_locations.top: utils.borders.thick})))
+        self.assertEqual(interned.evolve(bold=True),
+                         Styler(border_type={utils.border_locations.top: utils.borders.thick}, bold=True))
+        self.assertEqual(Styler.combine(interned, Styler(italic=True)),
+                         Styler(border_type={utils.border_locations.top: utils.borders.thick}, italic=True))
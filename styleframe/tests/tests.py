@@ -2,13 +2,17 @@ import unittest
 
 from styleframe.command_line.tests.commandline_tests import CommandlineInterfaceTest
 from styleframe.tests.container_tests import ContainerTest
+from styleframe.tests.instrumentation_tests import InstrumentationTest
 from styleframe.tests.series_tests import SeriesTest
 from styleframe.tests.style_frame_tests import StyleFrameTest
+from styleframe.tests.style_matrix_tests import StyleMatrixTest
+from styleframe.tests.style_registry_tests import StyleCacheTest, StyleRegistryTest
 from styleframe.tests.styler_tests import StylerTests
 
 
 def run():
-    test_classes = [ContainerTest, StyleFrameTest, CommandlineInterfaceTest, SeriesTest, StylerTests]
+    test_classes = [ContainerTest, StyleFrameTest, CommandlineInterfaceTest, SeriesTest, StylerTests, StyleMatrixTest,
+                    StyleCacheTest, StyleRegistryTest, InstrumentationTest]
     for test_class in test_classes:
         suite = unittest.TestLoader().loadTestsFromTestCase(test_class)
         unittest.TextTestRunner().run(suite)